@@ -17,6 +17,10 @@ Matches are scored via greedy 1-to-1 nearest-neighbor assignment. Fades and othe
 transitions are matched by point-in-interval membership, where the prediction inside an interval
 is considered a match. Other predictions in the same interval are considered false positives.
 
+Ground truth is sorted once per video so each prediction is matched with a binary search, and
+:func:`evaluate_batch` scores many configurations (e.g. every cell of a parameter sweep) against
+the same ground truth without re-indexing it.
+
 References:
 - Smeaton, Over & Doherty (2010), "Video shot boundary detection: Seven years of TRECVid activity",
   *Computer Vision and Image Understanding*.
@@ -29,12 +33,14 @@ References:
 from __future__ import annotations
 
 import math
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from statistics import mean
 from typing import TypeAlias
 
+import numpy as np
+
 # 1-based frame number, matching the convention used by the BBC/AutoShot text annotations and by
 # PySceneDetect's :class:`FrameTimecode`. Used for cut positions and for tolerance windows.
 #
@@ -224,6 +230,118 @@ class BenchmarkResult:
         }
 
 
+class _GroundTruthIndex:
+    """Ground truth of one video, sorted for scoring any number of predictions against it.
+
+    Building the index is O(G log G) in the number of ground-truth events; each prediction is
+    then located with a binary search instead of being compared to every event.
+    """
+
+    def __init__(self, ground_truth: GroundTruth):
+        hard_cuts = np.asarray(ground_truth.hard_cuts, dtype=np.int64)
+        # Positions in the original list are kept so ties are broken the same way regardless of
+        # the order the ground truth is in.
+        self.hard_order = np.argsort(hard_cuts, kind="stable")
+        self.hard_sorted = hard_cuts[self.hard_order]
+
+        intervals = list(ground_truth.fades)
+        self.num_fades = len(intervals)
+        # Equal intervals are a single event for matching (a prediction can only match the first),
+        # but each still counts towards `missed`.
+        unique = list(dict.fromkeys(intervals))
+        self.fade_starts = np.array([interval.start for interval in unique], dtype=np.int64)
+        self.fade_ends = np.array([interval.end for interval in unique], dtype=np.int64)
+        order = np.argsort(self.fade_starts, kind="stable")
+        self.fade_order = order
+        self.fade_sorted_starts = self.fade_starts[order]
+        self.fade_sorted_ends = self.fade_ends[order]
+        # When no intervals overlap, each prediction can fall in at most one, which can be found
+        # with a binary search on the start frames.
+        self.fades_disjoint = bool(
+            np.all(np.maximum.accumulate(self.fade_sorted_ends)[:-1] < self.fade_sorted_starts[1:])
+        )
+
+    def score(
+        self, predicted_cuts: Iterable[Frames], tolerance: Frames
+    ) -> tuple[EventMetrics, EventMetrics, list[Frames]]:
+        """Score one set of predictions, returning the fade and hard cut metrics and the hard
+        cut offsets. See :func:`score_video`."""
+        predicted = np.asarray(list(predicted_cuts), dtype=np.int64)
+        fade_metrics, fades = self.match_fades(predicted)
+        hard_metrics, offsets = self.match_hard_cuts(predicted[fades < 0], tolerance)
+        return fade_metrics, hard_metrics, offsets
+
+    def match_fades(self, predicted_cuts: np.ndarray) -> tuple[EventMetrics, np.ndarray]:
+        """Point-in-interval matching of fades, see :func:`_score_fade_transitions`. Returns the
+        metrics and the index of the interval each prediction fell in, or -1 if none."""
+        if not len(self.fade_starts) or not len(predicted_cuts):
+            fades = np.full(len(predicted_cuts), -1, dtype=np.int64)
+        elif self.fades_disjoint:
+            pos = np.searchsorted(self.fade_sorted_starts, predicted_cuts, side="right") - 1
+            clipped = np.maximum(pos, 0)
+            inside = (pos >= 0) & (predicted_cuts <= self.fade_sorted_ends[clipped])
+            fades = np.where(inside, self.fade_order[clipped], -1)
+        else:
+            # Overlapping intervals are matched to the first one in the ground truth that
+            # contains the prediction, so every interval has to be checked.
+            contains = (self.fade_starts <= predicted_cuts[:, None]) & (
+                predicted_cuts[:, None] <= self.fade_ends
+            )
+            fades = np.where(contains.any(axis=1), contains.argmax(axis=1), -1)
+        consumed = fades[fades >= 0]
+        matched = len(np.unique(consumed))
+        return (
+            EventMetrics(
+                matched=matched,
+                false_positives=len(consumed) - matched,
+                missed=self.num_fades - matched,
+            ),
+            fades,
+        )
+
+    def match_hard_cuts(
+        self, predicted_cuts: np.ndarray, tolerance: Frames
+    ) -> tuple[EventMetrics, list[Frames]]:
+        """Greedy matching of hard cuts, see :func:`_score_hard_cuts`."""
+        num_predicted, num_ground_truth = len(predicted_cuts), len(self.hard_sorted)
+        offsets: list[Frames] = []
+        if num_predicted and num_ground_truth and tolerance >= 0:
+            # Range of sorted ground truth within tolerance of each prediction.
+            lo = np.searchsorted(self.hard_sorted, predicted_cuts - tolerance, side="left")
+            hi = np.searchsorted(self.hard_sorted, predicted_cuts + tolerance, side="right")
+            counts = hi - lo
+            total = int(counts.sum())
+            if total:
+                # Expand the ranges into one (prediction, ground truth) candidate pair each.
+                i = np.repeat(np.arange(num_predicted), counts)
+                first = np.cumsum(counts) - counts
+                sorted_j = np.repeat(lo, counts) + (np.arange(total) - np.repeat(first, counts))
+                j = self.hard_order[sorted_j]
+                d = np.abs(predicted_cuts[i] - self.hard_sorted[sorted_j])
+                order = np.lexsort((j, i, d))
+                i, j, d = i[order], j[order], d[order]
+                if counts.max() == 1 and np.bincount(j).max() == 1:
+                    # No prediction or ground truth is in more than one pair, so all match.
+                    offsets = d.tolist()
+                else:
+                    prediction_used = [False] * num_predicted
+                    ground_truth_used = [False] * num_ground_truth
+                    for di, ii, ji in zip(d.tolist(), i.tolist(), j.tolist(), strict=True):
+                        if not prediction_used[ii] and not ground_truth_used[ji]:
+                            prediction_used[ii] = True
+                            ground_truth_used[ji] = True
+                            offsets.append(di)
+        matched = len(offsets)
+        return (
+            EventMetrics(
+                matched=matched,
+                false_positives=num_predicted - matched,
+                missed=num_ground_truth - matched,
+            ),
+            offsets,
+        )
+
+
 def _score_hard_cuts(
     predicted_cuts: Iterable[Frames],
     ground_truth_cuts: Iterable[Frames],
@@ -231,39 +349,17 @@ def _score_hard_cuts(
 ) -> tuple[EventMetrics, list[Frames]]:
     """Greedy 1-to-1 nearest-neighbor matching within ``tolerance`` frames.
 
-    Builds the set of all (prediction, ground-truth) candidate pairs whose absolute frame distance
-    is within tolerance, sorts by distance, and walks the sorted list claiming the first unused
-    pair each time. Ties on distance are broken by stable iteration order, which is deterministic
-    but otherwise unspecified - fine since we report aggregate metrics, not per-event assignments.
+    Candidate (prediction, ground-truth) pairs are those whose absolute frame distance is within
+    tolerance. They are found by binary search on the sorted ground truth, sorted by distance,
+    and walked claiming the first unused pair each time. Ties on distance are broken by the
+    position of the prediction, then of the ground truth, in the lists given. That is
+    deterministic but otherwise unspecified - fine since we report aggregate metrics, not
+    per-event assignments.
 
     Returns the event metrics and the per-match absolute offsets (for later averaging).
     """
-    predicted_cuts = list(predicted_cuts)
-    ground_truth_cuts = list(ground_truth_cuts)
-    candidates: list[tuple[int, int, int]] = []
-    for i, p in enumerate(predicted_cuts):
-        for j, g in enumerate(ground_truth_cuts):
-            d = abs(p - g)
-            if d <= tolerance:
-                candidates.append((d, i, j))
-    candidates.sort()
-    prediction_used = [False] * len(predicted_cuts)
-    ground_truth_used = [False] * len(ground_truth_cuts)
-    offsets: list[int] = []
-    for d, i, j in candidates:
-        if not prediction_used[i] and not ground_truth_used[j]:
-            prediction_used[i] = True
-            ground_truth_used[j] = True
-            offsets.append(d)
-    matched = len(offsets)
-    return (
-        EventMetrics(
-            matched=matched,
-            false_positives=len(predicted_cuts) - matched,
-            missed=len(ground_truth_cuts) - matched,
-        ),
-        offsets,
-    )
+    index = _GroundTruthIndex(GroundTruth(hard_cuts=list(ground_truth_cuts)))
+    return index.match_hard_cuts(np.asarray(list(predicted_cuts), dtype=np.int64), tolerance)
 
 
 def _score_fade_transitions(
@@ -281,27 +377,9 @@ def _score_fade_transitions(
     ``predicted_cuts``, not frame values) that were consumed by a fade interval, so the caller
     can skip them when running hard matching.
     """
-    predicted_cuts = list(predicted_cuts)
-    intervals = list(intervals)
-    consumed: set[int] = set()
-    intervals_matched: set[EventInterval] = set()
-    matched = 0
-    false_positives = 0
-    for k, p in enumerate(predicted_cuts):
-        for interval in intervals:
-            if interval.contains(p):
-                consumed.add(k)
-                if interval in intervals_matched:
-                    false_positives += 1
-                else:
-                    intervals_matched.add(interval)
-                    matched += 1
-                break
-    missed = len(intervals) - matched
-    return (
-        EventMetrics(matched=matched, false_positives=false_positives, missed=missed),
-        consumed,
-    )
+    index = _GroundTruthIndex(GroundTruth(hard_cuts=[], fades=list(intervals)))
+    metrics, fades = index.match_fades(np.asarray(list(predicted_cuts), dtype=np.int64))
+    return metrics, set(np.flatnonzero(fades >= 0).tolist())
 
 
 def score_video(
@@ -316,19 +394,32 @@ def score_video(
     consumed there and excluded from hard-cut matching. The remaining predictions are matched
     against ground-truth hard cuts at ``tolerance`` frames.
     """
-    predicted_cuts = list(predicted_cuts)
+    return score_video_batch([predicted_cuts], ground_truth, tolerance, [elapsed])[0]
 
-    fade_metrics, consumed = _score_fade_transitions(predicted_cuts, ground_truth.fades)
-    remaining_cuts = [p for k, p in enumerate(predicted_cuts) if k not in consumed]
-    hard_metrics, offsets = _score_hard_cuts(remaining_cuts, ground_truth.hard_cuts, tolerance)
 
-    return VideoMetrics(
-        elapsed=elapsed,
-        category=ground_truth.category,
-        hard_cuts=hard_metrics,
-        fades=fade_metrics,
-        hard_offset=(float(sum(offsets)), len(offsets)),
-    )
+def score_video_batch(
+    predicted_cuts: Sequence[Iterable[Frames]],
+    ground_truth: GroundTruth,
+    tolerance: Frames,
+    elapsed: Sequence[float],
+) -> list[VideoMetrics]:
+    """Score several sets of predictions for the same video (e.g. one per sweep cell) at one
+    tolerance. Equivalent to calling :func:`score_video` on each, but the ground truth is only
+    indexed once."""
+    index = _GroundTruthIndex(ground_truth)
+    results = []
+    for cuts, cell_elapsed in zip(predicted_cuts, elapsed, strict=True):
+        fade_metrics, hard_metrics, offsets = index.score(cuts, tolerance)
+        results.append(
+            VideoMetrics(
+                elapsed=cell_elapsed,
+                category=ground_truth.category,
+                hard_cuts=hard_metrics,
+                fades=fade_metrics,
+                hard_offset=(float(sum(offsets)), len(offsets)),
+            )
+        )
+    return results
 
 
 def evaluate(predictions: dict[Path, Prediction], tolerance: Frames) -> BenchmarkResult:
@@ -344,3 +435,24 @@ def evaluate(predictions: dict[Path, Prediction], tolerance: Frames) -> Benchmar
         for path, p in predictions.items()
     }
     return BenchmarkResult(per_video=videos, tolerance=tolerance)
+
+
+def evaluate_batch(
+    predictions_by_cell: Sequence[dict[Path, Prediction]], tolerance: Frames
+) -> list[BenchmarkResult]:
+    """Score the predictions of many configurations (e.g. sweep cells) on the same videos at a
+    single tolerance. Equivalent to calling :func:`evaluate` on each, but each video's ground
+    truth is only indexed once. The ground truth of each video is taken from the first cell."""
+    assert predictions_by_cell, "predictions_by_cell must not be empty"
+    per_video: list[dict[Path, VideoMetrics]] = [{} for _ in predictions_by_cell]
+    for path, prediction in predictions_by_cell[0].items():
+        cells = [predictions[path] for predictions in predictions_by_cell]
+        metrics = score_video_batch(
+            [cell.predicted_cuts for cell in cells],
+            prediction.ground_truth,
+            tolerance,
+            [cell.elapsed for cell in cells],
+        )
+        for videos, video_metrics in zip(per_video, metrics, strict=True):
+            videos[path] = video_metrics
+    return [BenchmarkResult(per_video=videos, tolerance=tolerance) for videos in per_video]
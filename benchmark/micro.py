@@ -0,0 +1,367 @@
+#
+#            PySceneDetect: Python-Based Video Scene Detector
+#   -------------------------------------------------------------------
+#     [  Site:    https://scenedetect.com                           ]
+#     [  Docs:    https://scenedetect.com/docs/                     ]
+#     [  Github:  https://github.com/Breakthrough/PySceneDetect/    ]
+#
+# Copyright (C) 2026 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""Micro-benchmarks for the hot paths of detection.
+
+Times the per-frame kernels of the detectors, flash filtering, timecode arithmetic, the stats
+manager and scene list generation in isolation, at the sizes they run at during detection
+(frames are 256x144, the size 1080p video is downscaled to by default). Downscaling itself is
+timed on 4K frames with each subsampling method. Each benchmark reports
+the best time per operation over several runs, to reduce noise from the rest of the system.
+
+Example::
+
+    python -m benchmark.micro --compare benchmark/micro_baseline.json
+
+``benchmark/micro_baseline.json`` is checked in, so the effect of an optimization can be seen by
+comparing against it. Times are only comparable on the same machine, so regenerate the baseline
+locally (``--out benchmark/micro_baseline.json`` on the commit before the change) first.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import platform
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+import cv2
+import numpy as np
+
+import scenedetect
+from benchmark._common import render_table, write_json
+from scenedetect import (
+    ContentDetector,
+    FrameTimecode,
+    HashDetector,
+    HistogramDetector,
+    Interpolation,
+    Subsampling,
+)
+from scenedetect.detector import FlashFilter
+from scenedetect.scene_manager import (
+    compute_downscale_factor,
+    downscale_frame,
+    get_scenes_from_cuts,
+)
+from scenedetect.stats_manager import StatsManager
+
+DEFAULT_BASELINE = "benchmark/micro_baseline.json"
+
+FRAME_SIZE = (256, 144)
+"""Size of the frames the detector kernels are timed on, as (width, height)."""
+SOURCE_FRAME_SIZE = (3840, 2160)
+"""Size of the frames downscaling is timed on, as (width, height)."""
+FRAME_RATE = 29.97
+NUM_FRAMES = 1000
+"""Number of frames in benchmarks which process a sequence of frames per operation."""
+NUM_CUTS = 1000
+"""Number of cuts to generate a scene list from."""
+
+MICRO_HEADER = ["Benchmark", "Per Op (us)", "Ops/sec"]
+COMPARE_HEADER = ["Benchmark", "Baseline (us)", "Current (us)", "Change"]
+
+Benchmark = Callable[[], Callable[[], Any]]
+"""Sets up a benchmark, returning the operation to time."""
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """Register a benchmark under `name`."""
+
+    def register(setup: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _frames(count: int = 2, size: tuple[int, int] = FRAME_SIZE) -> list[np.ndarray]:
+    """Generate `count` different frames of `size` which look roughly like real video: a
+    smooth gradient with some noise."""
+    rng = np.random.default_rng(0)
+    width, height = size
+    gradient = np.add.outer(np.arange(height), np.arange(width)).astype(np.float32)
+    frames = []
+    for i in range(count):
+        channels = [(gradient * (0.3 + 0.2 * c) + 40 * i) % 256 for c in range(3)]
+        noise = rng.normal(0, 8, (height, width, 3))
+        frames.append(np.clip(np.dstack(channels) + noise, 0, 255).astype(np.uint8))
+    return frames
+
+
+@benchmark("content.calculate_frame_score")
+def _content_frame_score():
+    detector = ContentDetector()
+    frames = _frames()
+    timecode = FrameTimecode(0, FRAME_RATE)
+    detector._calculate_frame_score(timecode, frames[1])
+    state = {"i": 0}
+
+    def run():
+        state["i"] ^= 1
+        return detector._calculate_frame_score(timecode, frames[state["i"]])
+
+    return run
+
+
+@benchmark("content.calculate_frame_score[edges]")
+def _content_frame_score_edges():
+    detector = ContentDetector(weights=ContentDetector.Components(1.0, 1.0, 1.0, 1.0))
+    frames = _frames()
+    timecode = FrameTimecode(0, FRAME_RATE)
+    detector._calculate_frame_score(timecode, frames[1])
+    state = {"i": 0}
+
+    def run():
+        state["i"] ^= 1
+        return detector._calculate_frame_score(timecode, frames[state["i"]])
+
+    return run
+
+
+@benchmark("histogram.calculate_histogram")
+def _calculate_histogram():
+    frame = _frames(1)[0]
+    return lambda: HistogramDetector.calculate_histogram(frame, bins=256)
+
+
+@benchmark("hash.hash_frame")
+def _hash_frame():
+    frame = _frames(1)[0]
+    return lambda: HashDetector.hash_frame(frame, hash_size=16, factor=2)
+
+
+def _downscale(subsampling: Subsampling, interpolation: Interpolation) -> Benchmark:
+    def setup():
+        frame = _frames(1, SOURCE_FRAME_SIZE)[0]
+        factor = compute_downscale_factor(max(SOURCE_FRAME_SIZE))
+        return lambda: downscale_frame(frame, factor, subsampling, interpolation)
+
+    return setup
+
+
+for _subsampling, _interpolation in (
+    (Subsampling.RESIZE, Interpolation.LINEAR),
+    (Subsampling.RESIZE, Interpolation.AREA),
+    (Subsampling.STRIDE, Interpolation.LINEAR),
+    (Subsampling.POOL, Interpolation.LINEAR),
+    (Subsampling.ROI, Interpolation.LINEAR),
+):
+    _name = _subsampling.value
+    if _subsampling == Subsampling.RESIZE:
+        _name += f", {_interpolation.name.lower()}"
+    benchmark(f"downscale_frame[{_name}]")(_downscale(_subsampling, _interpolation))
+
+
+@benchmark(f"flash_filter.filter[merge, {NUM_FRAMES} frames]")
+def _flash_filter_merge():
+    timecodes = [FrameTimecode(i, FRAME_RATE) for i in range(NUM_FRAMES)]
+    # A frame above the threshold every 10 frames, so cuts are both merged and emitted.
+    above = [i % 10 == 0 for i in range(NUM_FRAMES)]
+
+    def run():
+        flash_filter = FlashFilter(FlashFilter.Mode.MERGE, 15)
+        for timecode, is_above in zip(timecodes, above, strict=True):
+            flash_filter.filter(timecode, is_above)
+
+    return run
+
+
+@benchmark(f"flash_filter.filter[suppress, {NUM_FRAMES} frames]")
+def _flash_filter_suppress():
+    timecodes = [FrameTimecode(i, FRAME_RATE) for i in range(NUM_FRAMES)]
+    above = [i % 10 == 0 for i in range(NUM_FRAMES)]
+
+    def run():
+        flash_filter = FlashFilter(FlashFilter.Mode.SUPPRESS, 0.5)
+        for timecode, is_above in zip(timecodes, above, strict=True):
+            flash_filter.filter(timecode, is_above)
+
+    return run
+
+
+@benchmark("timecode.add")
+def _timecode_add():
+    timecode = FrameTimecode(1000, FRAME_RATE)
+    return lambda: timecode + 1
+
+
+@benchmark("timecode.sub")
+def _timecode_sub():
+    timecode = FrameTimecode(1000, FRAME_RATE)
+    other = FrameTimecode(500, FRAME_RATE)
+    return lambda: timecode - other
+
+
+@benchmark("timecode.compare")
+def _timecode_compare():
+    timecode = FrameTimecode(1000, FRAME_RATE)
+    other = FrameTimecode(500, FRAME_RATE)
+    return lambda: (timecode < other, timecode == other, timecode >= other)
+
+
+@benchmark(f"stats_manager.set_metrics[{NUM_FRAMES} frames]")
+def _stats_set_metrics():
+    timecodes = [FrameTimecode(i, FRAME_RATE) for i in range(NUM_FRAMES)]
+    metrics = {"content_val": 1.0, "delta_hue": 2.0, "delta_sat": 3.0, "delta_lum": 4.0}
+
+    def run():
+        stats = StatsManager()
+        for timecode in timecodes:
+            stats.set_metrics(timecode, metrics)
+
+    return run
+
+
+@benchmark(f"stats_manager.save_to_csv[{NUM_FRAMES} frames]")
+def _stats_save_to_csv():
+    stats = StatsManager()
+    metrics = {"content_val": 1.0, "delta_hue": 2.0, "delta_sat": 3.0, "delta_lum": 4.0}
+    for i in range(NUM_FRAMES):
+        stats.set_metrics(FrameTimecode(i, FRAME_RATE), metrics)
+    return lambda: stats.save_to_csv(io.StringIO())
+
+
+@benchmark(f"get_scenes_from_cuts[{NUM_CUTS} cuts]")
+def _get_scenes_from_cuts():
+    cuts = [FrameTimecode(30 * (i + 1), FRAME_RATE) for i in range(NUM_CUTS)]
+    start = FrameTimecode(0, FRAME_RATE)
+    end = FrameTimecode(30 * (NUM_CUTS + 1), FRAME_RATE)
+    return lambda: get_scenes_from_cuts(cuts, start, end)
+
+
+def run_benchmarks(
+    names: list[str], repeat: int = 5, min_time: float = 0.2
+) -> dict[str, dict[str, float]]:
+    """Time each benchmark, returning the best time per operation in seconds.
+
+    Arguments:
+        names: Benchmarks to run.
+        repeat: Number of runs of each benchmark to take the best of.
+        min_time: Minimum time in seconds of each run. The number of operations per run is
+            chosen to take at least this long.
+    """
+    results = {}
+    for name in names:
+        operation = BENCHMARKS[name]()
+        timer = timeit.Timer(operation)
+        number = 1
+        while True:
+            elapsed = timer.timeit(number)
+            if elapsed >= min_time:
+                break
+            number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+        results[name] = {"per_op": best, "number": number}
+    return results
+
+
+def compare_results(
+    baseline: dict[str, dict[str, float]], current: dict[str, dict[str, float]]
+) -> list[list[str]]:
+    """Table rows comparing the time per operation of each benchmark in both results."""
+    rows = []
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["per_op"], result["per_op"]
+        change = 100.0 * (after / before - 1.0) if before > 0 else 0.0
+        rows.append([name, f"{before * 1e6:.3f}", f"{after * 1e6:.3f}", f"{change:+.1f}%"])
+    return rows
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for PySceneDetect.")
+    parser.add_argument(
+        "--filter",
+        type=str,
+        default=None,
+        help="Only run benchmarks whose name contains this string.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of runs of each benchmark, keeping the fastest (default: 5).",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="Minimum length of each run in seconds (default: 0.2).",
+    )
+    parser.add_argument(
+        "--out",
+        type=str,
+        default=None,
+        help=f"Path to write a JSON results file, e.g. {DEFAULT_BASELINE} to update the baseline.",
+    )
+    parser.add_argument(
+        "--compare",
+        type=str,
+        default=None,
+        metavar="BASELINE",
+        help=f"JSON results file from a previous run to compare against, e.g. {DEFAULT_BASELINE}.",
+    )
+    return parser
+
+
+def main() -> None:
+    args = create_parser().parse_args()
+    names = [name for name in BENCHMARKS if not args.filter or args.filter in name]
+    if not names:
+        raise SystemExit(f"No benchmarks match {args.filter!r}.")
+    if args.repeat < 1:
+        raise SystemExit("--repeat must be at least 1.")
+    # Baselines are generated single threaded, so results don't depend on the number of cores.
+    cv2.setNumThreads(1)
+
+    results = run_benchmarks(names, repeat=args.repeat, min_time=args.min_time)
+    print("\n## Micro-benchmarks\n")
+    print(
+        render_table(
+            MICRO_HEADER,
+            [
+                [name, f"{result['per_op'] * 1e6:.3f}", f"{1.0 / result['per_op']:.0f}"]
+                for name, result in results.items()
+            ],
+        )
+    )
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        print(f"\n## Compared to {args.compare}\n")
+        rows = compare_results(baseline, results)
+        print(render_table(COMPARE_HEADER, rows) if rows else "No benchmarks in common.")
+    if args.out:
+        write_json(
+            args.out,
+            {
+                "environment": {
+                    "scenedetect": scenedetect.__version__,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "processor": platform.processor() or platform.machine(),
+                    "opencv": cv2.__version__,
+                    "numpy": np.__version__,
+                },
+                "results": results,
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
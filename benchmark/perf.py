@@ -0,0 +1,445 @@
+#
+#            PySceneDetect: Python-Based Video Scene Detector
+#   -------------------------------------------------------------------
+#     [  Site:    https://scenedetect.com                           ]
+#     [  Docs:    https://scenedetect.com/docs/                     ]
+#     [  Github:  https://github.com/Breakthrough/PySceneDetect/    ]
+#
+# Copyright (C) 2026 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""Throughput benchmark for detectors and backends.
+
+Measures decode fps, detect fps and peak RSS for every combination of detector x backend x
+resolution x downscale factor, on synthetic videos generated on first use (see
+``tests/release/synthetic.py``), so no dataset is required. Each measurement runs in a fresh
+process so peak RSS is per cell rather than the high-water mark of the whole run.
+
+Example::
+
+    python -m benchmark.perf \\
+      --detector detect-content,detect-hash --backend opencv,pyav \\
+      --resolution 640x360,1920x1080 --downscale auto,1 \\
+      --out perf.json
+
+Pass ``--compare`` a previous ``--out`` file to show the change in detect fps of each cell and
+exit with an error if any cell is slower by more than ``--max-regression`` percent.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.metadata
+import json
+import multiprocessing
+import platform
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import cv2
+
+import scenedetect
+from benchmark._common import DEFAULT_BACKEND, DETECTORS, render_table, write_json
+from scenedetect import AVAILABLE_BACKENDS, DetectionProfile, SceneManager, open_video
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+DEFAULT_RESOLUTIONS = "640x360,1280x720,1920x1080"
+DEFAULT_VIDEO_DIR = "benchmark/synthetic"
+AUTO_DOWNSCALE = "auto"
+
+PERF_HEADER = [
+    "Detector",
+    "Backend",
+    "Resolution",
+    "Downscale",
+    "Decode FPS",
+    "Detect FPS",
+    "Peak RSS (MB)",
+    "Bottleneck",
+]
+COMPARE_HEADER = ["Detector", "Backend", "Resolution", "Downscale", "Baseline", "Current", "Change"]
+
+
+# --------------------------------------------------------------------- #
+# Synthetic videos
+# --------------------------------------------------------------------- #
+
+
+def parse_resolution(spec: str) -> tuple[int, int]:
+    """Parse ``"1280x720"`` into ``(1280, 720)``."""
+    width, sep, height = spec.strip().lower().partition("x")
+    if not sep or not width.isdigit() or not height.isdigit():
+        raise ValueError(f"Resolution must be WIDTHxHEIGHT, got {spec!r}")
+    return int(width), int(height)
+
+
+def parse_downscale(spec: str) -> int | str:
+    """Parse a downscale factor, which is either a positive integer or ``"auto"``."""
+    spec = spec.strip().lower()
+    if spec == AUTO_DOWNSCALE:
+        return AUTO_DOWNSCALE
+    if not spec.isdigit() or int(spec) < 1:
+        raise ValueError(f"Downscale must be a positive integer or 'auto', got {spec!r}")
+    return int(spec)
+
+
+def ensure_video(
+    video_dir: Path, resolution: tuple[int, int], duration: float, rate: float
+) -> Path:
+    """Get the path of the synthetic video with the given parameters, generating it if it doesn't
+    exist yet. Uses ffmpeg if available, otherwise OpenCV."""
+    width, height = resolution
+    path = video_dir / f"perf-{width}x{height}-{duration:g}s-{rate:g}fps.mp4"
+    if path.exists():
+        return path
+    video_dir.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so an interrupted run doesn't leave a truncated video.
+    partial = path.with_name(f"partial-{path.name}")
+    print(f"Generating {path}...")
+    if shutil.which("ffmpeg"):
+        from tests.release.synthetic import generate_perf_video
+
+        generate_perf_video(str(partial), width, height, duration, rate)
+    else:
+        from tests.release.synthetic import generate_gradient_video
+
+        generate_gradient_video(str(partial), width, height, duration, rate)
+    partial.replace(path)
+    return path
+
+
+# --------------------------------------------------------------------- #
+# Measurements (each run in a fresh process)
+# --------------------------------------------------------------------- #
+
+
+def _peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB, if it can be determined."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def measure_decode(video_path: str, backend: str, repeat: int) -> dict[str, Any]:
+    """Decode every frame of the video without detection, keeping the fastest of `repeat`
+    runs."""
+    best = None
+    num_frames = 0
+    for _ in range(repeat):
+        video = open_video(video_path, backend=backend)
+        num_frames = 0
+        start = time.perf_counter()
+        while video.read() is not False:
+            num_frames += 1
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    assert best is not None
+    return {"frames": num_frames, "decode_fps": num_frames / best if best > 0 else 0.0}
+
+
+def measure_detect(
+    video_path: str, backend: str, detector: str, downscale: int | str, repeat: int
+) -> dict[str, Any]:
+    """Run detection over the whole video, keeping the fastest of `repeat` runs."""
+    best = None
+    for _ in range(repeat):
+        video = open_video(video_path, backend=backend)
+        scene_manager = SceneManager(profile=DetectionProfile())
+        if downscale == AUTO_DOWNSCALE:
+            scene_manager.auto_downscale = True
+        else:
+            scene_manager.auto_downscale = False
+            scene_manager.downscale = downscale
+        scene_manager.add_detector(DETECTORS[detector]())
+        start = time.perf_counter()
+        num_frames = scene_manager.detect_scenes(video)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best[0]:
+            best = (elapsed, num_frames, scene_manager)
+    assert best is not None
+    elapsed, num_frames, scene_manager = best
+    assert scene_manager.profile is not None
+    return {
+        "frames": num_frames,
+        "detect_fps": num_frames / elapsed if elapsed > 0 else 0.0,
+        "num_cuts": len(scene_manager.get_cut_list(show_warning=False)),
+        "bottleneck": scene_manager.profile.bottleneck,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _run_isolated(func, *args) -> dict[str, Any]:
+    """Call `func` in a new process, so that it starts from a clean heap."""
+    with multiprocessing.get_context("spawn").Pool(1, maxtasksperchild=1) as pool:
+        return pool.apply(func, args)
+
+
+def run_benchmark(
+    detectors: list[str],
+    backends: list[str],
+    resolutions: list[tuple[int, int]],
+    downscales: list[int | str],
+    video_dir: Path,
+    duration: float,
+    rate: float,
+    repeat: int,
+) -> list[dict[str, Any]]:
+    """Measure every combination of parameters, returning one result per cell."""
+    results = []
+    for resolution in resolutions:
+        video_path = str(ensure_video(video_dir, resolution, duration, rate))
+        for backend in backends:
+            decode = _run_isolated(measure_decode, video_path, backend, repeat)
+            for detector in detectors:
+                for downscale in downscales:
+                    cell = {
+                        "detector": detector,
+                        "backend": backend,
+                        "resolution": "{}x{}".format(*resolution),
+                        "downscale": downscale,
+                    }
+                    print(
+                        "Measuring {detector} / {backend} / {resolution} / {downscale}".format(
+                            **cell
+                        )
+                    )
+                    detect = _run_isolated(
+                        measure_detect, video_path, backend, detector, downscale, repeat
+                    )
+                    results.append({**cell, "decode_fps": decode["decode_fps"], **detect})
+    return results
+
+
+# --------------------------------------------------------------------- #
+# Reporting
+# --------------------------------------------------------------------- #
+
+
+def _cell_key(result: dict[str, Any]) -> tuple[str, str, str, str]:
+    return (result["detector"], result["backend"], result["resolution"], str(result["downscale"]))
+
+
+def _perf_row(result: dict[str, Any]) -> list[str]:
+    peak_rss = result["peak_rss_mb"]
+    return [
+        *_cell_key(result),
+        f"{result['decode_fps']:.1f}",
+        f"{result['detect_fps']:.1f}",
+        "n/a" if peak_rss is None else f"{peak_rss:.1f}",
+        str(result["bottleneck"]),
+    ]
+
+
+def compare_results(
+    baseline: list[dict[str, Any]], current: list[dict[str, Any]], max_regression: float
+) -> tuple[list[list[str]], list[tuple[str, str, str, str]]]:
+    """Compare the detect fps of each cell in `current` with the same cell in `baseline`.
+
+    Returns:
+        Table rows for the cells in both, and the keys of the cells which are more than
+        `max_regression` percent slower than the baseline.
+    """
+    baseline_fps = {_cell_key(result): result["detect_fps"] for result in baseline}
+    rows = []
+    regressions = []
+    for result in current:
+        key = _cell_key(result)
+        if key not in baseline_fps or baseline_fps[key] <= 0:
+            continue
+        change = 100.0 * (result["detect_fps"] / baseline_fps[key] - 1.0)
+        if change < -max_regression:
+            regressions.append(key)
+        rows.append(
+            [*key, f"{baseline_fps[key]:.1f}", f"{result['detect_fps']:.1f}", f"{change:+.1f}%"]
+        )
+    return rows, regressions
+
+
+def _package_version(name: str) -> str | None:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _environment() -> dict[str, Any]:
+    """Describe the system and versions the benchmark ran with, for comparing results."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "scenedetect": scenedetect.__version__,
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "opencv": cv2.__version__,
+        "av": _package_version("av"),
+    }
+
+
+# --------------------------------------------------------------------- #
+# Entry point
+# --------------------------------------------------------------------- #
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmarking PySceneDetect throughput.")
+    parser.add_argument(
+        "--detector",
+        type=str,
+        default=",".join(DETECTORS.keys()),
+        help=f"Comma-separated detector names (default: all). One of: {', '.join(DETECTORS)}.",
+    )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        default=DEFAULT_BACKEND,
+        help=(
+            f"Comma-separated video decoding backends (default: {DEFAULT_BACKEND}). "
+            f"Available: {', '.join(sorted(AVAILABLE_BACKENDS))}."
+        ),
+    )
+    parser.add_argument(
+        "--resolution",
+        type=str,
+        default=DEFAULT_RESOLUTIONS,
+        help=f"Comma-separated WIDTHxHEIGHT resolutions (default: {DEFAULT_RESOLUTIONS}).",
+    )
+    parser.add_argument(
+        "--downscale",
+        type=str,
+        default=f"{AUTO_DOWNSCALE},1",
+        help="Comma-separated downscale factors, integers or 'auto' (default: auto,1).",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=10.0,
+        help="Length of the synthetic videos in seconds (default: 10).",
+    )
+    parser.add_argument(
+        "--frame-rate",
+        type=float,
+        default=30.0,
+        help="Frame rate of the synthetic videos (default: 30).",
+    )
+    parser.add_argument(
+        "--video-dir",
+        type=str,
+        default=DEFAULT_VIDEO_DIR,
+        help=(
+            f"Directory the synthetic videos are generated in and reused from (default: "
+            f"{DEFAULT_VIDEO_DIR})."
+        ),
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Number of times to run each measurement, keeping the fastest (default: 1).",
+    )
+    parser.add_argument(
+        "--out",
+        type=str,
+        default=None,
+        help="Path to write a machine-readable JSON results file.",
+    )
+    parser.add_argument(
+        "--compare",
+        type=str,
+        default=None,
+        metavar="BASELINE",
+        help="JSON results file from a previous run (--out) to compare detect fps against.",
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=10.0,
+        metavar="PERCENT",
+        help=(
+            "With --compare, exit with an error if any cell's detect fps is more than "
+            "PERCENT slower than the baseline (default: 10)."
+        ),
+    )
+    return parser
+
+
+def main() -> None:
+    args = create_parser().parse_args()
+    detectors = [name.strip() for name in args.detector.split(",") if name.strip()]
+    backends = [name.strip() for name in args.backend.split(",") if name.strip()]
+    for name in detectors:
+        if name not in DETECTORS:
+            raise SystemExit(f"Unknown detector {name!r}. One of: {', '.join(DETECTORS)}.")
+    for name in backends:
+        if name not in AVAILABLE_BACKENDS:
+            raise SystemExit(
+                f"Backend {name!r} is not available. One of: {', '.join(AVAILABLE_BACKENDS)}."
+            )
+    if args.repeat < 1:
+        raise SystemExit("--repeat must be at least 1.")
+    try:
+        resolutions = [parse_resolution(spec) for spec in args.resolution.split(",")]
+        downscales = [parse_downscale(spec) for spec in args.downscale.split(",")]
+    except ValueError as ex:
+        raise SystemExit(str(ex)) from ex
+
+    results = run_benchmark(
+        detectors,
+        backends,
+        resolutions,
+        downscales,
+        Path(args.video_dir),
+        args.duration,
+        args.frame_rate,
+        args.repeat,
+    )
+    print("\n## Throughput\n")
+    print(render_table(PERF_HEADER, [_perf_row(result) for result in results]))
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        rows, regressions = compare_results(baseline, results, args.max_regression)
+        print(f"\n## Detect FPS compared to {args.compare}\n")
+        if rows:
+            print(render_table(COMPARE_HEADER, rows))
+        else:
+            print("No cells in common with the baseline.")
+
+    if args.out:
+        write_json(
+            args.out,
+            {
+                "environment": _environment(),
+                "duration": args.duration,
+                "frame_rate": args.frame_rate,
+                "repeat": args.repeat,
+                "results": results,
+            },
+        )
+    if regressions:
+        raise SystemExit(
+            f"{len(regressions)} cells are more than {args.max_regression:g}% slower than "
+            f"the baseline."
+        )
+
+
+if __name__ == "__main__":
+    main()
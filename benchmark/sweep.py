@@ -14,7 +14,8 @@
 Brute-force grid search over a Cartesian product of detector parameters. The cost of
 the grid is amortized using :class:`FanOutVideoStream`. One video decode per chunk of
 ``--workers`` cells, so a 100-cell grid on a 500-video corpus costs roughly
-``500 * ceil(100 / workers)`` decodes, not ``500 * 100``.
+``500 * ceil(100 / workers)`` decodes, not ``500 * 100``. Frames are also downscaled once
+per decode on the fan-out reader thread rather than once per detector.
 
 Use ``--params "key=v1,v2,v3"`` for enumerated values and ``"key=a:b:s"`` for a numeric
 ``[a, b]`` range with step ``s`` (inclusive of ``b`` when the step lands there).
@@ -31,6 +32,13 @@ Example::
 strings like ``"0.1s"`` or ``"00:00:00.500"`` also work. Prefer floats so the same
 sweep is meaningful across datasets with different framerates.
 
+Videos (and chunks of cells within a video) are independent units of work, which can be spread
+across ``--processes`` worker processes so detectors aren't limited by the GIL of one process.
+
+With ``--out``, the cuts found for each completed unit are checkpointed to the output file as
+the sweep runs. Running the same sweep again with the same ``--out`` resumes from the
+checkpoint, skipping any units that were already completed.
+
 Reports the top-10 cells by F1 at each tolerance plus the Pareto front across the two
 tolerances. The full grid lives in the JSON output for offline plotting.
 """
@@ -39,8 +47,13 @@ from __future__ import annotations
 
 import argparse
 import itertools
+import json
+import multiprocessing
+import os
 import threading
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
@@ -51,12 +64,12 @@ from benchmark._common import (
     DETECTORS,
     parse_tolerances,
     render_table,
-    write_json,
 )
 from benchmark.dataset import DATASETS, Dataset, resolve_dataset
-from benchmark.evaluator import BenchmarkResult, Prediction, evaluate
+from benchmark.evaluator import BenchmarkResult, Prediction, evaluate_batch
+from benchmark.frame_cache import FrameCache
 from scenedetect import AVAILABLE_BACKENDS, SceneManager, open_video
-from scenedetect._fan_out import FanOutVideoStream
+from scenedetect._fan_out import FanOutVideoStream, PreprocessSpec
 
 # --------------------------------------------------------------------- #
 # Spec language: "key=v1,v2,v3" or "key=a:b:s"; clauses joined by ";".
@@ -144,15 +157,24 @@ def _run_chunk(
     backend: str,
     detector_cls: type,
     chunk: list[dict[str, Any]],
+    frame_cache: FrameCache | None = None,
 ) -> list[tuple[list[int], float]]:
     """Drive one decode of ``source_path`` and fan out to ``len(chunk)`` parallel detectors.
+    If ``frame_cache`` is set, frames are read from the cache instead of decoding the video.
 
     Returns one ``(cuts, elapsed)`` pair per chunk entry. ``elapsed`` is wall-clock per
     worker thread and is bound by the slowest detector in the chunk, so it is only a
     rough indicator of relative cost.
     """
-    source = open_video(source_path, backend=backend)
-    fan = FanOutVideoStream(source, n=len(chunk))
+    if frame_cache is not None:
+        # Cached frames are already downscaled.
+        source = frame_cache.open(source_path, backend)
+        preprocess = None
+    else:
+        source = open_video(source_path, backend=backend)
+        # Every cell uses the default (auto) downscale, so resize once for the whole chunk.
+        preprocess = PreprocessSpec.for_frame_size(source.frame_size)
+    fan = FanOutVideoStream(source, n=len(chunk), preprocess=preprocess)
     fan.start()
     results: list[tuple[list[int], float]] = [([], 0.0) for _ in chunk]
     errors: list[BaseException | None] = [None] * len(chunk)
@@ -162,6 +184,7 @@ def _run_chunk(
             stream = fan.stream(i)
             detector = detector_cls(**params)
             sm = SceneManager()
+            sm.auto_downscale = False
             sm.add_detector(detector)
             t0 = time.time()
             sm.detect_scenes(video=stream)
@@ -191,31 +214,196 @@ def _chunked(items: list, size: int) -> list[list]:
     return [items[i : i + size] for i in range(0, len(items), size)]
 
 
+def _run_unit(
+    source_path: Path,
+    backend: str,
+    detector_name: str,
+    chunk: list[dict[str, Any]],
+    frame_cache: FrameCache | None = None,
+) -> list[tuple[list[int], float]]:
+    """Entry point of a unit of work in a worker process. Takes the detector by name since
+    it is sent to the worker."""
+    return _run_chunk(source_path, backend, DETECTORS[detector_name], chunk, frame_cache)
+
+
+def _run_all(
+    executor: ProcessPoolExecutor | None, fn: Callable, tasks: list[tuple]
+) -> Iterator[tuple[int, Any]]:
+    """Run ``fn`` on the arguments of each task, in ``executor`` if set, yielding the index of
+    each task with its result as they complete."""
+    if executor is None:
+        for i, task in enumerate(tasks):
+            yield i, fn(*task)
+        return
+    futures = {executor.submit(fn, *task): i for i, task in enumerate(tasks)}
+    try:
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    except BaseException:
+        # Don't wait for the rest of the sweep to finish if one task fails.
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+
+
+CellResults = dict[int, tuple[list[int], float]]
+"""``(cuts, elapsed)`` of each cell that has been run on a video, by index in the grid."""
+
+
 def run_sweep(
     dataset: Dataset,
     detector_name: str,
     backend: str,
     grid: list[dict[str, Any]],
     workers: int,
+    processes: int = 1,
+    completed: dict[Path, CellResults] | None = None,
+    on_unit_done: Callable[[Path, CellResults], None] | None = None,
+    frame_cache: FrameCache | None = None,
 ) -> list[dict[Path, Prediction]]:
     """For each cell in ``grid``, return a ``{video_path: Prediction}`` mapping suitable
-    for :func:`benchmark.evaluator.evaluate`. Cells are evaluated in chunks of
-    ``workers`` parallel detectors per video decode."""
-    detector_cls = DETECTORS[detector_name]
-    # predictions_by_cell[cell_index][video_path] = Prediction
-    predictions_by_cell: list[dict[Path, Prediction]] = [{} for _ in grid]
-    pbar = tqdm(dataset, desc=f"sweep[{detector_name}]")
-    for sample in pbar:
-        for chunk_indices in _chunked(list(range(len(grid))), workers):
-            chunk = [grid[i] for i in chunk_indices]
-            outputs = _run_chunk(sample.video_file, backend, detector_cls, chunk)
-            for cell_i, (cuts, elapsed) in zip(chunk_indices, outputs, strict=True):
-                predictions_by_cell[cell_i][sample.video_file] = Prediction(
-                    predicted_cuts=cuts,
-                    ground_truth=sample.ground_truth,
-                    elapsed=elapsed,
-                )
-    return predictions_by_cell
+    for :func:`benchmark.evaluator.evaluate_batch`. Cells are evaluated in chunks of
+    ``workers`` parallel detectors per video decode, and up to ``processes`` chunks are
+    evaluated at once in separate processes.
+
+    Cells in ``completed`` (e.g. loaded from a checkpoint) are not run again.
+    ``on_unit_done`` is called with the results of each chunk as soon as it finishes.
+    If ``frame_cache`` is set, each video is decoded into the cache (if it isn't already)
+    before any of its cells are run, and frames are read from the cache.
+    """
+    results: dict[Path, CellResults] = {
+        sample.video_file: dict((completed or {}).get(sample.video_file, {})) for sample in dataset
+    }
+    units = [
+        (sample.video_file, chunk_indices)
+        for sample in dataset
+        for chunk_indices in _chunked(
+            [i for i in range(len(grid)) if i not in results[sample.video_file]], workers
+        )
+    ]
+
+    def unit_done(video_file: Path, chunk_indices: list[int], outputs) -> None:
+        unit_results = dict(zip(chunk_indices, outputs, strict=True))
+        results[video_file].update(unit_results)
+        if on_unit_done is not None:
+            on_unit_done(video_file, unit_results)
+
+    executor = None
+    if processes > 1:
+        # Spawn rather than fork, since the parent may already have decoder threads running.
+        context = multiprocessing.get_context("spawn")
+        executor = ProcessPoolExecutor(max_workers=processes, mp_context=context)
+    try:
+        if frame_cache is not None:
+            # Fill the cache first, so chunks of the same video don't all decode it at once.
+            to_cache = [
+                (video_file, backend)
+                for video_file in dict.fromkeys(video_file for video_file, _ in units)
+                if not frame_cache.contains(video_file, backend)
+            ]
+            for _ in tqdm(
+                _run_all(executor, frame_cache.build, to_cache),
+                total=len(to_cache),
+                desc="frame cache",
+                unit="videos",
+            ):
+                pass
+        tasks = [
+            (video_file, backend, detector_name, [grid[i] for i in chunk_indices], frame_cache)
+            for video_file, chunk_indices in units
+        ]
+        for i, outputs in tqdm(
+            _run_all(executor, _run_unit, tasks),
+            total=len(tasks),
+            desc=f"sweep[{detector_name}]",
+            unit="chunks",
+        ):
+            unit_done(*units[i], outputs)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    ground_truth = {sample.video_file: sample.ground_truth for sample in dataset}
+    return [
+        {
+            video_file: Prediction(
+                predicted_cuts=cells[cell_i][0],
+                ground_truth=ground_truth[video_file],
+                elapsed=cells[cell_i][1],
+            )
+            for video_file, cells in results.items()
+        }
+        for cell_i in range(len(grid))
+    ]
+
+
+# --------------------------------------------------------------------- #
+# Checkpointing
+# --------------------------------------------------------------------- #
+
+CHECKPOINT_INTERVAL = 30.0
+"""Minimum time in seconds between writes of the checkpoint during a sweep."""
+
+
+class SweepCheckpoint:
+    """Cuts found for each cell on each video so far, saved to the ``--out`` file so that an
+    interrupted sweep can be resumed. The checkpoint is only valid for the same sweep, so it
+    records the settings that affect the results and is rejected if they differ."""
+
+    def __init__(self, path: str, settings: dict[str, Any]):
+        self.path = path
+        self.settings = settings
+        self.predictions: dict[str, dict[str, dict[str, Any]]] = {}
+        self._last_save = time.monotonic()
+
+    @classmethod
+    def load(cls, path: str, settings: dict[str, Any]) -> SweepCheckpoint:
+        """Load the checkpoint at ``path`` if it exists, otherwise start a new one.
+
+        Raises:
+            ValueError: The file at ``path`` is from a different sweep.
+        """
+        checkpoint = cls(path, settings)
+        if not os.path.exists(path):
+            return checkpoint
+        with open(path) as f:
+            payload = json.load(f)
+        saved = {key: payload.get(key) for key in settings}
+        if saved != json.loads(json.dumps(settings, default=str)):
+            raise ValueError(
+                f"{path} is from a different sweep, use another --out path or delete it."
+            )
+        checkpoint.predictions = payload.get("predictions", {})
+        return checkpoint
+
+    def completed(self) -> dict[Path, CellResults]:
+        """Results loaded from the checkpoint, in the form taken by :func:`run_sweep`."""
+        return {
+            Path(video): {
+                int(cell_i): (result["cuts"], result["elapsed"]) for cell_i, result in cells.items()
+            }
+            for video, cells in self.predictions.items()
+        }
+
+    def record(self, video_file: Path, results: CellResults) -> None:
+        """Add the results of a unit of work, saving the checkpoint if it hasn't been saved for
+        :data:`CHECKPOINT_INTERVAL` seconds."""
+        cells = self.predictions.setdefault(str(video_file), {})
+        for cell_i, (cuts, elapsed) in results.items():
+            cells[str(cell_i)] = {"cuts": cuts, "elapsed": elapsed}
+        if time.monotonic() - self._last_save >= CHECKPOINT_INTERVAL:
+            self.save()
+
+    def payload(self) -> dict[str, Any]:
+        return {**self.settings, "predictions": self.predictions}
+
+    def save(self, payload: dict[str, Any] | None = None) -> None:
+        """Write the checkpoint (or ``payload``, which must include it) to the output file.
+        Written to a temporary file first, so an interrupted write can't corrupt it."""
+        temp_path = f"{self.path}.partial"
+        with open(temp_path, "w") as f:
+            json.dump(self.payload() if payload is None else payload, f, indent=2, default=str)
+        os.replace(temp_path, self.path)
+        self._last_save = time.monotonic()
 
 
 # --------------------------------------------------------------------- #
@@ -367,6 +555,26 @@ def create_parser() -> argparse.ArgumentParser:
             "re-decoding the source video. Memory grows with --workers * prefetch frames."
         ),
     )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help=(
+            "Number of processes to spread videos and chunks of cells across (default: 1). "
+            "Each process drives up to --workers detectors, so this multiplies memory use."
+        ),
+    )
+    parser.add_argument(
+        "--frame-cache",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help=(
+            "Directory to cache decoded (downscaled) frames in. Each video is decoded once and "
+            "later sweeps read the cached frames instead. Needs about 10 GB per hour of 1080p "
+            "video."
+        ),
+    )
     parser.add_argument(
         "--quick",
         type=int,
@@ -380,7 +588,11 @@ def create_parser() -> argparse.ArgumentParser:
         "--out",
         type=str,
         default=None,
-        help="Path to write a machine-readable JSON sweep file (one entry per cell).",
+        help=(
+            "Path to write a machine-readable JSON sweep file (one entry per cell). Progress "
+            "is checkpointed to this file, and an interrupted sweep is resumed from it when run "
+            "again with the same arguments."
+        ),
     )
     return parser
 
@@ -392,6 +604,8 @@ def main() -> None:
         raise SystemExit("--tolerance must yield at least one value.")
     if args.workers < 1:
         raise SystemExit("--workers must be at least 1.")
+    if args.processes < 1:
+        raise SystemExit("--processes must be at least 1.")
 
     spec = parse_params_spec(args.params)
     grid = cartesian_grid(spec)
@@ -411,17 +625,44 @@ def main() -> None:
     print(
         f"Sweeping {args.detector} on {args.dataset}: "
         f"{len(grid)} cells x {len(dataset)} videos "
-        f"(backend={args.backend}, workers={args.workers})"
+        f"(backend={args.backend}, workers={args.workers}, processes={args.processes})"
     )
 
-    predictions_by_cell = run_sweep(dataset, args.detector, args.backend, grid, args.workers)
+    checkpoint = None
+    if args.out:
+        settings = {
+            "detector": args.detector,
+            "dataset": args.dataset,
+            "backend": args.backend,
+            "spec": args.params,
+            "grid": grid,
+        }
+        try:
+            checkpoint = SweepCheckpoint.load(args.out, settings)
+        except ValueError as ex:
+            raise SystemExit(str(ex)) from ex
+        if checkpoint.predictions:
+            print(f"Resuming from {args.out}")
+
+    try:
+        predictions_by_cell = run_sweep(
+            dataset,
+            args.detector,
+            args.backend,
+            grid,
+            args.workers,
+            processes=args.processes,
+            completed=checkpoint.completed() if checkpoint else None,
+            on_unit_done=checkpoint.record if checkpoint else None,
+            frame_cache=FrameCache(args.frame_cache) if args.frame_cache else None,
+        )
+    finally:
+        if checkpoint is not None:
+            checkpoint.save()
 
     # Score every cell at every tolerance.
     cells_at_tols: dict[int, list[tuple[dict[str, Any], BenchmarkResult]]] = {
-        t: [
-            (params, evaluate(preds, tolerance=t))
-            for params, preds in zip(grid, predictions_by_cell, strict=True)
-        ]
+        t: list(zip(grid, evaluate_batch(predictions_by_cell, tolerance=t), strict=True))
         for t in tolerances
     }
 
@@ -430,13 +671,11 @@ def main() -> None:
     if len(tolerances) >= 2:
         _print_pareto(cells_at_tols)
 
-    if args.out:
+    if checkpoint is not None:
         payload = {
-            "detector": args.detector,
-            "dataset": args.dataset,
-            "backend": args.backend,
+            **checkpoint.payload(),
             "workers": args.workers,
-            "spec": args.params,
+            "processes": args.processes,
             "cells": [
                 {
                     "params": params,
@@ -445,7 +684,8 @@ def main() -> None:
                 for i, params in enumerate(grid)
             ],
         }
-        write_json(args.out, payload)
+        checkpoint.save(payload)
+        print(f"\nWrote results to {args.out}")
 
 
 if __name__ == "__main__":
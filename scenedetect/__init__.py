@@ -15,6 +15,8 @@ can be used to open a video for a
 :class:`SceneManager <scenedetect.scene_manager.SceneManager>`.
 """
 
+import importlib
+import typing as ty
 import warnings
 from logging import getLogger
 
@@ -41,42 +43,104 @@ from scenedetect.common import (
     TimecodePair as TimecodePair,
     TimecodeLike as TimecodeLike,
     Interpolation as Interpolation,
+    Subsampling as Subsampling,
 )
 from scenedetect.platform import StrPath as StrPath
 from scenedetect.video_stream import VideoStream as VideoStream
 from scenedetect.video_stream import VideoOpenFailure as VideoOpenFailure
-from scenedetect.output import (
-    save_images as save_images,
-    split_video_ffmpeg as split_video_ffmpeg,
-    split_video_mkvmerge as split_video_mkvmerge,
-    is_ffmpeg_available as is_ffmpeg_available,
-    is_mkvmerge_available as is_mkvmerge_available,
-    write_scene_list as write_scene_list,
-    write_scene_list_html as write_scene_list_html,
-    PathFormatter as PathFormatter,
-    VideoMetadata as VideoMetadata,
-    SceneMetadata as SceneMetadata,
-)
 from scenedetect.detector import SceneDetector as SceneDetector
-from scenedetect.detectors import (
-    ContentDetector as ContentDetector,
-    AdaptiveDetector as AdaptiveDetector,
-    ThresholdDetector as ThresholdDetector,
-    HistogramDetector as HistogramDetector,
-    HashDetector as HashDetector,
-)
-from scenedetect.backends import (
-    AVAILABLE_BACKENDS as AVAILABLE_BACKENDS,
-    VideoStreamCv2 as VideoStreamCv2,
-    VideoStreamAv as VideoStreamAv,
-    VideoStreamMoviePy as VideoStreamMoviePy,
-    VideoCaptureAdapter as VideoCaptureAdapter,
-    VideoStreamConcat as VideoStreamConcat,
-    SourceSpan as SourceSpan,
-)
-from scenedetect.stats_manager import StatsManager as StatsManager
-from scenedetect.stats_manager import StatsFileCorrupt as StatsFileCorrupt
-from scenedetect.scene_manager import SceneManager
+
+# The remaining exports are imported the first time they are accessed (PEP 562), so that
+# importing `scenedetect` doesn't pay for modules the caller may not use (e.g. the PyAV backend,
+# or the video splitting and file writers in `scenedetect.output`).
+_LAZY_EXPORTS = {
+    "scenedetect.output": (
+        "save_images",
+        "split_video_ffmpeg",
+        "split_video_mkvmerge",
+        "split_video_pyav",
+        "is_ffmpeg_available",
+        "is_mkvmerge_available",
+        "is_pyav_available",
+        "write_scene_list",
+        "write_scene_list_html",
+        "PathFormatter",
+        "VideoMetadata",
+        "SceneMetadata",
+    ),
+    "scenedetect.detectors": (
+        "ContentDetector",
+        "AdaptiveDetector",
+        "ThresholdDetector",
+        "HistogramDetector",
+        "HashDetector",
+    ),
+    "scenedetect.backends": (
+        "AVAILABLE_BACKENDS",
+        "VideoStreamCv2",
+        "VideoStreamAv",
+        "VideoStreamMoviePy",
+        "VideoCaptureAdapter",
+        "VideoStreamConcat",
+        "SourceSpan",
+    ),
+    "scenedetect.stats_manager": ("StatsManager", "StatsFileCorrupt"),
+    "scenedetect.profiler": ("DetectionProfile",),
+    "scenedetect.scene_manager": ("SceneManager",),
+}
+_LAZY_MODULES = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
+
+if ty.TYPE_CHECKING:
+    from scenedetect.backends import (  # noqa: I001
+        AVAILABLE_BACKENDS as AVAILABLE_BACKENDS,
+        SourceSpan as SourceSpan,
+        VideoCaptureAdapter as VideoCaptureAdapter,
+        VideoStreamAv as VideoStreamAv,
+        VideoStreamConcat as VideoStreamConcat,
+        VideoStreamCv2 as VideoStreamCv2,
+        VideoStreamMoviePy as VideoStreamMoviePy,
+    )
+    from scenedetect.detectors import (
+        AdaptiveDetector as AdaptiveDetector,
+        ContentDetector as ContentDetector,
+        HashDetector as HashDetector,
+        HistogramDetector as HistogramDetector,
+        ThresholdDetector as ThresholdDetector,
+    )
+    from scenedetect.output import (
+        PathFormatter as PathFormatter,
+        SceneMetadata as SceneMetadata,
+        VideoMetadata as VideoMetadata,
+        is_ffmpeg_available as is_ffmpeg_available,
+        is_mkvmerge_available as is_mkvmerge_available,
+        is_pyav_available as is_pyav_available,
+        save_images as save_images,
+        split_video_ffmpeg as split_video_ffmpeg,
+        split_video_mkvmerge as split_video_mkvmerge,
+        split_video_pyav as split_video_pyav,
+        write_scene_list as write_scene_list,
+        write_scene_list_html as write_scene_list_html,
+    )
+    from scenedetect.profiler import DetectionProfile as DetectionProfile
+    from scenedetect.scene_manager import SceneManager as SceneManager
+    from scenedetect.stats_manager import (
+        StatsFileCorrupt as StatsFileCorrupt,
+        StatsManager as StatsManager,
+    )
+
+
+def __getattr__(name: str) -> ty.Any:
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_MODULES))
+
 
 # Used for module identification and when printing version & about info
 # (e.g. calling `scenedetect version` or `scenedetect about`).
@@ -104,6 +168,8 @@ def open_video(
         backend: Name of specific backend to use, if possible. See
             :data:`scenedetect.backends.AVAILABLE_BACKENDS` for backends available on the current
             system. If the backend fails to open the video, OpenCV will be used as a fallback.
+            Ignored for raw frame files (see :mod:`scenedetect.backends.raw`), which are always
+            opened with :class:`VideoStreamRaw <scenedetect.backends.raw.VideoStreamRaw>`.
         framerate: [DEPRECATED] Use `frame_rate` instead. Retained as a deprecated alias for
             backwards compatibility; ignored when `frame_rate` is provided.
         kwargs: Optional named arguments to pass to the specified `backend` constructor for
@@ -125,14 +191,26 @@ def open_video(
         )
     if frame_rate is None:
         frame_rate = framerate
+    from scenedetect.backends import (
+        AVAILABLE_BACKENDS,
+        VideoStreamConcat,
+        VideoStreamCv2,
+        VideoStreamRaw,
+    )
+    from scenedetect.backends.raw import is_raw_video
+
     # A list of paths is opened as a single concatenated stream. VideoStreamConcat handles
     # backend selection/fallback internally, so this must come before the lookup below.
     if isinstance(path, (list, tuple)):
         return VideoStreamConcat(path, frame_rate, backend=backend, **kwargs)
+    # Raw frame files can only be read by one backend, which has no options of its own.
+    if is_raw_video(path):
+        logger.debug("Opening raw frame file with %s...", VideoStreamRaw.BACKEND_NAME)
+        return VideoStreamRaw(path, frame_rate)
     last_error: Exception | None = None
     # If `backend` is available, try to open the video at `path` using it.
-    if backend in AVAILABLE_BACKENDS:
-        backend_type = AVAILABLE_BACKENDS[backend]
+    backend_type = AVAILABLE_BACKENDS.get(backend)
+    if backend_type is not None:
         try:
             logger.debug("Opening video with %s...", backend_type.BACKEND_NAME)
             return backend_type(path, frame_rate, **kwargs)
@@ -201,6 +279,9 @@ def detect(
         ValueError: `start_time` or `end_time` are incorrectly formatted.
         TypeError: `start_time` or `end_time` are invalid types.
     """
+    from scenedetect.scene_manager import SceneManager
+    from scenedetect.stats_manager import StatsManager
+
     video = open_video(video_path, backend=backend)
     if start_time is not None:
         video.seek(FrameTimecode(start_time, video.frame_rate))
@@ -217,3 +298,26 @@ def detect(
     if scene_manager.stats_manager is not None and stats_file_path is not None:
         scene_manager.stats_manager.save_to_csv(csv_file=stats_file_path)
     return scene_manager.get_scene_list(start_in_scene=start_in_scene)
+
+
+# Names that are imported lazily are not in the module namespace until first accessed, so they must
+# be listed explicitly for `from scenedetect import *` to import them.
+__all__ = [
+    "CropRegion",
+    "CutList",
+    "FrameRate",
+    "FrameTimecode",
+    "Interpolation",
+    "SceneDetector",
+    "SceneList",
+    "StrPath",
+    "Subsampling",
+    "TimecodeLike",
+    "TimecodePair",
+    "VideoOpenFailure",
+    "VideoStream",
+    "detect",
+    "init_logger",
+    "open_video",
+    *_LAZY_MODULES,
+]
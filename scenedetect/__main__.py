@@ -16,7 +16,7 @@ from logging import getLogger
 
 from scenedetect._cli import scenedetect
 from scenedetect._cli.context import CliContext
-from scenedetect._cli.controller import run_scenedetect
+from scenedetect._cli.controller import run_batch, run_scenedetect
 from scenedetect.platform import DEBUG_MODE, FakeTqdmLoggingRedirect, logging_redirect_tqdm
 
 
@@ -34,16 +34,30 @@ def main():
     # If we get here, processing the command line and loading the context worked. Let's run
     # the controller if we didn't process any help requests.
     logger = getLogger("pyscenedetect")
-    # Ensure log messages don't conflict with any progress bars. If we're in quiet mode, where
-    # no progress bars get created, we instead create a fake context manager. This is done here
-    # to avoid needing a separate context manager at each point a progress bar is created.
+    # Ensure log messages don't conflict with any progress bars. If we're in quiet mode, or there
+    # is no input to process, no progress bars get created so we instead create a fake context
+    # manager. This is done here to avoid needing a separate context manager at each point a
+    # progress bar is created.
+    no_input = context.scene_manager is None and not context.batch_inputs
     log_redirect = (
-        FakeTqdmLoggingRedirect() if context.quiet_mode else logging_redirect_tqdm(loggers=[logger])
+        FakeTqdmLoggingRedirect()
+        if context.quiet_mode or no_input
+        else logging_redirect_tqdm(loggers=[logger])
     )
 
+    num_failed = 0
     with log_redirect:
         try:
-            run_scenedetect(context)
+            if context.batch_inputs:
+                # Each video in the batch re-parses the command line into its own context.
+                num_failed = run_batch(
+                    context,
+                    lambda video_context: scenedetect.main(
+                        obj=video_context, standalone_mode=False
+                    ),
+                )
+            else:
+                run_scenedetect(context)
         except KeyboardInterrupt:
             logger.info("Stopped.")
             if DEBUG_MODE:
@@ -54,6 +68,8 @@ def main():
                 raise
             logger.critical("ERROR: Unhandled exception:", exc_info=ex)
             raise SystemExit(1) from ex
+    if num_failed:
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -146,7 +146,23 @@ class Command(click.Command):
 class CommandGroup(Command, click.Group):
     """Custom formatting for command groups."""
 
-    pass
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        return super().parse_args(ctx, _join_crop_args(args))
+
+
+def _join_crop_args(args: list[str]) -> list[str]:
+    """Join the coordinates following `--crop` into a single argument, so it can take either four
+    numbers or `auto`."""
+    args = list(args)
+    for i, arg in enumerate(args):
+        if arg != "--crop":
+            continue
+        end = i + 1
+        while end < min(len(args), i + 5) and args[end].lstrip("-").isdigit():
+            end += 1
+        if end > i + 1:
+            args[i + 1 : end] = [" ".join(args[i + 1 : end])]
+    return args
 
 
 def print_command_help(ctx: click.Context, command: click.Command):
@@ -203,6 +219,23 @@ Global options (e.g. -i/--input, -c/--config) must be specified before any comma
     type=click.STRING,
     help="[REQUIRED] Input video file. Image sequences and URLs are supported.",
 )
+@click.option(
+    "--batch",
+    metavar="VIDEOS",
+    type=click.STRING,
+    default=None,
+    help="Process many videos independently instead of -i/--input. VIDEOS can be a directory, a glob pattern (quote it to prevent shell expansion), or @FILE to read one path per line from FILE. Each video gets its own output files, so any -s/--stats or --profile path must contain $VIDEO_NAME.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    metavar="N",
+    type=_click_range("global", "jobs"),
+    default=None,
+    help="Number of videos to process concurrently with --batch.{}".format(
+        USER_CONFIG.get_help_string("global", "jobs")
+    ),
+)
 @click.option(
     "--output",
     "-o",
@@ -228,6 +261,12 @@ Global options (e.g. -i/--input, -c/--config) must be specified before any comma
     type=click.Path(exists=False, file_okay=True, writable=True, resolve_path=False),
     help="Stats file (.csv) to write frame metrics. Existing files will be overwritten. Used for tuning detection parameters and data analysis.",
 )
+@click.option(
+    "--profile",
+    metavar="JSON",
+    type=click.Path(exists=False, file_okay=True, writable=True, resolve_path=False),
+    help="Profile file (.json) to write the time spent in each stage of detection (decoding, downscaling, each detector, etc). Existing files will be overwritten. A summary is also shown after detection.",
+)
 @click.option(
     "--frame-rate",
     "--framerate",
@@ -279,9 +318,9 @@ Global options (e.g. -i/--input, -c/--config) must be specified before any comma
 @click.option(
     "--crop",
     metavar="X0 Y0 X1 Y1",
-    type=(int, int, int, int),
+    type=click.STRING,
     default=None,
-    help="Crop input video. Specified as two points representing top left and bottom right corner of crop region. 0 0 is top-left of the video frame. Bounds are inclusive (e.g. for a 100x100 video, the region covering the whole frame is 0 0 99 99).{}".format(
+    help="Crop input video. Specified as two points representing top left and bottom right corner of crop region. 0 0 is top-left of the video frame. Bounds are inclusive (e.g. for a 100x100 video, the region covering the whole frame is 0 0 99 99). Use --crop auto to crop out black bars (letterboxing/pillarboxing), found by sampling frames across the video before detection.{}".format(
         USER_CONFIG.get_help_string("global", "crop", show_default=False)
     ),
 )
@@ -305,6 +344,15 @@ Global options (e.g. -i/--input, -c/--config) must be specified before any comma
         USER_CONFIG.get_help_string("global", "frame-skip")
     ),
 )
+@click.option(
+    "--adaptive-skip",
+    is_flag=True,
+    flag_value=True,
+    default=None,
+    help="Process frames skipped with -fs/--frame-skip when there may be a cut between them, so cuts are found at the same frames as without skipping any.{}".format(
+        USER_CONFIG.get_help_string("global", "adaptive-skip")
+    ),
+)
 @click.option(
     "--verbosity",
     "-v",
@@ -334,17 +382,21 @@ Global options (e.g. -i/--input, -c/--config) must be specified before any comma
 def scenedetect(
     ctx: click.Context,
     input: str | None,
+    batch: str | None,
+    jobs: int | None,
     output: str | None,
     stats: str | None,
+    profile: str | None,
     config: str | None,
     frame_rate: float | None,
     min_scene_len: str | None,
     drop_short_scenes: bool | None,
     merge_last_scene: bool | None,
     backend: str | None,
-    crop: tuple[int, int, int, int] | None,
+    crop: str | None,
     downscale: int | None,
     frame_skip: int | None,
+    adaptive_skip: bool | None,
     verbosity: str | None,
     logfile: str | None,
     quiet: bool,
@@ -358,6 +410,7 @@ def scenedetect(
         frame_rate=frame_rate,
         stats_file=stats,
         frame_skip=frame_skip,
+        adaptive_skip=adaptive_skip,
         min_scene_len=min_scene_len,
         drop_short_scenes=drop_short_scenes,
         merge_last_scene=merge_last_scene,
@@ -369,7 +422,13 @@ def scenedetect(
         config=config,
         stats=stats,
         verbosity=verbosity,
+        profile=profile,
+        batch=batch,
+        jobs=jobs,
     )
+    # Commands are parsed again for each video in the batch once it is run by the controller.
+    if ctx.batch_inputs:
+        click.get_current_context().exit()
 
 
 def add_hidden_alias(command: click.Command, alias: str):
@@ -436,6 +495,71 @@ def version_command(ctx: click.Context):
     ctx.exit()
 
 
+SERVE_HELP = """Run a server which accepts detection jobs over HTTP.
+
+The server keeps running between jobs, so the time it takes to start the program is only spent once. To submit a job, POST a JSON object to /jobs with `input` set to the path of a video, and `args` set to the options and commands that would follow -i/--input on the command line (e.g. `["detect-content", "list-scenes"]`). Set `wait` to true to get the scene list in the response, otherwise poll the job with GET /jobs/ID using the `id` in the response.
+
+Global options (e.g. -c/--config, -v/--verbosity) apply to every job. Output files are written relative to the working directory of the server.
+
+Examples:
+
+    {scenedetect} serve
+
+    {scenedetect} serve --port 8000 --jobs 4
+"""
+
+
+@click.command("serve", cls=Command, help=SERVE_HELP)
+@click.option(
+    "--host",
+    metavar="HOST",
+    type=click.STRING,
+    default=None,
+    help="Address to accept jobs on.{}".format(USER_CONFIG.get_help_string("serve", "host")),
+)
+@click.option(
+    "--port",
+    "-p",
+    metavar="PORT",
+    type=_click_range("serve", "port"),
+    default=None,
+    help="Port to accept jobs on. Set to 0 to pick any free port.{}".format(
+        USER_CONFIG.get_help_string("serve", "port")
+    ),
+)
+@click.option(
+    "--jobs",
+    "-j",
+    metavar="N",
+    type=_click_range("serve", "jobs"),
+    default=None,
+    help="Number of jobs to run concurrently.{}".format(
+        USER_CONFIG.get_help_string("serve", "jobs")
+    ),
+)
+@click.pass_context
+def serve_command(
+    ctx: click.Context,
+    host: str | None,
+    port: int | None,
+    jobs: int | None,
+):
+    from scenedetect._cli.server import run_server
+
+    command = ctx.find_root().command
+    ctx = ctx.obj
+    assert isinstance(ctx, CliContext)
+    if ctx.video_stream is not None or ctx.batch_inputs:
+        raise click.UsageError("The serve command cannot be used with -i/--input or --batch.")
+    run_server(
+        ctx,
+        command=command,
+        host=ctx.config.get_value("serve", "host", host),
+        port=ctx.config.get_value("serve", "port", port),
+        jobs=ctx.config.get_value("serve", "jobs", jobs),
+    )
+
+
 TIME_COMMAND_HELP = """Set start/end/duration of input video.
 
 Values can be specified as seconds (SSSS.nn), frames (NNNN), or timecode (HH:MM:SS.nnn). For example, to process only the first minute of a video:
@@ -1091,6 +1215,10 @@ Default:
 Without cut list (RFC 4180 compliant CSV):
 
     {scenedetect_with_video} list-scenes --skip-cuts
+
+Write each scene as soon as it is detected, as JSON lines:
+
+    {scenedetect_with_video} list-scenes --stream -f \\$VIDEO_NAME-Scenes.jsonl
 """
 
 
@@ -1110,7 +1238,7 @@ Without cut list (RFC 4180 compliant CSV):
     metavar="NAME",
     default="$VIDEO_NAME-Scenes.csv",
     type=click.STRING,
-    help="Filename format to use for the scene list CSV file. You can use the $VIDEO_NAME macro in the file name. Note that you may have to wrap the name using single quotes or use escape characters (e.g. -f \\$VIDEO_NAME-Scenes.csv).{}".format(
+    help="Filename format to use for the scene list CSV file. Scenes are written as JSON lines instead if the name ends with .jsonl. You can use the $VIDEO_NAME macro in the file name. Note that you may have to wrap the name using single quotes or use escape characters (e.g. -f \\$VIDEO_NAME-Scenes.csv).{}".format(
         USER_CONFIG.get_help_string("list-scenes", "filename")
     ),
 )
@@ -1144,6 +1272,15 @@ Without cut list (RFC 4180 compliant CSV):
         USER_CONFIG.get_help_string("list-scenes", "skip-cuts")
     ),
 )
+@click.option(
+    "--stream",
+    is_flag=True,
+    flag_value=True,
+    default=None,
+    help="Write each scene to the file as soon as it is detected, instead of after processing the whole video. Implies --skip-cuts.{}".format(
+        USER_CONFIG.get_help_string("list-scenes", "stream")
+    ),
+)
 @click.pass_context
 def list_scenes_command(
     ctx: click.Context,
@@ -1152,6 +1289,7 @@ def list_scenes_command(
     no_output_file: bool | None,
     quiet: bool | None,
     skip_cuts: bool | None,
+    stream: bool | None,
 ):
     ctx = ctx.obj
     assert isinstance(ctx, CliContext)
@@ -1167,11 +1305,17 @@ def list_scenes_command(
         "output": ctx.config.get_value("list-scenes", "output", output),
         "quiet": ctx.config.get_value("list-scenes", "quiet", quiet) or ctx.quiet_mode,
         "row_separator": ctx.config.get_value("list-scenes", "row-separator"),
+        "stream": ctx.config.get_value("list-scenes", "stream", stream),
     }
     ctx.add_command(cli_commands.list_scenes, list_scenes_args)
+    if list_scenes_args["stream"] and not list_scenes_args["no_output_file"]:
+        ctx.stream_scene_list = {
+            key: list_scenes_args[key]
+            for key in ("filename", "output", "col_separator", "row_separator")
+        }
 
 
-SPLIT_VIDEO_HELP = """Split input video using ffmpeg or mkvmerge.
+SPLIT_VIDEO_HELP = """Split input video using ffmpeg, mkvmerge, or PyAV.
 
 Examples:
 
@@ -1186,6 +1330,10 @@ Codec-copy mode (not frame accurate):
 Customized filenames:
 
     {scenedetect_with_video} split-video --filename \\$VIDEO_NAME-Clip-\\$SCENE_NUMBER
+
+Split in-process without ffmpeg (requires PyAV):
+
+    {scenedetect_with_video} split-video --pyav
 """
 
 
@@ -1277,6 +1425,14 @@ Customized filenames:
         USER_CONFIG.get_help_string("split-video", "mkvmerge")
     ),
 )
+@click.option(
+    "--pyav",
+    is_flag=True,
+    flag_value=True,
+    help="Split video in-process using PyAV instead of invoking ffmpeg. The input is only read once for all scenes. Can be combined with -c/--copy, -hq/--high-quality, -crf/--rate-factor, and -p/--preset, but not -a/--args or -m/--mkvmerge.{}".format(
+        USER_CONFIG.get_help_string("split-video", "pyav")
+    ),
+)
 @click.option(
     "--expand",
     is_flag=True,
@@ -1298,26 +1454,38 @@ def split_video_command(
     preset: str | None,
     args: str | None,
     mkvmerge: bool,
+    pyav: bool,
     expand: bool,
 ):
     ctx = ctx.obj
     assert isinstance(ctx, CliContext)
 
-    check_split_video_requirements(use_mkvmerge=mkvmerge)
     assert ctx.video_stream is not None
     if "%" in ctx.video_stream.path or "://" in ctx.video_stream.path:
         error = "The split-video command is incompatible with image sequences/URLs."
         raise click.BadParameter(error, param_hint="split-video")
 
+    # PyAV encodes in-process, so it cannot be used with any other splitting tool arguments.
+    if pyav and args:
+        raise click.BadParameter(
+            "args (-a) cannot be used with pyav (--pyav)", param_hint="split-video"
+        )
+
     # Overwrite flags if no encoder flags/options were set via the CLI to avoid conflicting options
     # (e.g. `--copy` should override any `high-quality = yes` setting in the config file).
-    if not (mkvmerge or copy or high_quality or args or rate_factor or preset):
+    if not (pyav or mkvmerge or copy or high_quality or args or rate_factor or preset):
+        pyav = ctx.config.get_value("split-video", "pyav")
         mkvmerge = ctx.config.get_value("split-video", "mkvmerge")
         copy = ctx.config.get_value("split-video", "copy")
         high_quality = ctx.config.get_value("split-video", "high-quality")
         rate_factor = ctx.config.get_value("split-video", "rate-factor")
         preset = ctx.config.get_value("split-video", "preset")
         args = ctx.config.get_value("split-video", "args")
+    if pyav and mkvmerge:
+        raise click.BadParameter(
+            "pyav (--pyav) cannot be used with mkvmerge (-m)", param_hint="split-video"
+        )
+    check_split_video_requirements(use_mkvmerge=mkvmerge, use_pyav=pyav)
 
     # Disallow certain combinations of options.
     if mkvmerge or copy:
@@ -1344,6 +1512,15 @@ def split_video_command(
     if mkvmerge and copy:
         logger.warning("copy mode (-c) ignored due to mkvmerge mode (-m).")
 
+    # PyAV-Specific Options
+    pyav_options = None
+    if pyav and not copy:
+        if rate_factor is None:
+            rate_factor = 22 if not high_quality else 17
+        if preset is None:
+            preset = "veryfast" if not high_quality else "slow"
+        pyav_options = {"preset": preset, "crf": str(rate_factor)}
+
     # ffmpeg-Specific Options
     if copy:
         args = "-map 0:v:0 -map 0:a? -map 0:s? -c:v copy -c:a copy"
@@ -1362,6 +1539,9 @@ def split_video_command(
     split_video_args = {
         "name_format": ctx.config.get_value("split-video", "filename", filename),
         "use_mkvmerge": mkvmerge,
+        "use_pyav": pyav,
+        "copy": copy,
+        "pyav_options": pyav_options,
         "output": ctx.config.get_value("split-video", "output", output),
         "show_output": not ctx.config.get_value("split-video", "quiet", quiet),
         "ffmpeg_args": args,
@@ -1697,6 +1877,53 @@ def save_qp_command(
     ctx.add_command(cli_commands.save_qp, save_qp_args)
 
 
+SAVE_RAW_HELP = """Save processed frames to a raw frame file.
+
+Frames are written uncompressed with their timestamps as they are processed, so the video is only decoded once. Frames are saved as detectors see them, after cropping (`--crop`) and downscaling (-d/--downscale). The file can be used as the input of later runs (`-i VIDEO_NAME.sdraw -d 1`), which then don't need to decode the video again.
+
+Examples:
+
+    {scenedetect_with_video} save-raw
+
+    {scenedetect_with_video} save-raw -o frames
+"""
+
+
+@click.command("save-raw", cls=Command, help=SAVE_RAW_HELP)
+@click.option(
+    "--filename",
+    "-f",
+    metavar="NAME",
+    default=None,
+    type=click.STRING,
+    help="Filename format to use.{}".format(USER_CONFIG.get_help_string("save-raw", "filename")),
+)
+@click.option(
+    "--output",
+    "-o",
+    metavar="DIR",
+    type=click.Path(exists=False, dir_okay=True, writable=True, resolve_path=False),
+    help="Output directory to save raw frame file to. Overrides global option -o/--output.{}".format(
+        USER_CONFIG.get_help_string("save-raw", "output", show_default=False)
+    ),
+)
+@click.pass_context
+def save_raw_command(
+    ctx: click.Context,
+    filename: str | None,
+    output: str | None,
+):
+    ctx = ctx.obj
+    assert isinstance(ctx, CliContext)
+
+    # The file is written during detection rather than by a command run after it (see
+    # `CliContext.add_command`), so the global -o/--output is applied here.
+    ctx.save_raw = {
+        "filename": ctx.config.get_value("save-raw", "filename", filename),
+        "output": ctx.config.get_value("save-raw", "output", output) or ctx.output,
+    }
+
+
 SAVE_FCP_HELP = """Save cuts in Final Cut Pro XML format (FCP7 xmeml or FCPX)."""
 
 
@@ -1824,6 +2051,9 @@ scenedetect.add_command(about_command)
 scenedetect.add_command(help_command)
 scenedetect.add_command(version_command)
 
+# Server
+scenedetect.add_command(serve_command)
+
 # Input
 scenedetect.add_command(load_scenes_command)
 scenedetect.add_command(time_command)
@@ -1841,6 +2071,7 @@ scenedetect.add_command(save_edl_command)
 scenedetect.add_command(save_html_command)
 scenedetect.add_command(save_images_command)
 scenedetect.add_command(save_qp_command)
+scenedetect.add_command(save_raw_command)
 scenedetect.add_command(save_fcp_command)
 scenedetect.add_command(save_otio_command)
 scenedetect.add_command(split_video_command)
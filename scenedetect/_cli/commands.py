@@ -21,10 +21,14 @@ from string import Template
 
 from scenedetect._cli.config import FcpFormat
 from scenedetect._cli.context import CliContext
-from scenedetect.output import save_images as save_images_impl
+from scenedetect.backends.raw import RawVideoWriter
 from scenedetect.output import (
+    CsvSceneListWriter,
+    JsonLinesSceneListWriter,
+    SceneListWriter,
     split_video_ffmpeg,
     split_video_mkvmerge,
+    split_video_pyav,
     write_scene_list,
     write_scene_list_edl,
     write_scene_list_fcp7,
@@ -32,6 +36,7 @@ from scenedetect.output import (
     write_scene_list_html,
     write_scene_list_otio,
 )
+from scenedetect.output import save_images as save_images_impl
 from scenedetect.platform import get_and_create_path
 from scenedetect.scene_manager import (
     CutList,
@@ -102,6 +107,46 @@ def save_qp(
     logger.info(f"QP file written to: {qp_path}")
 
 
+def open_raw_video(context: CliContext, filename: str, output: str) -> RawVideoWriter:
+    """Open the raw frame file of the `save-raw` command to write frames to as they are
+    processed."""
+    assert context.video_stream is not None
+    video = context.video_stream
+    raw_path = get_and_create_path(
+        Template(filename).safe_substitute(VIDEO_NAME=video.name),
+        output,
+    )
+    logger.info("Writing frames to raw file as processed:\n  %s", raw_path)
+    return RawVideoWriter(raw_path, video.frame_rate, video.aspect_ratio)
+
+
+def _get_scene_list_path(context: CliContext, filename: str, output: str) -> str:
+    assert context.video_stream is not None
+    scene_list_filename = Template(filename).safe_substitute(VIDEO_NAME=context.video_stream.name)
+    if not scene_list_filename.lower().endswith((".csv", ".jsonl")):
+        scene_list_filename += ".csv"
+    return get_and_create_path(scene_list_filename, output)
+
+
+def open_scene_list(
+    context: CliContext,
+    filename: str,
+    output: str,
+    col_separator: str,
+    row_separator: str,
+) -> SceneListWriter:
+    """Open the scene list file of the `list-scenes` command to write scenes to as they are
+    detected (`list-scenes --stream`)."""
+    scene_list_path = _get_scene_list_path(context, filename, output)
+    if scene_list_path.lower().endswith(".jsonl"):
+        logger.info("Writing scenes to JSON lines file as detected:\n  %s", scene_list_path)
+        return JsonLinesSceneListWriter(scene_list_path)
+    logger.info("Writing scenes to CSV file as detected:\n  %s", scene_list_path)
+    return CsvSceneListWriter(
+        scene_list_path, col_separator=col_separator, row_separator=row_separator
+    )
+
+
 def list_scenes(
     context: CliContext,
     scenes: SceneList,
@@ -116,30 +161,30 @@ def list_scenes(
     cut_format: str,
     col_separator: str,
     row_separator: str,
+    stream: bool = False,
 ):
     """Handles the `list-scenes` command."""
     assert context.video_stream is not None
-    # Write scene list CSV to if required.
-    if not no_output_file:
-        scene_list_filename = Template(filename).safe_substitute(
-            VIDEO_NAME=context.video_stream.name
-        )
-        if not scene_list_filename.lower().endswith(".csv"):
-            scene_list_filename += ".csv"
-        scene_list_path = get_and_create_path(
-            scene_list_filename,
-            output,
-        )
-        logger.info("Writing scene list to CSV file:\n  %s", scene_list_path)
-        with open(scene_list_path, "w") as scene_list_file:
-            write_scene_list(
-                output_csv_file=scene_list_file,
-                scene_list=scenes,
-                include_cut_list=not skip_cuts,
-                cut_list=cuts,
-                col_separator=col_separator,
-                row_separator=row_separator,
-            )
+    # Write scene list CSV to if required. When streaming, the file was already written during
+    # detection, unless detection was skipped because scenes were loaded with load-scenes.
+    if not no_output_file and not (stream and not context.load_scenes_input):
+        scene_list_path = _get_scene_list_path(context, filename, output)
+        if scene_list_path.lower().endswith(".jsonl"):
+            logger.info("Writing scene list to JSON lines file:\n  %s", scene_list_path)
+            with JsonLinesSceneListWriter(scene_list_path) as writer:
+                for scene in scenes:
+                    writer.write(scene)
+        else:
+            logger.info("Writing scene list to CSV file:\n  %s", scene_list_path)
+            with open(scene_list_path, "w") as scene_list_file:
+                write_scene_list(
+                    output_csv_file=scene_list_file,
+                    scene_list=scenes,
+                    include_cut_list=not skip_cuts,
+                    cut_list=cuts,
+                    col_separator=col_separator,
+                    row_separator=row_separator,
+                )
     # Suppress output if requested.
     if quiet:
         return
@@ -214,6 +259,9 @@ def split_video(
     cuts: CutList,
     name_format: str,
     use_mkvmerge: bool,
+    use_pyav: bool,
+    copy: bool,
+    pyav_options: dict[str, str] | None,
     output: str,
     show_output: bool,
     ffmpeg_args: str,
@@ -254,6 +302,16 @@ def split_video(
             output_file_template=name_format,
             show_output=show_output,
         )
+    elif use_pyav:
+        split_video_pyav(
+            input_video_path=context.video_stream.path,
+            scene_list=scenes,
+            output_dir=output,
+            output_file_template=name_format,
+            copy=copy,
+            codec_options=pyav_options,
+            show_progress=not context.quiet_mode,
+        )
     else:
         split_video_ffmpeg(
             input_video_path=context.video_stream.path,
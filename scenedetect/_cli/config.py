@@ -31,7 +31,7 @@ from scenedetect.detector import FlashFilter
 from scenedetect.detectors import ContentDetector
 from scenedetect.output.video import _DEFAULT_FFMPEG_ARGS
 from scenedetect.platform import DEBUG_MODE
-from scenedetect.scene_manager import Interpolation
+from scenedetect.scene_manager import Interpolation, Subsampling
 
 PYAV_THREADING_MODES = ["NONE", "SLICE", "FRAME", "AUTO"]
 
@@ -148,17 +148,22 @@ class RangeValue(ValidatedValue):
 
 
 class CropValue(ValidatedValue):
-    """Validator for crop region defined as X0 Y0 X1 Y1."""
+    """Validator for crop region defined as X0 Y0 X1 Y1, or `auto` to detect black bars."""
 
     _IGNORE_CHARS = (",", "/", "(", ")")
     """Characters to ignore."""
 
+    AUTO = "auto"
+    """Value indicating the crop region should be detected automatically."""
+
     def __init__(self, value: "str | tuple[int, int, int, int] | CropValue | None" = None):
-        self._crop: tuple[int, int, int, int] | None = None
+        self._crop: tuple[int, int, int, int] | str | None = None
         if isinstance(value, CropValue):
             self._crop = value._crop
         elif value is None:
             return
+        elif isinstance(value, str) and value.strip().lower() == CropValue.AUTO:
+            self._crop = CropValue.AUTO
         else:
             crop: tuple[int, ...] = ()
             if isinstance(value, str):
@@ -177,12 +182,14 @@ class CropValue(ValidatedValue):
             self._crop = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
 
     @property
-    def value(self) -> tuple[int, int, int, int] | None:
+    def value(self) -> tuple[int, int, int, int] | str | None:
         return self._crop
 
     def __str__(self) -> str:
         if self._crop is None:
             return "(none)"
+        if self._crop == CropValue.AUTO:
+            return CropValue.AUTO
         x0, y0, x1, y1 = self._crop
         return f"[{x0}, {y0}], [{x1}, {y1}]"
 
@@ -407,8 +414,10 @@ CONFIG_MAP: ConfigDict = {
         "no-output-file": False,
         "quiet": False,
         "skip-cuts": False,
+        "stream": False,
     },
     "global": {
+        "adaptive-skip": False,
         "backend": "opencv",
         "crop": CropValue(),
         "default-detector": "detect-adaptive",
@@ -416,9 +425,11 @@ CONFIG_MAP: ConfigDict = {
         "downscale-method": Interpolation.LINEAR,
         "drop-short-scenes": False,
         "frame-skip": 0,
+        "jobs": RangeValue(1, min_val=1, max_val=256),
         "merge-last-scene": False,
         "min-scene-len": TimecodeValue("0.6s"),
         "output": None,
+        "subsampling": Subsampling.RESIZE,
         "verbosity": "info",
     },
     "save-edl": {
@@ -460,11 +471,20 @@ CONFIG_MAP: ConfigDict = {
         "filename": "$VIDEO_NAME.qp",
         "output": None,
     },
+    "save-raw": {
+        "filename": "$VIDEO_NAME.sdraw",
+        "output": None,
+    },
     "save-fcp": {
         "format": FcpFormat.FCPX,
         "filename": "$VIDEO_NAME.xml",
         "output": None,
     },
+    "serve": {
+        "host": "127.0.0.1",
+        "jobs": RangeValue(1, min_val=1, max_val=256),
+        "port": RangeValue(8765, min_val=0, max_val=65535),
+    },
     "split-video": {
         "args": _DEFAULT_FFMPEG_ARGS,
         "copy": False,
@@ -474,6 +494,7 @@ CONFIG_MAP: ConfigDict = {
         "mkvmerge": False,
         "output": None,
         "preset": "veryfast",
+        "pyav": False,
         "quiet": False,
         "rate-factor": RangeValue(22, min_val=0, max_val=100),
     },
@@ -499,6 +520,7 @@ CHOICE_MAP: dict[str, dict[str, list[str]]] = {
             "detect-hist",
         ],
         "downscale-method": [value.name.lower() for value in Interpolation],
+        "subsampling": [value.name.lower() for value in Subsampling],
         "verbosity": ["debug", "info", "warning", "error", "none"],
     },
     "list-scenes": {
@@ -11,8 +11,11 @@
 #
 """Context of which command-line options and config settings the user provided."""
 
+import glob
 import logging
+import os
 import typing as ty
+from string import Template
 
 import click
 
@@ -33,9 +36,10 @@ from scenedetect.detectors import (
     HistogramDetector,
     ThresholdDetector,
 )
-from scenedetect.output import is_ffmpeg_available, is_mkvmerge_available
+from scenedetect.output import is_ffmpeg_available, is_mkvmerge_available, is_pyav_available
 from scenedetect.platform import DEBUG_MODE, init_logger
-from scenedetect.scene_manager import SceneManager
+from scenedetect.profiler import DetectionProfile
+from scenedetect.scene_manager import SceneManager, detect_crop_region
 from scenedetect.stats_manager import StatsManager
 from scenedetect.video_stream import FrameRateUnavailable, VideoOpenFailure, VideoStream
 
@@ -44,17 +48,77 @@ logger = logging.getLogger("pyscenedetect")
 USER_CONFIG = ConfigRegistry(throw_exception=False)
 """The user config, which can be overriden by command-line. If not found, will be default config."""
 
+BATCH_VIDEO_EXTENSIONS = (
+    ".avi",
+    ".flv",
+    ".m2ts",
+    ".m4v",
+    ".mkv",
+    ".mov",
+    ".mp4",
+    ".mpeg",
+    ".mpg",
+    ".mts",
+    ".ts",
+    ".webm",
+    ".wmv",
+)
+"""File extensions treated as videos when a directory is passed to --batch."""
+
+
+def expand_batch_inputs(batch: str) -> list[str]:
+    """Expand the value of the --batch option into a list of video paths.
+
+    Arguments:
+        batch: One of: a directory (every video directly inside of it, by extension), a file list
+            prefixed with @ (one path per line, blank lines and lines starting with # are skipped),
+            or a glob pattern (** matches any number of subdirectories).
 
-def check_split_video_requirements(use_mkvmerge: bool) -> None:
+    Raises:
+        click.BadParameter: The file list could not be read, or no videos were found.
+    """
+    if os.path.isdir(batch):
+        paths = [
+            os.path.join(batch, name)
+            for name in sorted(os.listdir(batch))
+            if os.path.splitext(name)[1].lower() in BATCH_VIDEO_EXTENSIONS
+            and os.path.isfile(os.path.join(batch, name))
+        ]
+    elif batch.startswith("@"):
+        try:
+            with open(batch[1:], encoding="utf-8") as file:
+                lines = [line.strip() for line in file]
+        except OSError as ex:
+            raise click.BadParameter(
+                f"Failed to read file list: {ex}", param_hint="--batch"
+            ) from ex
+        paths = [line for line in lines if line and not line.startswith("#")]
+    else:
+        paths = sorted(glob.glob(batch, recursive=True))
+    if not paths:
+        raise click.BadParameter(f"No videos found matching {batch}", param_hint="--batch")
+    return paths
+
+
+def check_split_video_requirements(use_mkvmerge: bool, use_pyav: bool = False) -> None:
     """Validates that the proper tool is available on the system to perform the
     `split-video` command.
 
     Arguments:
         use_mkvmerge: True if mkvmerge (-m), False otherwise.
+        use_pyav: True if PyAV (--pyav), False otherwise.
 
     Raises: click.BadParameter if the proper video splitting tool cannot be found.
     """
 
+    if use_pyav:
+        if not is_pyav_available():
+            raise click.BadParameter(
+                "PyAV is required for split-video when --pyav is set.\n"
+                "Install it with `pip install av` and try again.",
+                param_hint="split-video",
+            )
+        return
     if (use_mkvmerge and not is_mkvmerge_available()) or not is_ffmpeg_available():
         error_strs = [
             "{EXTERN_TOOL} is required for split-video{EXTRA_ARGS}.".format(
@@ -84,9 +148,15 @@ class CliContext:
         self.quiet_mode: bool | None = None
         self.scene_manager: SceneManager | None = None
         self.stats_manager: StatsManager | None = None
+        self.profile: DetectionProfile | None = None
         self.save_images: bool = False  # True if the save-images command was specified
         self.save_images_result: ty.Any = (None, None)  # Result of save-images used by save-html
 
+        # Batch Mode:
+        self.batch_inputs: list[str] = []  # Videos to process (--batch)
+        self.batch_jobs: int = 1  # Videos to process concurrently (-j/--jobs)
+        self.batch_input: str | None = None  # Video this context processes, if part of a batch
+
         # Input:
         self.video_stream: VideoStream | None = None
         self.load_scenes_input: str | None = None  # load-scenes -i/--input
@@ -103,11 +173,28 @@ class CliContext:
         self.default_detector: tuple[type[SceneDetector], dict[str, ty.Any]] | None = None
         self.output: str | None = None
         self.stats_file_path: str | None = None
+        self.profile_file_path: str | None = None
 
         # Output Commands (e.g. split-video, save-images):
         # Commands to run after the detection pipeline. Stored as (callback, args) and invoked with
         # the results of the detection pipeline by the controller.
         self.commands: list[tuple[ty.Callable, dict[str, ty.Any]]] = []
+        # Arguments used to open the scene list file if written during detection (list-scenes
+        # --stream), otherwise None.
+        self.stream_scene_list: dict[str, ty.Any] | None = None
+        # Arguments used to open the raw frame file that processed frames are written to during
+        # detection (save-raw), otherwise None.
+        self.save_raw: dict[str, ty.Any] | None = None
+
+    def make_batch_context(self, input_path: str) -> "CliContext":
+        """Create a context to process `input_path` as part of this context's batch. Logging and
+        the config file are already initialized, so the new context shares them. When more than
+        one video is processed at a time, per-video progress bars and output are disabled."""
+        context = CliContext()
+        context.config = self.config
+        context.quiet_mode = self.quiet_mode or self.batch_jobs > 1
+        context.batch_input = input_path
+        return context
 
     def add_command(self, command: ty.Callable, command_args: dict[str, ty.Any]):
         """Add `command` to the processing pipeline. Will be called after processing the input."""
@@ -184,13 +271,17 @@ class CliContext:
         drop_short_scenes: bool | None,
         merge_last_scene: bool | None,
         backend: str | None,
-        crop: tuple[int, int, int, int] | None,
+        crop: str | None,
         downscale: int | None,
         quiet: bool,
         logfile: str | None,
         config: str | None,
         stats: str | None,
         verbosity: str | None,
+        batch: str | None = None,
+        jobs: int | None = None,
+        profile: str | None = None,
+        adaptive_skip: bool | None = None,
     ):
         """Parse all global options/arguments passed to the main scenedetect command,
         before other sub-commands (e.g. this function processes the [options] when calling
@@ -201,47 +292,14 @@ class CliContext:
             click.Abort: Fatal initialization failure.
         """
 
-        # TODO(v1.0): Make the stats value optional (e.g. allow -s only), and allow use of
-        # $VIDEO_NAME macro in the name.  Default to $VIDEO_NAME.csv.
-
-        # The `scenedetect` command was just started, let's initialize logging and try to load any
-        # config files that were specified.
-        init_log: list = []
-        try:
-            init_failure = not self.config.initialized
-            init_log = self.config.get_init_log()
-            quiet = not init_failure and quiet
-            self._initialize_logging(quiet, verbosity, logfile)
-
-            # Configuration file was specified via CLI argument -c/--config.
-            if config and not init_failure:
-                self.config = ConfigRegistry(config)
-                init_log += self.config.get_init_log()
-                # Re-initialize logger with the correct verbosity.
-                if verbosity is None and not self.config.is_default("global", "verbosity"):
-                    verbosity_str = self.config.get_value("global", "verbosity")
-                    assert verbosity_str in CHOICE_MAP["global"]["verbosity"]
-                    self.quiet_mode = False
-                    self._initialize_logging(verbosity=verbosity_str, logfile=logfile)
-
-        except ConfigLoadFailure as ex:
-            init_failure = True
-            init_log += ex.init_log
-            if ex.reason is not None:
-                init_log += [
-                    (logging.ERROR, "Error: {}".format(str(ex.reason).replace("\t", "  ")))
-                ]
-        finally:
-            # Make sure we print the version number even on any kind of init failure.
-            logger.info("PySceneDetect %s", scenedetect.__version__)
-            for log_level, log_str in init_log:
-                logger.log(log_level, log_str)
-            if init_failure:
-                logger.critical("Error processing configuration file.")
-                raise SystemExit(1)
+        # TODO(v1.0): Make the stats value optional (e.g. allow -s only). Default to
+        # $VIDEO_NAME.csv.
 
-        if self.config.config_dict:
-            logger.debug("Current configuration:\n%s", str(self.config.config_dict).encode("utf-8"))
+        # Videos in a batch share the logging and config of the context that created them.
+        if self.batch_input is not None:
+            input_path = self.batch_input
+        else:
+            self._initialize(quiet, logfile, config, verbosity)
 
         logger.debug("Parsing program options.")
         if stats is not None and frame_skip:
@@ -255,12 +313,37 @@ class CliContext:
                 param_hint="frame skip + stats file",
             )
 
+        # Expand --batch into the list of videos to process. Each one is processed in a context
+        # created by `make_batch_context`, so there is no video to open for this one.
+        if batch is not None and self.batch_input is None:
+            if input_path is not None:
+                raise click.BadParameter(
+                    "The -i/--input and --batch options cannot be combined.", param_hint="--batch"
+                )
+            if stats_file is not None and "$VIDEO_NAME" not in stats_file:
+                raise click.BadParameter(
+                    "The -s/--stats path must contain $VIDEO_NAME when using --batch.",
+                    param_hint="-s/--stats",
+                )
+            if profile is not None and "$VIDEO_NAME" not in profile:
+                raise click.BadParameter(
+                    "The --profile path must contain $VIDEO_NAME when using --batch.",
+                    param_hint="--profile",
+                )
+            self.batch_inputs = expand_batch_inputs(batch)
+            self.batch_jobs = self.config.get_value("global", "jobs", jobs)
+            logger.debug(
+                "Batch of %d videos, %d at a time.", len(self.batch_inputs), self.batch_jobs
+            )
+            return
+
         # Handle case where -i/--input was not specified (e.g. for the `help` command).
         if input_path is None:
             return
 
         # Load the input video to obtain a time base for parsing timecodes.
         self._open_video_stream(input_path, frame_rate, backend)
+        assert self.video_stream is not None
 
         self.output = self.config.get_value("global", "output", output)
         if self.output:
@@ -281,9 +364,18 @@ class CliContext:
 
         # Create StatsManager if --stats is specified.
         if stats_file:
-            self.stats_file_path = stats_file
+            self.stats_file_path = Template(stats_file).safe_substitute(
+                VIDEO_NAME=self.video_stream.name
+            )
             self.stats_manager = StatsManager()
 
+        # Create DetectionProfile if --profile is specified.
+        if profile:
+            self.profile_file_path = Template(profile).safe_substitute(
+                VIDEO_NAME=self.video_stream.name
+            )
+            self.profile = DetectionProfile()
+
         # Initialize default detector with values in the config file.
         default_detector = self.config.get_value("global", "default-detector")
         if default_detector == "detect-adaptive":
@@ -300,7 +392,7 @@ class CliContext:
             raise click.BadParameter("Unknown detector type!", param_hint="default-detector")
 
         logger.debug("Initializing SceneManager.")
-        scene_manager = SceneManager(self.stats_manager)
+        scene_manager = SceneManager(self.stats_manager, profile=self.profile)
 
         if downscale is None and self.config.is_default("global", "downscale"):
             scene_manager.auto_downscale = True
@@ -313,10 +405,18 @@ class CliContext:
                 logger.debug(str(ex))
                 raise click.BadParameter(str(ex), param_hint="downscale factor") from ex
         scene_manager.interpolation = self.config.get_value("global", "downscale-method")
+        scene_manager.subsampling = self.config.get_value("global", "subsampling")
+        scene_manager.adaptive_frame_skip = self.config.get_value(
+            "global", "adaptive-skip", adaptive_skip
+        )
 
         # If crop was set, make sure it's valid (e.g. it should cover at least a single pixel).
         try:
-            crop = self.config.get_value("global", "crop", CropValue(crop))
+            crop = self.config.get_value(
+                "global", "crop", CropValue(crop) if crop is not None else None
+            )
+            if crop == CropValue.AUTO:
+                crop = self._detect_crop_region()
             if crop is not None:
                 (min_x, min_y) = crop[0:2]
                 assert self.video_stream is not None
@@ -454,6 +554,55 @@ class CliContext:
     # Private Methods
     #
 
+    def _initialize(
+        self,
+        quiet: bool,
+        logfile: str | None,
+        config: str | None,
+        verbosity: str | None,
+    ):
+        """Initialize logging and load any config file specified with -c/--config.
+
+        Raises:
+            SystemExit: The config file could not be loaded.
+        """
+        init_log: list = []
+        try:
+            init_failure = not self.config.initialized
+            init_log = self.config.get_init_log()
+            quiet = not init_failure and quiet
+            self._initialize_logging(quiet, verbosity, logfile)
+
+            # Configuration file was specified via CLI argument -c/--config.
+            if config and not init_failure:
+                self.config = ConfigRegistry(config)
+                init_log += self.config.get_init_log()
+                # Re-initialize logger with the correct verbosity.
+                if verbosity is None and not self.config.is_default("global", "verbosity"):
+                    verbosity_str = self.config.get_value("global", "verbosity")
+                    assert verbosity_str in CHOICE_MAP["global"]["verbosity"]
+                    self.quiet_mode = False
+                    self._initialize_logging(verbosity=verbosity_str, logfile=logfile)
+
+        except ConfigLoadFailure as ex:
+            init_failure = True
+            init_log += ex.init_log
+            if ex.reason is not None:
+                init_log += [
+                    (logging.ERROR, "Error: {}".format(str(ex.reason).replace("\t", "  ")))
+                ]
+        finally:
+            # Make sure we print the version number even on any kind of init failure.
+            logger.info("PySceneDetect %s", scenedetect.__version__)
+            for log_level, log_str in init_log:
+                logger.log(log_level, log_str)
+            if init_failure:
+                logger.critical("Error processing configuration file.")
+                raise SystemExit(1)
+
+        if self.config.config_dict:
+            logger.debug("Current configuration:\n%s", str(self.config.config_dict).encode("utf-8"))
+
     def _initialize_logging(
         self,
         quiet: bool | None = None,
@@ -487,6 +636,19 @@ class CliContext:
         # Initialize logger with the set CLI args / user configuration.
         init_logger(log_level=curr_verbosity, show_stdout=not self.quiet_mode, log_file=logfile)
 
+    def _detect_crop_region(self) -> tuple[int, int, int, int] | None:
+        """Find the region of the video inside any black bars for `--crop auto`."""
+        assert self.video_stream is not None
+        if not self.video_stream.is_seekable or self.video_stream.duration is None:
+            logger.warning("Cannot detect crop region of this input, video will not be cropped.")
+            return None
+        crop = detect_crop_region(self.video_stream)
+        if crop is None:
+            logger.info("No black bars detected, video will not be cropped.")
+        else:
+            logger.info(f"Detected crop region: {CropValue(crop)}")
+        return crop
+
     def _open_video_stream(
         self,
         input_path: str,
@@ -11,37 +11,47 @@
 #
 """Logic for the PySceneDetect command."""
 
+import contextlib
 import csv
 import logging
 import os
 import time
+import typing as ty
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
+import click
+
+from scenedetect._cli.commands import open_raw_video, open_scene_list
 from scenedetect._cli.context import CliContext
-from scenedetect.backends import VideoStreamCv2, VideoStreamMoviePy
+from scenedetect.backends import VideoStreamCv2
 from scenedetect.common import FrameTimecode
-from scenedetect.platform import get_and_create_path
+from scenedetect.platform import DEBUG_MODE, get_and_create_path, tqdm
 from scenedetect.scene_manager import CutList, SceneList, get_scenes_from_cuts
 from scenedetect.video_stream import SeekError
 
 logger = logging.getLogger("pyscenedetect")
 
 
-def run_scenedetect(context: CliContext):
+def run_scenedetect(context: CliContext) -> tuple[SceneList, CutList] | None:
     """Perform main CLI application control logic. Run once all command-line options and
     configuration file options have been validated.
 
     Arguments:
         context: Prevalidated command-line option context to use for processing.
+
+    Returns:
+        The scene list and cut list that were passed to each command, or None if no input was
+        specified or detection failed.
     """
     # No input may have been specified depending on the commands/args that were used.
     logger.debug("Running controller.")
     if context.scene_manager is None:
         logger.debug("No input specified.")
-        return
+        return None
 
     # Suppress warnings when reading past EOF in MoviePy (#461).
-    if VideoStreamMoviePy and isinstance(context.video_stream, VideoStreamMoviePy):
+    if context.video_stream is not None and context.video_stream.BACKEND_NAME == "moviepy":
         is_debug = context.config.get_value("global", "verbosity") != "debug"
         if not is_debug:
             warnings.filterwarnings("ignore", module="moviepy")
@@ -51,6 +61,8 @@ def run_scenedetect(context: CliContext):
         logger.info("Skipping detection, loading scenes from: %s", context.load_scenes_input)
         if context.stats_file_path:
             logger.warning("WARNING: -s/--stats will be ignored due to load-scenes.")
+        if context.save_raw is not None:
+            logger.warning("WARNING: save-raw will be ignored due to load-scenes.")
         scenes, cuts = _load_scenes(context)
         scenes = _postprocess_scene_list(context, scenes)
         logger.info("Loaded %d scenes.", len(scenes))
@@ -58,11 +70,12 @@ def run_scenedetect(context: CliContext):
         # Perform scene detection on input.
         result = _detect(context)
         if result is None:
-            return
+            return None
         scenes, cuts = result
         scenes = _postprocess_scene_list(context, scenes)
-        # Handle -s/--stats option.
+        # Handle -s/--stats and --profile options.
         _save_stats(context)
+        _save_profile(context)
         if scenes:
             logger.info(
                 "Detected %d scenes, average shot length %.1f seconds.",
@@ -76,6 +89,56 @@ def run_scenedetect(context: CliContext):
     # Handle post-processing commands the user wants to run (see scenedetect._cli.commands).
     for handler, kwargs in context.commands:
         handler(context=context, scenes=scenes, cuts=cuts, **kwargs)
+    return scenes, cuts
+
+
+def run_batch(context: CliContext, parse_args: ty.Callable[[CliContext], None]) -> int:
+    """Process every video in the batch specified with --batch. Each video is processed
+    independently as if it were specified with -i/--input, with up to `context.batch_jobs` videos
+    being processed concurrently. A video failing to process does not stop the batch.
+
+    Arguments:
+        context: Context of the command line which specified the batch.
+        parse_args: Parses the command line into the context of a single video in the batch.
+
+    Returns:
+        Number of videos which failed to process.
+    """
+    num_videos = len(context.batch_inputs)
+    logger.info("Processing %d videos, %d at a time.", num_videos, context.batch_jobs)
+
+    def process(input_path: str) -> bool:
+        video_context = context.make_batch_context(input_path)
+        try:
+            parse_args(video_context)
+            run_scenedetect(video_context)
+        except click.ClickException as ex:
+            logger.error("Failed to process %s: %s", input_path, ex.format_message())
+            return False
+        except Exception as ex:
+            if DEBUG_MODE:
+                raise
+            logger.error("Failed to process %s: %s", input_path, ex)
+            return False
+        return True
+
+    progress_bar = None
+    if not context.quiet_mode:
+        progress_bar = tqdm(total=num_videos, unit="videos", dynamic_ncols=True)
+    num_failed = 0
+    with ThreadPoolExecutor(max_workers=context.batch_jobs) as executor:
+        for success in executor.map(process, context.batch_inputs):
+            num_failed += not success
+            if progress_bar is not None:
+                progress_bar.update(1)
+    if progress_bar is not None:
+        progress_bar.close()
+
+    if num_failed:
+        logger.error("Failed to process %d of %d videos.", num_failed, num_videos)
+    else:
+        logger.info("Processed %d videos.", num_videos)
+    return num_failed
 
 
 def _postprocess_scene_list(context: CliContext, scene_list: SceneList) -> SceneList:
@@ -122,13 +185,17 @@ def _detect(context: CliContext) -> tuple[SceneList, CutList] | None:
             )
             return None
 
-    num_frames = context.scene_manager.detect_scenes(
-        video=context.video_stream,
-        duration=context.duration,
-        end_time=context.end_time,
-        frame_skip=context.frame_skip,
-        show_progress=not context.quiet_mode,
-    )
+    with _save_raw(context):
+        if context.stream_scene_list is None:
+            num_frames = context.scene_manager.detect_scenes(
+                video=context.video_stream,
+                duration=context.duration,
+                end_time=context.end_time,
+                frame_skip=context.frame_skip,
+                show_progress=not context.quiet_mode,
+            )
+        else:
+            num_frames = _detect_streaming(context)
 
     # Handle case where video failure is most likely due to multiple audio tracks (#179).
     # TODO(https://scenedetect.com/issues/380): Ensure this does not erroneusly fire.
@@ -160,6 +227,50 @@ def _detect(context: CliContext) -> tuple[SceneList, CutList] | None:
     return scene_list, cut_list
 
 
+def _detect_streaming(context: CliContext) -> int:
+    """Detect scenes while writing each one to the `list-scenes --stream` file as soon as it is
+    final. Returns the number of frames processed."""
+    assert context.scene_manager is not None
+    assert context.video_stream is not None
+    assert context.stream_scene_list is not None
+    start_frame_num = context.video_stream.frame_number
+    # --merge-last-scene can change the last two scenes, so they are held back until the end.
+    num_held = 2 if context.merge_last_scene else 0
+    held: SceneList = []
+    with open_scene_list(context, **context.stream_scene_list) as writer:
+        for scene in context.scene_manager.stream_scenes(
+            video=context.video_stream,
+            duration=context.duration,
+            end_time=context.end_time,
+            frame_skip=context.frame_skip,
+            show_progress=not context.quiet_mode,
+            start_in_scene=True,
+        ):
+            held.append(scene)
+            while len(held) > num_held:
+                for kept in _postprocess_scene_list(context, [held.pop(0)]):
+                    writer.write(kept)
+        for kept in _postprocess_scene_list(context, held):
+            writer.write(kept)
+    return context.video_stream.frame_number - start_frame_num
+
+
+@contextlib.contextmanager
+def _save_raw(context: CliContext) -> ty.Iterator[None]:
+    """Write each frame to the `save-raw` file as it is processed, if required."""
+    if context.save_raw is None:
+        yield
+        return
+    assert context.scene_manager is not None
+    with open_raw_video(context, **context.save_raw) as writer:
+        context.scene_manager.frame_callback = writer.write
+        try:
+            yield
+        finally:
+            context.scene_manager.frame_callback = None
+    logger.info("Wrote %d frames to raw file.", writer.num_frames)
+
+
 def _save_stats(context: CliContext) -> None:
     """Handles saving the statsfile if -s/--stats was specified."""
     if not context.stats_file_path:
@@ -174,6 +285,17 @@ def _save_stats(context: CliContext) -> None:
         logger.debug("No frame metrics updated, skipping update of the stats file.")
 
 
+def _save_profile(context: CliContext) -> None:
+    """Handles saving the profile if --profile was specified."""
+    if not context.profile_file_path:
+        return
+    assert context.profile is not None
+    logger.info("Time spent in each stage of detection:\n%s", context.profile.summary())
+    path = get_and_create_path(context.profile_file_path, context.output)
+    logger.info("Saving profile to: %s", path)
+    context.profile.save_to_json(path)
+
+
 def _load_scenes(context: CliContext) -> tuple[SceneList, CutList]:
     assert context.load_scenes_input
     assert context.load_scenes_column_name is not None
@@ -0,0 +1,288 @@
+#
+#            PySceneDetect: Python-Based Video Scene Detector
+#   -------------------------------------------------------------------
+#     [  Site:    https://scenedetect.com                           ]
+#     [  Docs:    https://scenedetect.com/docs/                     ]
+#     [  Github:  https://github.com/Breakthrough/PySceneDetect/    ]
+#
+# Copyright (C) 2026 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""Detection server used by the `serve` command.
+
+The server keeps the interpreter (and any models or libraries it has loaded) warm between jobs.
+Jobs are submitted over HTTP as JSON, and are parsed and run exactly like the command line:
+
+    POST /jobs      {"input": "video.mp4", "args": ["detect-content", "list-scenes"], "wait": true}
+    GET  /jobs/ID   Status of a job, including the scene list once it is done.
+
+`args` are the options and commands that would follow `-i/--input` on the command line. Options
+which are shared by every job (e.g. -c/--config and -l/--logfile, see `SHARED_OPTIONS`) are set
+when starting the server, and jobs which include them are rejected. Output commands write files as
+usual (relative to the server's working directory unless -o/--output is in `args`). Jobs are queued
+and run by a fixed number of worker threads.
+"""
+
+import json
+import logging
+import queue
+import threading
+import typing as ty
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import click
+from click.core import ParameterSource
+
+from scenedetect._cli.context import CliContext
+from scenedetect._cli.controller import run_scenedetect
+from scenedetect.common import FrameTimecode
+from scenedetect.platform import DEBUG_MODE
+
+logger = logging.getLogger("pyscenedetect")
+
+MAX_FINISHED_JOBS = 1000
+"""Number of finished jobs to keep the results of. Older ones are discarded first."""
+
+MAX_REQUEST_SIZE = 1024 * 1024
+"""Maximum size of a request body in bytes."""
+
+SHARED_OPTIONS = ("input", "batch", "jobs", "config", "verbosity", "logfile", "quiet")
+"""Options of the root command which are set when the server starts and shared by every job, so
+they cannot be set in the `args` of a job."""
+
+
+@dataclass
+class Job:
+    """A detection job submitted to the server."""
+
+    id: str
+    input: str
+    args: list[str]
+    status: str = "queued"
+    """One of: queued, running, done, failed."""
+    scenes: list[tuple[FrameTimecode, FrameTimecode]] | None = None
+    cuts: list[FrameTimecode] | None = None
+    error: str | None = None
+    finished: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def to_dict(self) -> dict[str, ty.Any]:
+        """Get the job as a JSON-serializable dict."""
+
+        def timecode(value: FrameTimecode) -> dict[str, ty.Any]:
+            return {
+                "frame": value.frame_num,
+                "seconds": value.seconds,
+                "timecode": value.get_timecode(),
+            }
+
+        result: dict[str, ty.Any] = {"id": self.id, "input": self.input, "status": self.status}
+        if self.scenes is not None:
+            result["scenes"] = [
+                {"start": timecode(start), "end": timecode(end)} for start, end in self.scenes
+            ]
+        if self.cuts is not None:
+            result["cuts"] = [timecode(cut) for cut in self.cuts]
+        if self.error is not None:
+            result["error"] = self.error
+        return result
+
+
+class DetectionServer(ThreadingHTTPServer):
+    """HTTP server which queues detection jobs and runs them on a pool of worker threads.
+
+    Arguments:
+        context: Context of the `serve` command line. Jobs share its config and logging.
+        command: Command group used to parse the arguments of each job.
+        address: Host and port to listen on.
+        jobs: Number of jobs to run concurrently.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        context: CliContext,
+        command: click.Command,
+        address: tuple[str, int],
+        jobs: int = 1,
+    ):
+        if jobs < 1:
+            raise ValueError("jobs must be at least 1")
+        super().__init__(address, _RequestHandler)
+        self._context = context
+        self._command = command
+        self._queue: queue.SimpleQueue[Job | None] = queue.SimpleQueue()
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._lock = threading.Lock()
+        self._workers = [
+            threading.Thread(target=self._run_worker, name=f"scenedetect-job-{i}", daemon=True)
+            for i in range(jobs)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, input_path: str, args: list[str]) -> Job:
+        """Queue a job to process `input_path` with the options and commands in `args`.
+
+        Raises:
+            ValueError: `args` includes one of the `SHARED_OPTIONS`.
+        """
+        self._check_args(args)
+        job = Job(id=uuid.uuid4().hex, input=input_path, args=list(args))
+        with self._lock:
+            self._jobs[job.id] = job
+        self._queue.put(job)
+        logger.debug("Queued job %s: %s %s", job.id, input_path, " ".join(args))
+        return job
+
+    def get_job(self, job_id: str) -> Job | None:
+        """Get a job that was submitted to this server, or None if it is unknown or was
+        discarded."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def server_close(self):
+        """Discard any queued jobs, stop the worker threads once running jobs finish, and close
+        the server."""
+        while True:
+            try:
+                job = self._queue.get(block=False)
+            except queue.Empty:
+                break
+            if job is not None:
+                job.status, job.error = "failed", "Server stopped."
+                job.finished.set()
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        super().server_close()
+
+    def _check_args(self, args: list[str]):
+        try:
+            context = self._command.make_context("scenedetect", list(args), resilient_parsing=True)
+        except click.ClickException:
+            # Any other errors are reported when the job runs.
+            return
+        for param in self._command.params:
+            if (
+                param.name in SHARED_OPTIONS
+                and context.get_parameter_source(param.name) == ParameterSource.COMMANDLINE
+            ):
+                option = "/".join(sorted(param.opts, key=len))
+                raise ValueError(f"{option} is shared by all jobs and cannot be set in args.")
+
+    def _run_worker(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            job.status = "running"
+            self._run_job(job)
+            job.finished.set()
+            with self._lock:
+                # Discard the oldest finished jobs so the server doesn't grow without bound.
+                finished = [
+                    job_id for job_id, other in self._jobs.items() if other.finished.is_set()
+                ]
+                for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+                    del self._jobs[job_id]
+
+    def _run_job(self, job: Job):
+        context = self._context.make_batch_context(job.input)
+        # Jobs run concurrently and nobody is watching the terminal for progress.
+        context.quiet_mode = True
+        try:
+            self._command.main(job.args, obj=context, standalone_mode=False)
+            result = run_scenedetect(context)
+        except click.ClickException as ex:
+            job.status, job.error = "failed", ex.format_message()
+        except Exception as ex:
+            if DEBUG_MODE:
+                logger.exception("Job %s failed:", job.id)
+            job.status, job.error = "failed", str(ex)
+        else:
+            if result is None:
+                job.status, job.error = "failed", "Failed to detect scenes."
+            else:
+                job.status = "done"
+                job.scenes, job.cuts = result
+        if job.error is not None:
+            logger.error("Failed to process %s: %s", job.input, job.error)
+        else:
+            logger.info("Processed %s (job %s).", job.input, job.id)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: DetectionServer
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] != "jobs":
+            self._send(HTTPStatus.NOT_FOUND, {"error": "Not found."})
+            return
+        job = self.server.get_job(parts[1])
+        if job is None:
+            self._send(HTTPStatus.NOT_FOUND, {"error": "Unknown job."})
+            return
+        self._send(HTTPStatus.OK, job.to_dict())
+
+    def do_POST(self):
+        if self.path.strip("/") != "jobs":
+            self._send(HTTPStatus.NOT_FOUND, {"error": "Not found."})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if length > MAX_REQUEST_SIZE:
+                raise ValueError("Request is too large.")
+            request = json.loads(self.rfile.read(length))
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object.")
+            input_path = request.get("input")
+            args = request.get("args", [])
+            if not isinstance(input_path, str) or not input_path:
+                raise ValueError("input must be a path to a video.")
+            if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+                raise ValueError("args must be a list of strings.")
+            job = self.server.submit(input_path, args)
+        except ValueError as ex:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": str(ex)})
+            return
+        if request.get("wait"):
+            job.finished.wait()
+            self._send(HTTPStatus.OK, job.to_dict())
+        else:
+            self._send(HTTPStatus.ACCEPTED, job.to_dict())
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send(self, status: HTTPStatus, body: dict[str, ty.Any]):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def run_server(context: CliContext, command: click.Command, host: str, port: int, jobs: int):
+    """Run a `DetectionServer` until interrupted (e.g. with Ctrl+C)."""
+    try:
+        server = DetectionServer(context, command, (host, port), jobs=jobs)
+    except OSError as ex:
+        raise click.ClickException(f"Failed to start server on {host}:{port}: {ex}") from ex
+    with server:
+        bound_host, bound_port = server.server_address[:2]
+        logger.info(
+            "Accepting jobs on http://%s:%d/jobs (%d at a time).", bound_host, bound_port, jobs
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Stopping server.")
@@ -17,6 +17,18 @@ read by an independent detection thread. The source is paced by the slowest cons
 (blocking ``put`` into bounded per-consumer queues), so peak memory is bounded by
 ``n * prefetch`` frames.
 
+Frames are shared between consumers without copying, so every frame handed out is
+read-only. Frame buffers are reference counted: once every consumer has dropped its last
+reference to a frame (including any views of it, e.g. a crop), the buffer is returned to
+a small pool and the source decodes the next frame into it instead of allocating a new
+one. Only backends which implement ``VideoStream._read_into`` (e.g. OpenCV) can decode
+into a recycled buffer; other backends still share frames zero-copy.
+
+Consumers can also share preprocessing: a :class:`PreprocessSpec` (crop, downscale,
+interpolation, pixel format) is applied once per frame on the reader thread, and consumers
+with equal specs receive the same processed frame. The consumers' ``SceneManager`` should
+then be configured not to crop or downscale again (see :meth:`PreprocessSpec.for_frame_size`).
+
 Internal API (underscore-prefixed module). Not part of the public surface.
 """
 
@@ -25,17 +37,95 @@ from __future__ import annotations
 import contextlib
 import queue
 import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
 from fractions import Fraction
 
+import cv2
 import numpy as np
 
-from scenedetect.common import FrameTimecode, TimecodeLike
+from scenedetect._frame_pool import FramePool, PooledFrame
+from scenedetect.common import CropRegion, FrameTimecode, Interpolation, Subsampling, TimecodeLike
+from scenedetect.scene_manager import compute_downscale_factor, downscale_frame, downscaled_size
 from scenedetect.video_stream import SeekError, VideoStream
 
 _EOF = object()
 """Sentinel placed on each consumer queue when the source reaches end-of-stream."""
 
 
+@dataclass(frozen=True)
+class PreprocessSpec:
+    """Preprocessing applied to each frame before it is handed to a consumer. Matches what
+    :class:`SceneManager` does itself when its ``crop`` and ``downscale`` are set."""
+
+    crop: CropRegion | None = None
+    """Region to crop to, as inclusive ``(X0, Y0, X1, Y1)`` like :attr:`SceneManager.crop`."""
+    downscale: float = 1.0
+    """Factor to downscale each frame by after cropping. 1 indicates no scaling."""
+    interpolation: Interpolation = Interpolation.LINEAR
+    """Interpolation method used when downscaling with :attr:`Subsampling.RESIZE`."""
+    subsampling: Subsampling = Subsampling.RESIZE
+    """Method used to downscale each frame, like :attr:`SceneManager.subsampling`."""
+    pixel_format: str = "bgr"
+    """Either ``"bgr"`` (as decoded) or ``"gray"`` (single channel)."""
+
+    def __post_init__(self):
+        if self.downscale < 1.0:
+            raise ValueError("downscale must be >= 1")
+        if self.pixel_format not in ("bgr", "gray"):
+            raise ValueError(f"Unknown pixel format: {self.pixel_format}")
+        if self.crop is not None:
+            x0, y0, x1, y1 = self.crop
+            if min(x0, y0) < 0 or x1 < x0 or y1 < y0:
+                raise ValueError(f"Invalid crop region: {self.crop}")
+
+    @staticmethod
+    def for_frame_size(
+        frame_size: tuple[int, int],
+        crop: CropRegion | None = None,
+        interpolation: Interpolation = Interpolation.LINEAR,
+        subsampling: Subsampling = Subsampling.RESIZE,
+    ) -> PreprocessSpec:
+        """Create a spec with the downscale factor :class:`SceneManager` would pick with
+        ``auto_downscale`` set, for frames of ``frame_size`` (width, height)."""
+        if crop is not None:
+            x0, y0, x1, y1 = crop
+            frame_size = (
+                min(x1 + 1, frame_size[0]) - x0,
+                min(y1 + 1, frame_size[1]) - y0,
+            )
+        return PreprocessSpec(
+            crop=crop,
+            downscale=float(compute_downscale_factor(max(frame_size))),
+            interpolation=interpolation,
+            subsampling=subsampling,
+        )
+
+    @property
+    def is_identity(self) -> bool:
+        """True if applying this spec leaves frames unchanged."""
+        return self.crop is None and self.downscale <= 1.0 and self.pixel_format == "bgr"
+
+    def output_size(self, frame_size: tuple[int, int]) -> tuple[int, int]:
+        """Size (width, height) of frames of ``frame_size`` after applying this spec."""
+        width, height = frame_size
+        if self.crop is not None:
+            x0, y0, x1, y1 = self.crop
+            width = max(0, min(x1 + 1, width) - x0)
+            height = max(0, min(y1 + 1, height) - y0)
+        return downscaled_size((width, height), self.downscale, self.subsampling)
+
+    def apply(self, frame: np.ndarray) -> np.ndarray:
+        """Apply this spec to a BGR frame."""
+        if self.crop is not None:
+            x0, y0, x1, y1 = self.crop
+            frame = frame[y0 : y1 + 1, x0 : x1 + 1]
+        frame = downscale_frame(frame, self.downscale, self.subsampling, self.interpolation)
+        if self.pixel_format == "gray":
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return frame
+
+
 class FanOutVideoStream:
     """Drives one source :class:`VideoStream` and fans frames out to N consumer streams.
 
@@ -58,7 +148,14 @@ class FanOutVideoStream:
     ``FanOutVideoStream`` for the next chunk.
     """
 
-    def __init__(self, source: VideoStream, n: int, prefetch: int = 4):
+    def __init__(
+        self,
+        source: VideoStream,
+        n: int,
+        prefetch: int = 4,
+        pool_size: int | None = None,
+        preprocess: PreprocessSpec | Sequence[PreprocessSpec | None] | None = None,
+    ):
         """
         Arguments:
             source: Already-opened ``VideoStream`` to read from.
@@ -66,15 +163,38 @@ class FanOutVideoStream:
             prefetch: Per-consumer queue depth. ``0`` is rendezvous (every frame waits
                 for every consumer to take it); 4-8 absorbs jitter between consumers
                 at the cost of up to ``n * prefetch`` resident frames.
+            pool_size: Maximum number of released frame buffers kept for the source to
+                decode into. ``None`` sizes the pool from ``prefetch``; ``0`` disables
+                recycling (frames are still shared read-only).
+            preprocess: Preprocessing to apply on the reader thread, either one spec for
+                every consumer or a sequence of ``n`` specs (``None`` for unprocessed
+                frames). Consumers with equal specs share each processed frame.
         """
         if n < 1:
             raise ValueError("n must be at least 1")
         if prefetch < 0:
             raise ValueError("prefetch must be >= 0")
+        if pool_size is not None and pool_size < 0:
+            raise ValueError("pool_size must be >= 0")
+        if preprocess is None or isinstance(preprocess, PreprocessSpec):
+            preprocess = [preprocess] * n
+        if len(preprocess) != n:
+            raise ValueError("preprocess must have one spec per consumer")
+        # Identity specs are dropped so consumers without preprocessing share the raw frame.
+        self._specs: list[PreprocessSpec | None] = [
+            None if spec is None or spec.is_identity else spec for spec in preprocess
+        ]
+        # Distinct specs in first-use order, each applied once per frame.
+        self._groups: list[PreprocessSpec | None] = list(dict.fromkeys(self._specs))
         self._source = source
         # queue.Queue(maxsize=0) means unbounded, which would defeat back-pressure.
         # prefetch=0 therefore maps to a 1-deep buffer (shallow, not strict rendezvous).
         qsize = prefetch if prefetch > 0 else 1
+        # Frames in flight: up to qsize queued per consumer plus a few held by the consumers
+        # themselves (e.g. in a SceneManager's own frame queue).
+        if pool_size is None:
+            pool_size = 2 * qsize + 2
+        self._pool: FramePool | None = FramePool(pool_size) if pool_size > 0 else None
         self._queues: list[queue.Queue] = [queue.Queue(maxsize=qsize) for _ in range(n)]
         self._consumers: list[_FanOutConsumer] = [_FanOutConsumer(self, i) for i in range(n)]
         self._stop = threading.Event()
@@ -120,22 +240,55 @@ class FanOutVideoStream:
         if self._reader is not None:
             self._reader.join(timeout=5.0)
 
+    def _read_frame(self) -> np.ndarray | bool:
+        """Decode the next frame from the source, into a recycled buffer if one is free."""
+        if self._pool is None:
+            return self._source.read()
+        buffer = self._pool.acquire()
+        if buffer is None:
+            return self._source.read()
+        frame = self._source._read_into(buffer)
+        if frame is not buffer:
+            # The source can't decode into an existing buffer, so recycling only adds overhead.
+            self._pool = None
+        return frame
+
+    def _share_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Make a decoded frame read-only so it can be shared by every consumer."""
+        if self._pool is None or not frame.flags.c_contiguous:
+            frame.flags.writeable = False
+            return frame
+        return np.asarray(PooledFrame(self._pool, frame))
+
+    @staticmethod
+    def _preprocess(frame: np.ndarray, spec: PreprocessSpec | None) -> np.ndarray:
+        if spec is None:
+            return frame
+        processed = spec.apply(frame)
+        processed.flags.writeable = False
+        return processed
+
     def _read_loop(self) -> None:
         try:
             while not self._stop.is_set():
-                frame = self._source.read()
+                frame = self._read_frame()
                 if frame is False:
                     break
+                frame = self._share_frame(frame)
+                processed = {spec: self._preprocess(frame, spec) for spec in self._groups}
                 # Block per-consumer; slowest consumer paces the source.
-                for q in self._queues:
+                for q, spec in zip(self._queues, self._specs, strict=True):
                     while not self._stop.is_set():
                         try:
-                            q.put(frame, timeout=0.1)
+                            q.put(processed[spec], timeout=0.1)
                             break
                         except queue.Full:
                             continue
                     if self._stop.is_set():
                         return
+                # Don't hold on to the last frame while decoding the next one, so its buffer
+                # can be recycled as soon as the consumers are done with it.
+                del frame, processed
         except BaseException as e:
             self._reader_exc = e
         finally:
@@ -157,7 +310,8 @@ class FanOutVideoStream:
 class _FanOutConsumer(VideoStream):
     """One consumer-side handle exposed by :class:`FanOutVideoStream`.
 
-    Forwards constant metadata (path, frame_rate, frame_size, etc.) to the source.
+    Forwards constant metadata (path, frame_rate, etc.) to the source; ``frame_size``
+    reflects this consumer's :class:`PreprocessSpec`, if any.
     Maintains its own ``frame_number`` / ``position`` -- both advance only when this
     consumer calls ``read()``, independent of the source's position or sibling
     consumers.
@@ -193,10 +347,14 @@ class _FanOutConsumer(VideoStream):
 
     @property
     def frame_size(self) -> tuple[int, int]:
-        return self._parent._source.frame_size
+        spec = self._parent._specs[self._index]
+        if spec is None:
+            return self._parent._source.frame_size
+        return spec.output_size(self._parent._source.frame_size)
 
     @property
     def aspect_ratio(self) -> float:
+        # Pixel aspect ratio is unchanged by cropping or uniform downscaling.
         return self._parent._source.aspect_ratio
 
     @property
@@ -0,0 +1,64 @@
+#
+#            PySceneDetect: Python-Based Video Scene Detector
+#   -------------------------------------------------------------------
+#     [  Site:    https://scenedetect.com                           ]
+#     [  Docs:    https://scenedetect.com/docs/                     ]
+#     [  Github:  https://github.com/Breakthrough/PySceneDetect/    ]
+#
+# Copyright (C) 2026 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""Reference counted frame buffers which are reused once nothing refers to them.
+
+A :class:`PooledFrame` wraps a buffer taken from a :class:`FramePool`, and NumPy arrays are
+created from it with ``np.asarray``. The buffer returns to the pool once the last array (or
+view of one) referring to it is dropped, so producers can decode or resize the next frame into
+it instead of allocating a new one. Used by ``SceneManager`` for downscaled frames, and by
+``_fan_out`` for frames shared between consumers.
+
+Internal API (underscore-prefixed module). Not part of the public surface.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+
+import numpy as np
+
+
+class FramePool:
+    """Bounded free-list of frame buffers which can be reused."""
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._free: list[np.ndarray] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> np.ndarray | None:
+        """Take a free buffer, or None if the pool is empty."""
+        with self._lock:
+            return self._free.pop() if self._free else None
+
+    def release(self, buffer: np.ndarray) -> None:
+        """Return a buffer to the pool. Dropped if the pool is already full."""
+        with self._lock:
+            if len(self._free) < self._max_size:
+                self._free.append(buffer)
+
+
+class PooledFrame:
+    """Exports a pooled buffer to NumPy, as a read-only array unless `writeable` is set.
+
+    Arrays created from this object (and any slice or view of them) keep it alive, so the
+    interpreter's reference count tracks every consumer still using the frame. The buffer
+    is released back to the pool once the last of them is dropped.
+    """
+
+    def __init__(self, pool: FramePool, buffer: np.ndarray, writeable: bool = False):
+        interface = dict(buffer.__array_interface__)
+        interface["data"] = (interface["data"][0], not writeable)
+        self.__array_interface__ = interface
+        self._buffer = buffer
+        weakref.finalize(self, pool.release, buffer)
@@ -58,6 +58,17 @@ Multiple videos can be opened as one continuous stream by passing a list of path
 
     video = open_video(["part1.mp4", "part2.mp4"])
 
+Videos can also be decoded once into a raw frame file, which is much faster to read back when
+processing the same video many times (see :mod:`scenedetect.backends.raw`). Raw frame files are
+opened with :class:`VideoStreamRaw <scenedetect.backends.raw.VideoStreamRaw>` by
+:func:`open_video` regardless of the backend specified:
+
+.. code:: python
+
+    from scenedetect.backends.raw import write_raw_video
+    write_raw_video(open_video("video.mp4"), "video.sdraw")
+    video = open_video("video.sdraw")
+
 ===============================================================
 Devices / Cameras / Pipes
 ===============================================================
@@ -91,37 +102,79 @@ examples for details.
 # TODO: Future VideoStream implementations under consideration:
 #  - Nvidia VPF: https://developer.nvidia.com/blog/vpf-hardware-accelerated-video-processing-framework-in-python/
 
+import importlib
+import importlib.util
+import typing as ty
+from collections.abc import Iterator, Mapping
+from logging import getLogger
+
 # OpenCV must be available at minimum.
 from scenedetect.backends.concat import SourceSpan as SourceSpan
 from scenedetect.backends.concat import VideoStreamConcat as VideoStreamConcat
 from scenedetect.backends.opencv import VideoCaptureAdapter as VideoCaptureAdapter
 from scenedetect.backends.opencv import VideoStreamCv2 as VideoStreamCv2
+from scenedetect.backends.raw import VideoStreamRaw as VideoStreamRaw
 
-try:
-    from scenedetect.backends.pyav import VideoStreamAv as VideoStreamAv
-except ImportError:
-    VideoStreamAv = None
-
-try:
-    from scenedetect.backends.moviepy import VideoStreamMoviePy as VideoStreamMoviePy
-except ImportError:
-    VideoStreamMoviePy = None
-
-# TODO: Lazy-loading backends would improve startup performance. However, this requires removing
-# some of the re-exported types above from the public API.
-AVAILABLE_BACKENDS: dict[str, type] = {
-    backend.BACKEND_NAME: backend
-    for backend in filter(
-        None,
-        [
-            VideoStreamCv2,
-            VideoStreamAv,
-            VideoStreamMoviePy,
-        ],
-    )
+logger = getLogger("pyscenedetect")
+
+_OPTIONAL_BACKENDS = {
+    "pyav": ("av", "scenedetect.backends.pyav", "VideoStreamAv"),
+    "moviepy": ("moviepy", "scenedetect.backends.moviepy", "VideoStreamMoviePy"),
 }
+"""Backends with optional dependencies, as (package, module, class name) by backend name."""
+
+
+class _AvailableBackends(Mapping[str, type]):
+    """Mapping of backend names to types. Backends with optional dependencies are only imported
+    when they are first looked up, since e.g. PyAV takes longer to import than the rest of this
+    package. A backend is considered available if its dependency is installed. If importing it
+    fails anyways, it is removed and treated as unavailable."""
+
+    def __init__(self):
+        self._backends: dict[str, type | None] = {VideoStreamCv2.BACKEND_NAME: VideoStreamCv2}
+        for name, (package, _, _) in _OPTIONAL_BACKENDS.items():
+            if importlib.util.find_spec(package) is not None:
+                self._backends[name] = None
+
+    def __getitem__(self, name: str) -> type:
+        backend = self._backends[name]
+        if backend is None:
+            (_, module, class_name) = _OPTIONAL_BACKENDS[name]
+            try:
+                backend = getattr(importlib.import_module(module), class_name)
+            except ImportError as ex:
+                logger.debug("Failed to load backend %s: %s", name, str(ex))
+                del self._backends[name]
+                raise KeyError(name) from ex
+            self._backends[name] = backend
+        return backend
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._backends))
+
+    def __len__(self) -> int:
+        return len(self._backends)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._backends
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._backends)})"
+
+
+AVAILABLE_BACKENDS: Mapping[str, type] = _AvailableBackends()
 """All available backends that :func:`scenedetect.open_video` can consider for the `backend`
 parameter. These backends must support construction with the following signature:
 
     BackendType(path: str, frame_rate: ty.Optional[float | Fraction])
+
+Backends other than OpenCV are imported the first time they are looked up.
 """
+
+
+def __getattr__(name: str) -> ty.Any:
+    # `VideoStreamAv` and `VideoStreamMoviePy` are None if the backend is unavailable.
+    for backend_name, (_, _, class_name) in _OPTIONAL_BACKENDS.items():
+        if name == class_name:
+            return AVAILABLE_BACKENDS.get(backend_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
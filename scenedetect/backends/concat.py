@@ -29,11 +29,25 @@ use `position` for accurate PTS-based timing.
 
 :meth:`VideoStreamConcat.map_span` maps a span of the global timeline back to per-source local
 times (e.g. for use as ffmpeg `-ss`/`-t` arguments).
+
+Every input is probed for its metadata (resolution, framerate, duration) when the stream is
+created. This is done concurrently (see the `probe_workers` argument), and the results can be
+cached in a sidecar index file (`metadata_cache`) so re-opening the same set of inputs does not
+need to probe them again. Entries are keyed by path, modification time, and size.
+
+While a source is being read, the next one is opened and its first frames are decoded in a
+background thread (see the `prefetch_frames` argument), so that moving between sources doesn't
+stall the caller while the next file is probed and its decoder is initialized.
 """
 
 import bisect
+import json
 import logging
+import os
+import threading
 import typing as ty
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from fractions import Fraction
 from pathlib import Path
@@ -52,6 +66,15 @@ _GLOBAL_TIME_BASE = Fraction(1, 1000000)
 FRAMERATE_DELTA_TOLERANCE: float = 0.1
 """Tolerance in frames/sec above which a framerate mismatch between inputs is warned about."""
 
+DEFAULT_PREFETCH_FRAMES: int = 4
+"""Default number of frames decoded ahead of time from the next source."""
+
+DEFAULT_PROBE_WORKERS: int = 8
+"""Default maximum number of inputs probed for metadata at the same time."""
+
+_METADATA_CACHE_VERSION = 1
+"""Version of the `metadata_cache` file format. Files with a different version are ignored."""
+
 
 @dataclass(frozen=True)
 class _SourceMetadata:
@@ -85,6 +108,136 @@ def _exact_seconds(timecode: FrameTimecode) -> Fraction:
     return Fraction(timecode.pts) * timecode.time_base
 
 
+class _MetadataCache:
+    """Index of previously probed `_SourceMetadata`, stored as a JSON file.
+
+    Each entry is keyed by the absolute path, modification time and size of the input, as well
+    as the backend and framerate override used to probe it, so any change to the file or the
+    options used to open it results in a cache miss.
+    """
+
+    def __init__(self, path: StrPath):
+        self._path = Path(path)
+        self._entries: dict[str, dict[str, ty.Any]] = {}
+        self._modified = False
+        try:
+            with open(self._path) as cache_file:
+                contents = json.load(cache_file)
+            if contents.get("version") == _METADATA_CACHE_VERSION:
+                self._entries = contents["entries"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, AttributeError) as ex:
+            logger.warning("Ignoring invalid metadata cache %s: %s", self._path, ex)
+
+    @staticmethod
+    def key(path: Path, backend: str, frame_rate: FrameRate | None) -> str | None:
+        """Cache key for `path`, or None if the file can't be accessed."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        rate = "" if frame_rate is None else str(Fraction(frame_rate))
+        return f"{path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}|{backend}|{rate}"
+
+    def get(self, key: str | None, path: Path) -> _SourceMetadata | None:
+        entry = self._entries.get(key) if key is not None else None
+        if entry is None:
+            return None
+        try:
+            return _SourceMetadata(
+                path=path,
+                frame_size=(int(entry["frame_size"][0]), int(entry["frame_size"][1])),
+                frame_rate=Fraction(entry["frame_rate"]),
+                duration=Fraction(entry["duration"]),
+                frames=int(entry["frames"]),
+                aspect_ratio=float(entry["aspect_ratio"]),
+            )
+        except (KeyError, IndexError, TypeError, ValueError, ZeroDivisionError):
+            return None
+
+    def put(self, key: str | None, source: _SourceMetadata):
+        if key is None:
+            return
+        self._entries[key] = {
+            "frame_size": list(source.frame_size),
+            "frame_rate": str(source.frame_rate),
+            "duration": str(source.duration),
+            "frames": source.frames,
+            "aspect_ratio": source.aspect_ratio,
+        }
+        self._modified = True
+
+    def save(self):
+        """Write the index back to disk if any entries were added. Written to a temporary file
+        first so a concurrent reader never sees a partially written index."""
+        if not self._modified:
+            return
+        temp_path = self._path.with_name(self._path.name + ".tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w") as cache_file:
+                json.dump(
+                    {"version": _METADATA_CACHE_VERSION, "entries": self._entries}, cache_file
+                )
+            os.replace(temp_path, self._path)
+            self._modified = False
+        except OSError as ex:
+            logger.warning("Failed to write metadata cache %s: %s", self._path, ex)
+
+
+class _PrefetchedFrame(ty.NamedTuple):
+    """A frame decoded ahead of time, along with the state of the source after reading it."""
+
+    frame: np.ndarray
+    position: FrameTimecode
+    frame_number: int
+
+
+class _SourcePrefetcher:
+    """Opens a source and decodes its first frames in a background thread."""
+
+    def __init__(self, open_source: ty.Callable[[], VideoStream], num_frames: int):
+        self._open_source = open_source
+        self._num_frames = num_frames
+        self._cancelled = threading.Event()
+        self._cap: VideoStream | None = None
+        self._frames: deque[_PrefetchedFrame] = deque()
+        self._exception: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run, name="VideoStreamConcat-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        try:
+            cap = self._open_source()
+            while len(self._frames) < self._num_frames and not self._cancelled.is_set():
+                frame = cap.read()
+                if frame is False:
+                    break
+                assert isinstance(frame, np.ndarray)
+                self._frames.append(_PrefetchedFrame(frame, cap.position, cap.frame_number))
+            self._cap = cap
+        except BaseException as ex:
+            self._exception = ex
+
+    def result(self) -> tuple[VideoStream, deque[_PrefetchedFrame]]:
+        """Wait for the prefetch to complete and return the opened source and decoded frames.
+        Re-raises any exception raised when opening or decoding the source."""
+        self._thread.join()
+        if self._exception is not None:
+            raise self._exception
+        assert self._cap is not None
+        return self._cap, self._frames
+
+    def cancel(self):
+        """Stop prefetching and wait for the background thread to finish. The result is
+        discarded, including any error."""
+        self._cancelled.set()
+        self._thread.join()
+
+
 class VideoStreamConcat(VideoStream):
     """Concatenates multiple videos into a single, contiguous video stream with a
     monotonic PTS-based global timeline.
@@ -104,6 +257,9 @@ class VideoStreamConcat(VideoStream):
         paths: ty.Sequence[StrPath],
         frame_rate: FrameRate | None = None,
         backend: str = "opencv",
+        prefetch_frames: int = DEFAULT_PREFETCH_FRAMES,
+        probe_workers: int = DEFAULT_PROBE_WORKERS,
+        metadata_cache: StrPath | None = None,
         **kwargs,
     ):
         """Open a list of videos as one continuous stream.
@@ -114,6 +270,13 @@ class VideoStreamConcat(VideoStream):
             backend: Name of the backend to decode each input with (see
                 :data:`scenedetect.backends.AVAILABLE_BACKENDS`). Falls back to OpenCV if
                 unavailable.
+            prefetch_frames: Number of frames to decode from the next source in a background
+                thread while the current one is being read. If 0, the next source is only
+                opened once the current one ends.
+            probe_workers: Maximum number of inputs to probe for metadata concurrently.
+            metadata_cache: Path to an index file used to cache the metadata of each input
+                between runs. Created if it does not exist. Inputs found in the cache with the
+                same modification time and size are not probed again.
             kwargs: Optional named arguments to pass to every child backend constructor.
 
         Raises:
@@ -121,40 +284,47 @@ class VideoStreamConcat(VideoStream):
             VideoOpenFailure: A video could not be opened, or resolutions don't match.
         """
         assert paths
+        if prefetch_frames < 0:
+            raise ValueError("prefetch_frames must be >= 0")
+        if probe_workers < 1:
+            raise ValueError("probe_workers must be >= 1")
         super().__init__()
         # Import here to avoid a circular import (scenedetect.backends imports this module).
         from scenedetect.backends import AVAILABLE_BACKENDS
 
         backend = backend.lower()
-        if backend not in AVAILABLE_BACKENDS:
+        backend_type = AVAILABLE_BACKENDS.get(backend)
+        if backend_type is None:
             logger.warning("Backend %s not available, falling back to opencv.", backend)
-            backend = "opencv"
-        self._backend_type: type = AVAILABLE_BACKENDS[backend]
+            backend_type = AVAILABLE_BACKENDS["opencv"]
+        self._backend_type: type = backend_type
         self._paths: list[Path] = [Path(path) for path in paths]
         self._frame_rate_override = frame_rate
         self._backend_kwargs = kwargs
+        self._prefetch_frames = prefetch_frames
 
         # Probe all inputs up front for validation and metadata, then only keep one source
-        # open at a time for decoding. The handle probed for the first source is kept as the
-        # initial decode source to avoid re-opening it.
-        self._sources: list[_SourceMetadata] = []
-        first_cap: VideoStream | None = None
-        for index in range(len(self._paths)):
-            cap = self._open_source(index)
-            duration = cap.duration
-            declared_seconds = _exact_seconds(duration) if duration is not None else Fraction(0)
-            self._sources.append(
-                _SourceMetadata(
-                    path=self._paths[index],
-                    frame_size=cap.frame_size,
-                    frame_rate=cap.frame_rate,
-                    duration=declared_seconds,
-                    frames=duration.frame_num if duration is not None else 0,
-                    aspect_ratio=cap.aspect_ratio,
-                )
-            )
-            if index == 0:
-                first_cap = cap
+        # open at a time for decoding. The first source is always opened since it is the
+        # initial decode source, and its metadata is taken from that handle.
+        cache = _MetadataCache(metadata_cache) if metadata_cache is not None else None
+        keys = [
+            _MetadataCache.key(path, self._backend_type.BACKEND_NAME, frame_rate)
+            if cache is not None
+            else None
+            for path in self._paths
+        ]
+        sources: list[_SourceMetadata | None] = [None] * len(self._paths)
+        if cache is not None:
+            for index in range(1, len(self._paths)):
+                sources[index] = cache.get(keys[index], self._paths[index])
+        to_probe = [index for index in range(1, len(self._paths)) if sources[index] is None]
+        first_cap = self._probe_sources([0, *to_probe], sources, probe_workers)
+        self._sources: list[_SourceMetadata] = [source for source in sources if source]
+        assert len(self._sources) == len(self._paths)
+        if cache is not None:
+            for index in [0, *to_probe]:
+                cache.put(keys[index], self._sources[index])
+            cache.save()
         self._validate_sources()
 
         # Global start time of each source in exact rational seconds. Has one extra entry at
@@ -170,6 +340,13 @@ class VideoStreamConcat(VideoStream):
         self._decode_failures_prior: int = 0
         assert first_cap is not None
         self._cap: VideoStream = first_cap
+        # Frames of the current source which were decoded ahead of time by a prefetcher, and the
+        # state of the source after the last one of them that was returned by `read`. `_cap`
+        # itself has already advanced past all of these.
+        self._prefetched: deque[_PrefetchedFrame] = deque()
+        self._last_prefetched: _PrefetchedFrame | None = None
+        self._prefetcher: _SourcePrefetcher | None = None
+        self._start_prefetch()
 
     #
     # Concatenation Logic
@@ -198,21 +375,96 @@ class VideoStreamConcat(VideoStream):
                     source.path.name,
                 )
 
+    def _probe_source(self, index: int) -> tuple[VideoStream, _SourceMetadata]:
+        cap = self._open_source(index)
+        duration = cap.duration
+        declared_seconds = _exact_seconds(duration) if duration is not None else Fraction(0)
+        return cap, _SourceMetadata(
+            path=self._paths[index],
+            frame_size=cap.frame_size,
+            frame_rate=cap.frame_rate,
+            duration=declared_seconds,
+            frames=duration.frame_num if duration is not None else 0,
+            aspect_ratio=cap.aspect_ratio,
+        )
+
+    def _probe_sources(
+        self, indices: list[int], sources: list[_SourceMetadata | None], max_workers: int
+    ) -> VideoStream:
+        """Probe the sources at `indices` (which must start with 0) with up to `max_workers`
+        threads, storing the result in `sources`. Returns the handle for the first source. If
+        any source fails to open, the error for the first of them in playback order is raised,
+        the same as if they were probed one after another."""
+        assert indices[0] == 0
+        max_workers = min(max_workers, len(indices))
+        if max_workers <= 1:
+            results = [self._probe_source(index) for index in indices]
+            first_cap, sources[0] = results[0]
+            for index, (_, source) in zip(indices[1:], results[1:], strict=True):
+                sources[index] = source
+            return first_cap
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="VideoStreamConcat-probe"
+        ) as executor:
+            futures = [executor.submit(self._probe_source, index) for index in indices]
+            try:
+                first_cap, sources[0] = futures[0].result()
+                for index, future in zip(indices[1:], futures[1:], strict=True):
+                    # Only the metadata is kept, the handle is released as soon as possible.
+                    sources[index] = future.result()[1]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return first_cap
+
     def _open_source(self, index: int) -> VideoStream:
         return self._backend_type(
             str(self._paths[index]), self._frame_rate_override, **self._backend_kwargs
         )
 
+    def _start_prefetch(self):
+        """Start opening the source after the current one in the background, if any."""
+        next_index = self._index + 1
+        if self._prefetch_frames > 0 and next_index < len(self._paths):
+            self._prefetcher = _SourcePrefetcher(
+                lambda: self._open_source(next_index), self._prefetch_frames
+            )
+
+    def _cancel_prefetch(self):
+        """Discard any prefetched state, for both the current and next sources."""
+        if self._prefetcher is not None:
+            self._prefetcher.cancel()
+            self._prefetcher = None
+        self._prefetched.clear()
+        self._last_prefetched = None
+
+    def _open_next_source(self) -> VideoStream:
+        """Return the next source, waiting for it to be prefetched if required."""
+        if self._prefetcher is None:
+            return self._open_source(self._index)
+        prefetcher, self._prefetcher = self._prefetcher, None
+        cap, self._prefetched = prefetcher.result()
+        return cap
+
     def _child_position_seconds(self) -> Fraction:
         """Position of the current source as exact rational seconds (local timeline)."""
+        if self._last_prefetched is not None:
+            return _exact_seconds(self._last_prefetched.position)
         return _exact_seconds(self._cap.position)
 
+    def _child_frame_number(self) -> int:
+        """Number of frames returned so far from the current source."""
+        if self._last_prefetched is not None:
+            return self._last_prefetched.frame_number
+        return self._cap.frame_number
+
     def _finish_current_source(self):
         """Correct the declared offset of the next source now that the actual end of the
         current source is known, guaranteeing strictly monotonic PTS across the seam even
         when the declared duration is inaccurate."""
         self._decode_failures_prior += self._cap.decode_failures
-        self._frames_prior += self._cap.frame_number
+        self._frames_prior += self._child_frame_number()
         actual_end = (
             self._offsets[self._index]
             + self._child_position_seconds()
@@ -227,8 +479,12 @@ class VideoStreamConcat(VideoStream):
     def read(self, decode: bool = True) -> np.ndarray | bool:
         """Read/decode the next frame. Returns False when all inputs have been processed."""
         while True:
+            if self._prefetched:
+                self._last_prefetched = self._prefetched.popleft()
+                return self._last_prefetched.frame if decode else True
             result = self._cap.read(decode=decode)
             if result is not False:
+                self._last_prefetched = None
                 return result
             if (self._index + 1) >= len(self._paths):
                 logger.debug("No more input to process.")
@@ -236,7 +492,9 @@ class VideoStreamConcat(VideoStream):
             self._finish_current_source()
             self._index += 1
             logger.debug("Processing complete, opening next video: %s", self._paths[self._index])
-            self._cap = self._open_source(self._index)
+            self._last_prefetched = None
+            self._cap = self._open_next_source()
+            self._start_prefetch()
 
     def seek(self, target: TimecodeLike):
         """Seek to `target` on the global timeline. Supports seeking across sources in
@@ -252,17 +510,31 @@ class VideoStreamConcat(VideoStream):
         if index != self._index:
             self._decode_failures_prior += self._cap.decode_failures
             self._frames_prior = sum(source.frames for source in self._sources[:index])
+            next_source = index == self._index + 1 and self._prefetcher is not None
             self._index = index
-            self._cap = self._open_source(index)
+            if next_source:
+                # Reuse the handle opened in the background. Seeking below discards any
+                # frames it decoded.
+                self._cap = self._open_next_source()
+                self._cancel_prefetch()
+            else:
+                self._cancel_prefetch()
+                self._cap = self._open_source(index)
+            self._start_prefetch()
+        else:
+            self._prefetched.clear()
+            self._last_prefetched = None
         local_seconds = target_seconds - self._offsets[index]
         self._cap.seek(float(local_seconds))
 
     def reset(self):
         """Close and re-open the stream (equivalent to seeking back to the beginning)."""
+        self._cancel_prefetch()
         self._index = 0
         self._frames_prior = 0
         self._decode_failures_prior = 0
         self._cap = self._open_source(0)
+        self._start_prefetch()
 
     #
     # VideoStream Properties
@@ -329,7 +601,7 @@ class VideoStreamConcat(VideoStream):
     @property
     def frame_number(self) -> int:
         """Number of frames read so far across all sources."""
-        return self._frames_prior + self._cap.frame_number
+        return self._frames_prior + self._child_frame_number()
 
     @property
     def decode_failures(self) -> int:
@@ -283,6 +283,12 @@ class VideoStreamCv2(VideoStream):
         self._open_capture(float(self._frame_rate))
 
     def read(self, decode: bool = True) -> np.ndarray | bool:
+        return self._read(decode=decode)
+
+    def _read_into(self, out: np.ndarray) -> np.ndarray | bool:
+        return self._read(decode=True, out=out)
+
+    def _read(self, decode: bool, out: np.ndarray | None = None) -> np.ndarray | bool:
         if not self._cap.isOpened():
             return False
         has_grabbed = self._cap.grab()
@@ -306,7 +312,7 @@ class VideoStreamCv2(VideoStream):
         self._has_grabbed = True
         # Need to make sure we actually grabbed a frame before calling retrieve.
         if decode and self._has_grabbed:
-            _, frame = self._cap.retrieve()
+            _, frame = self._cap.retrieve(out)
             return frame
         return self._has_grabbed
 
@@ -520,6 +526,12 @@ class VideoCaptureAdapter(VideoStream):
         raise NotImplementedError("Reset is not supported.")
 
     def read(self, decode: bool = True) -> np.ndarray | bool:
+        return self._read(decode=decode)
+
+    def _read_into(self, out: np.ndarray) -> np.ndarray | bool:
+        return self._read(decode=True, out=out)
+
+    def _read(self, decode: bool, out: np.ndarray | None = None) -> np.ndarray | bool:
         if not self._cap.isOpened():
             return False
         has_grabbed = self._cap.grab()
@@ -543,6 +555,6 @@ class VideoCaptureAdapter(VideoStream):
         self._num_frames += 1
         # Need to make sure we actually grabbed a frame before calling retrieve.
         if decode and self._num_frames > 0:
-            _, frame = self._cap.retrieve()
+            _, frame = self._cap.retrieve(out)
             return frame
         return True
@@ -11,7 +11,9 @@
 #
 """:class:`VideoStreamAv` provides an adapter for the PyAV av.InputContainer object."""
 
+import contextlib
 import os
+import time
 import typing as ty
 import warnings
 from fractions import Fraction
@@ -38,6 +40,16 @@ MAX_CONSECUTIVE_DECODE_FAILURES = 8
 """Number of consecutive frame decode failures after which `VideoStreamAv.read()` gives up.
 Isolated corrupt frames are skipped; this bound ensures a truncated file still terminates."""
 
+RECONNECT_DELAY: float = 1.0
+"""Seconds to wait before the first attempt to reconnect to a network stream. The delay doubles
+after each failed attempt, up to `MAX_RECONNECT_DELAY`."""
+
+MAX_RECONNECT_DELAY: float = 30.0
+"""Maximum number of seconds to wait between attempts to reconnect to a network stream."""
+
+NETWORK_STREAM_IDENTIFIER = "://"
+"""Paths containing this are opened as a network stream (e.g. RTSP, HLS) instead of a file."""
+
 
 class VideoStreamAv(VideoStream):
     """PyAV `av.InputContainer` backend."""
@@ -54,8 +66,11 @@ class VideoStreamAv(VideoStream):
         threading_mode: str | None = None,
         suppress_output: bool = False,
         framerate: FrameRate | None = None,
+        options: dict[str, str] | None = None,
+        timeout: float | None = None,
+        reconnect: int = 0,
     ):
-        """Open a video by path.
+        """Open a video by path or URL.
 
         .. warning::
 
@@ -64,7 +79,8 @@ class VideoStreamAv(VideoStream):
             https://pyav.org/docs/stable/overview/caveats.html#sub-interpeters
 
         Arguments:
-            path_or_io: Path to the video, or a file-like object.
+            path_or_io: Path to the video, a URL of a network stream (e.g. rtsp://, or https://
+                for HLS), or a file-like object.
             frame_rate: If set, overrides the detected frame rate. Takes precedence over
                 `framerate`.
             name: Overrides the `name` property derived from the video path. Should be set if
@@ -79,6 +95,12 @@ class VideoStreamAv(VideoStream):
                 for details: https://pyav.org/docs/stable/overview/caveats.html#sub-interpeters
             framerate: [DEPRECATED] Use `frame_rate` instead. Retained as a deprecated
                 alias for backwards compatibility; ignored when `frame_rate` is provided.
+            options: Options to pass to the ffmpeg demuxer when opening the input (e.g.
+                ``{"rtsp_transport": "tcp"}``).
+            timeout: Seconds to wait when opening or reading from the input before failing.
+            reconnect: Number of attempts to reconnect to a network stream each time it ends or
+                fails, waiting longer after each attempt. Positions continue on from the last
+                frame before the connection was lost. Only applies to URLs.
 
         Raises:
             OSError: file could not be found or access was denied
@@ -110,6 +132,13 @@ class VideoStreamAv(VideoStream):
         self._reopened = True
         self._decode_failures = 0
         self._warning_displayed = False
+        self._options = options
+        self._timeout = timeout
+        self._reconnect = reconnect
+        # Added to the PTS of each frame so positions continue on after reconnecting.
+        self._pts_offset = 0
+        # Position in seconds of the last frame before reconnecting, until the offset is set.
+        self._resync_seconds: Fraction | None = None
 
         if threading_mode:
             try:
@@ -124,16 +153,18 @@ class VideoStreamAv(VideoStream):
             av.logging.restore_default_callback()  # type: ignore[attr-defined]
 
         try:
+            self._io: ty.BinaryIO | None = None
             if isinstance(path_or_io, (str, os.PathLike)):
                 self._path: str = os.fspath(path_or_io)
-                # File handle is intentionally long-lived and tied to the VideoStream.
-                self._io = open(self._path, "rb")  # noqa: SIM115
+                if NETWORK_STREAM_IDENTIFIER not in self._path:
+                    # File handle is intentionally long-lived and tied to the VideoStream.
+                    self._io = open(self._path, "rb")  # noqa: SIM115
                 if not self._name:
                     self._name = get_file_name(self._path, include_extension=False)
             else:
                 self._io = path_or_io
 
-            self._container: av.container.InputContainer = av.open(self._io)  # type: ignore[attr-defined]
+            self._container: av.container.InputContainer = self._open()
             if threading_mode is not None:
                 self._video_stream.thread_type = threading_mode
                 self._reopened = False
@@ -196,8 +227,13 @@ class VideoStreamAv(VideoStream):
 
     @property
     def is_seekable(self) -> bool:
-        """True if seek() is allowed, False otherwise."""
-        return self._io.seekable()
+        """True if seek() is allowed, False otherwise. Network streams are not seekable."""
+        return self._io is not None and self._io.seekable()
+
+    @property
+    def is_network_stream(self) -> bool:
+        """True if the input is a network stream opened by URL."""
+        return self._io is None
 
     @property
     def frame_size(self) -> tuple[int, int]:
@@ -314,8 +350,10 @@ class VideoStreamAv(VideoStream):
         self._container.close()
         self._frame = None
         self._decoder = None
+        self._pts_offset = 0
+        self._resync_seconds = None
         try:
-            self._container = av.open(self._path if self._path else self._io)
+            self._container = self._open()
         except Exception as ex:
             raise VideoOpenFailure() from ex
 
@@ -334,10 +372,12 @@ class VideoStreamAv(VideoStream):
             # NOTE: EOFError subclasses FFmpegError, so this clause must come first.
             except av.error.EOFError:  # type: ignore[attr-defined]
                 self._frame = last_frame
-                if self._handle_eof():
+                if self._handle_eof() or self._reconnect_stream():
                     return self.read(decode)
                 return False
             except StopIteration:
+                if self._reconnect_stream():
+                    return self.read(decode)
                 return False
             except av.error.FFmpegError as ex:  # type: ignore[attr-defined]
                 # `next()` raised before assignment, so `self._frame` is still the last good
@@ -348,6 +388,9 @@ class VideoStreamAv(VideoStream):
                 # recreating it (next loop iteration) resumes demuxing after the bad packet.
                 self._decoder = None
                 if consecutive_failures >= MAX_CONSECUTIVE_DECODE_FAILURES:
+                    if self._reconnect_stream():
+                        consecutive_failures = 0
+                        continue
                     logger.error(
                         "Failed to decode %d consecutive frames, stopping: %s",
                         consecutive_failures,
@@ -360,6 +403,8 @@ class VideoStreamAv(VideoStream):
                     logger.warning("Failed to decode some frames, results may be inaccurate.")
                 continue
             assert self._frame is not None
+            if self._resync_seconds is not None and self._frame.pts is not None:
+                self._resync_pts()
             return self._frame.to_ndarray(format="bgr24") if decode else True
 
     #
@@ -384,7 +429,57 @@ class VideoStreamAv(VideoStream):
         start_time = self._video_stream.start_time or 0
         if start_time and self._video_stream.time_base != self._frame.time_base:
             start_time = int(start_time * self._video_stream.time_base / self._frame.time_base)
-        return self._frame.pts - start_time
+        return self._frame.pts - start_time + self._pts_offset
+
+    def _open(self) -> "av.container.InputContainer":
+        """Open the input container from the file handle, or the URL of a network stream."""
+        return av.open(  # type: ignore[attr-defined]
+            self._path if self._io is None else self._io,
+            options=self._options,
+            timeout=self._timeout,
+        )
+
+    def _reconnect_stream(self) -> bool:
+        """Try to reconnect to a network stream after it ended or failed. Returns True if the
+        stream was reopened and decoding can continue, False otherwise."""
+        if not self.is_network_stream or self._reconnect <= 0:
+            return False
+        if self._frame is not None and self._frame.pts is not None:
+            self._resync_seconds = self._normalized_pts() * self._frame.time_base
+        delay = RECONNECT_DELAY
+        for attempt in range(1, self._reconnect + 1):
+            logger.warning(
+                "Lost connection to %s, reconnecting in %.1f seconds (attempt %d of %d).",
+                self._path,
+                delay,
+                attempt,
+                self._reconnect,
+            )
+            time.sleep(delay)
+            delay = min(2.0 * delay, MAX_RECONNECT_DELAY)
+            try:
+                container = self._open()
+            except Exception as ex:
+                logger.debug("Failed to reconnect: %s", ex)
+                continue
+            with contextlib.suppress(Exception):
+                self._container.close()
+            self._container = container
+            self._decoder = None
+            self._pts_offset = 0
+            logger.info("Reconnected to %s.", self._path)
+            return True
+        logger.error("Failed to reconnect to %s.", self._path)
+        return False
+
+    def _resync_pts(self):
+        """Set the PTS offset after reconnecting so the first new frame follows on from the last
+        frame before the connection was lost, since the new stream may start from any PTS."""
+        assert self._frame is not None and self._frame.time_base is not None
+        assert self._resync_seconds is not None
+        expected_seconds = self._resync_seconds + 1 / self.frame_rate
+        self._resync_seconds = None
+        self._pts_offset = round(expected_seconds / self._frame.time_base) - self._normalized_pts()
 
     def _get_duration(self) -> int:
         """Get video duration as number of frames based on the video and set framerate."""
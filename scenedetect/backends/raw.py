@@ -0,0 +1,425 @@
+#
+#            PySceneDetect: Python-Based Video Scene Detector
+#   -------------------------------------------------------------------
+#     [  Site:    https://scenedetect.com                           ]
+#     [  Docs:    https://scenedetect.com/docs/                     ]
+#     [  Github:  https://github.com/Breakthrough/PySceneDetect/    ]
+#
+# Copyright (C) 2026 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""``scenedetect.backends.raw`` Module
+
+:class:`VideoStreamRaw` reads pre-decoded frames from a raw frame file, which stores every frame
+uncompressed along with its presentation timestamp. Decoding a video once into a raw file on a
+fast local disk allows running many detector configurations (or `save-images` passes) on it at
+the speed of memory rather than of the decoder. Frames are memory-mapped, so :meth:`read`
+returns read-only views of the file without copying, and seeking to any frame is instant.
+
+Raw files are written with :func:`write_raw_video` or the `save-raw` command, and are opened
+with :func:`scenedetect.open_video` (which detects them regardless of the `backend` requested):
+
+.. code:: python
+
+    from scenedetect import open_video
+    from scenedetect.backends.raw import write_raw_video
+    write_raw_video(open_video("video.mp4"), "video.sdraw")
+    video = open_video("video.sdraw")
+
+Timestamps are preserved, so scenes detected on a raw file have the same timecodes as those
+detected on the original video, even if the file only covers part of it (e.g. with `start_time`
+and `end_time`). Frames are stored as-is (BGR) at full resolution unless a `crop` region or
+`downscale` factor is given, so raw files are large: 1080p video takes about 6 MB per frame, or
+560 GB per hour at 25 fps. With ``downscale=4`` that is reduced by a factor of 16. The `save-raw`
+command saves frames as they are processed during detection, after cropping and downscaling.
+
+A raw file consists of:
+
+ - a header (:data:`HEADER_DTYPE`), padded to :data:`DATA_ALIGNMENT` bytes,
+ - the frames, each `height * width * channels` bytes (row-major, BGR), and
+ - a table of the presentation timestamp of each frame as 64-bit integers, in units of the
+   time base in the header.
+
+All values are little-endian. The header is rewritten with the number of frames once they have
+all been written, so a file which is still being written (or was interrupted) contains no frames.
+"""
+
+import logging
+import os
+from fractions import Fraction
+from pathlib import Path
+
+import numpy as np
+
+from scenedetect.common import (
+    CropRegion,
+    FrameRate,
+    FrameTimecode,
+    Interpolation,
+    Subsampling,
+    Timecode,
+    TimecodeLike,
+    framerate_to_fraction,
+)
+from scenedetect.platform import StrPath, tqdm
+from scenedetect.scene_manager import downscale_frame
+from scenedetect.video_stream import VideoOpenFailure, VideoStream
+
+logger = logging.getLogger("pyscenedetect")
+
+RAW_VIDEO_EXTENSION = ".sdraw"
+"""File extension used for raw frame files."""
+
+RAW_VIDEO_MAGIC = b"SDRAWVID"
+"""Bytes at the start of every raw frame file."""
+
+RAW_VIDEO_VERSION = 1
+"""Version of the raw frame file format written by :class:`RawVideoWriter`."""
+
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("channels", "<u4"),
+        ("width", "<u4"),
+        ("height", "<u4"),
+        ("num_frames", "<u8"),
+        ("frame_rate", "<i8", (2,)),
+        ("time_base", "<i8", (2,)),
+        ("aspect_ratio", "<f8"),
+        ("frames_offset", "<u8"),
+        ("pts_offset", "<u8"),
+    ]
+)
+"""Layout of the header of a raw frame file. `frame_rate` and `time_base` are fractions stored
+as (numerator, denominator)."""
+
+DATA_ALIGNMENT = 4096
+"""Alignment of the frame data in bytes, so that frames can be mapped directly."""
+
+
+def is_raw_video(path: StrPath) -> bool:
+    """Check if `path` is a raw frame file, by its first bytes rather than its extension."""
+    try:
+        with open(path, "rb") as file:
+            return file.read(len(RAW_VIDEO_MAGIC)) == RAW_VIDEO_MAGIC
+    except (OSError, TypeError, ValueError):
+        return False
+
+
+class RawVideoWriter:
+    """Writes frames and their timestamps to a raw frame file. Can be used as a context manager,
+    which closes the file when done. The frame size, number of channels and time base are taken
+    from the first frame written."""
+
+    def __init__(self, path: StrPath, frame_rate: Fraction, aspect_ratio: float = 1.0):
+        """
+        Arguments:
+            path: Path of the raw frame file to create. Overwritten if it exists.
+            frame_rate: Frame rate of the video.
+            aspect_ratio: Pixel aspect ratio of the video.
+        """
+        self._file = open(path, "wb")  # noqa: SIM115
+        self._header = np.zeros((), dtype=HEADER_DTYPE)
+        self._header["magic"] = RAW_VIDEO_MAGIC
+        self._header["version"] = RAW_VIDEO_VERSION
+        self._header["frame_rate"] = (frame_rate.numerator, frame_rate.denominator)
+        self._header["aspect_ratio"] = aspect_ratio
+        self._header["frames_offset"] = DATA_ALIGNMENT
+        self._shape: tuple[int, ...] | None = None
+        self._time_base: Fraction | None = None
+        self._pts: list[int] = []
+        # Written with no frames until closed, so incomplete files are still valid.
+        self._write_header()
+        self._file.seek(DATA_ALIGNMENT)
+
+    def __enter__(self) -> "RawVideoWriter":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def num_frames(self) -> int:
+        """Number of frames written so far."""
+        return len(self._pts)
+
+    def write(self, frame: np.ndarray, position: FrameTimecode):
+        """Append `frame`, which has the presentation time `position`.
+
+        Raises:
+            ValueError: The frame has a different size than previous frames.
+        """
+        if frame.ndim == 2:
+            frame = frame[:, :, np.newaxis]
+        if self._shape is None:
+            self._shape = frame.shape
+            height, width, channels = frame.shape
+            self._header["width"] = width
+            self._header["height"] = height
+            self._header["channels"] = channels
+            self._time_base = position.time_base
+            self._header["time_base"] = (self._time_base.numerator, self._time_base.denominator)
+        elif frame.shape != self._shape:
+            raise ValueError(
+                f"Frame at {position} has shape {frame.shape}, expected {self._shape}."
+            )
+        if position.time_base == self._time_base:
+            pts = position.pts
+        else:
+            pts = round(Fraction(position.pts) * position.time_base / self._time_base)
+        self._file.write(memoryview(np.ascontiguousarray(frame)))
+        self._pts.append(pts)
+
+    def close(self):
+        """Write the timestamp table and final header, and close the file."""
+        if self._file.closed:
+            return
+        self._header["num_frames"] = len(self._pts)
+        self._header["pts_offset"] = self._file.tell()
+        np.asarray(self._pts, dtype="<i8").tofile(self._file)
+        self._write_header()
+        self._file.close()
+
+    def _write_header(self):
+        self._file.seek(0)
+        self._file.write(self._header.tobytes())
+
+
+def write_raw_video(
+    video: VideoStream,
+    path: StrPath,
+    start_time: TimecodeLike | None = None,
+    end_time: TimecodeLike | None = None,
+    crop: CropRegion | None = None,
+    downscale: float = 1.0,
+    subsampling: Subsampling = Subsampling.RESIZE,
+    interpolation: Interpolation = Interpolation.LINEAR,
+    show_progress: bool = False,
+) -> int:
+    """Decode `video` into a raw frame file at `path`, which can be opened with
+    :class:`VideoStreamRaw`.
+
+    Arguments:
+        video: Video to decode.
+        path: Path of the raw frame file to create. Overwritten if it exists.
+        start_time: Time to start from. If not set, starts from the current position of `video`.
+        end_time: Time to stop at (exclusive). If not set, continues to the end of the video.
+        crop: Region to crop frames to before downscaling them, as inclusive (X0, Y0, X1, Y1) like
+            :attr:`SceneManager.crop <scenedetect.scene_manager.SceneManager.crop>`.
+        downscale: Factor to downscale frames by, e.g. the same factor a
+            :class:`SceneManager <scenedetect.scene_manager.SceneManager>` would use. Detection on
+            the raw file should then not downscale again. 1 indicates no scaling.
+        subsampling: Method used to downscale frames (see
+            :func:`downscale_frame <scenedetect.scene_manager.downscale_frame>`).
+        interpolation: Interpolation method used with :attr:`Subsampling.RESIZE`.
+        show_progress: Show a progress bar.
+
+    Returns:
+        Number of frames written.
+
+    Raises:
+        ValueError: `downscale` is less than 1.
+    """
+    if downscale < 1:
+        raise ValueError("downscale must be at least 1")
+    if start_time is not None:
+        video.seek(start_time)
+    if end_time is not None:
+        end_time = FrameTimecode(end_time, video.frame_rate)
+    total = None
+    if video.duration is not None:
+        total = (end_time if end_time is not None else video.duration).frame_num
+        total = max(0, total - video.frame_number)
+    progress_bar = None
+    if show_progress:
+        progress_bar = tqdm(total=total, unit="frames", dynamic_ncols=True)
+    with RawVideoWriter(path, video.frame_rate, video.aspect_ratio) as writer:
+        while True:
+            frame = video.read()
+            if frame is False:
+                break
+            if crop is not None:
+                x0, y0, x1, y1 = crop
+                frame = frame[y0 : y1 + 1, x0 : x1 + 1]
+            frame = downscale_frame(frame, downscale, subsampling, interpolation)
+            position = video.position
+            writer.write(frame, position)
+            if progress_bar is not None:
+                progress_bar.update(1)
+            if end_time is not None and not (position + 1) < end_time:
+                break
+    if progress_bar is not None:
+        progress_bar.close()
+    return writer.num_frames
+
+
+class VideoStreamRaw(VideoStream):
+    """Reads frames from a raw frame file (see :mod:`scenedetect.backends.raw`)."""
+
+    BACKEND_NAME = "raw"
+    """Unique name used to identify this backend."""
+
+    def __init__(self, path: StrPath, frame_rate: FrameRate | None = None):
+        """Open a raw frame file.
+
+        Arguments:
+            path: Path to the raw frame file.
+            frame_rate: If set, overrides the frame rate stored in the file.
+
+        Raises:
+            OSError: file could not be found or access was denied
+            VideoOpenFailure: file is not a valid raw frame file
+        """
+        self._path = os.fspath(path)
+        if not os.path.exists(self._path):
+            raise OSError(f"Video file not found: {self._path}")
+        header = np.fromfile(self._path, dtype=HEADER_DTYPE, count=1)
+        if len(header) != 1 or header[0]["magic"] != RAW_VIDEO_MAGIC:
+            raise VideoOpenFailure(f"Not a raw frame file: {self._path}")
+        header = header[0]
+        if header["version"] != RAW_VIDEO_VERSION:
+            raise VideoOpenFailure(f"Unsupported raw frame file version: {header['version']}")
+        num_frames = int(header["num_frames"])
+        shape = (num_frames, int(header["height"]), int(header["width"]), int(header["channels"]))
+        if num_frames:
+            self._frames = np.memmap(
+                self._path,
+                dtype=np.uint8,
+                mode="r",
+                offset=int(header["frames_offset"]),
+                shape=shape,
+            )
+            self._pts = np.fromfile(
+                self._path, dtype="<i8", count=num_frames, offset=int(header["pts_offset"])
+            )
+        else:
+            # Files without frames can't be memory-mapped.
+            self._frames = np.empty(shape, dtype=np.uint8)
+            self._pts = np.empty(0, dtype=np.int64)
+        if len(self._pts) != num_frames:
+            raise VideoOpenFailure(f"Raw frame file is truncated: {self._path}")
+        self._time_base = Fraction(int(header["time_base"][0]), int(header["time_base"][1] or 1))
+        self._frame_rate = (
+            framerate_to_fraction(frame_rate)
+            if frame_rate is not None
+            else Fraction(int(header["frame_rate"][0]), int(header["frame_rate"][1]))
+        )
+        self._aspect_ratio = float(header["aspect_ratio"])
+        # If frames are evenly spaced, seeking is a division rather than a search.
+        steps = np.diff(self._pts)
+        self._pts_step = int(steps[0]) if len(steps) and np.all(steps == steps[0]) else None
+        self._index = 0
+        """Index of the next frame to read."""
+
+    #
+    # VideoStream Methods/Properties
+    #
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def name(self) -> str:
+        return Path(self._path).stem
+
+    @property
+    def is_seekable(self) -> bool:
+        return True
+
+    @property
+    def frame_rate(self) -> Fraction:
+        return self._frame_rate
+
+    @property
+    def duration(self) -> FrameTimecode | None:
+        """End time of the last frame in the file."""
+        if not len(self._pts):
+            return self.base_timecode
+        return self._timecode(len(self._pts) - 1) + 1
+
+    @property
+    def frame_size(self) -> tuple[int, int]:
+        return (self._frames.shape[2], self._frames.shape[1])
+
+    @property
+    def aspect_ratio(self) -> float:
+        return self._aspect_ratio
+
+    @property
+    def position(self) -> FrameTimecode:
+        if self._index == 0:
+            return self.base_timecode
+        return self._timecode(self._index - 1)
+
+    @property
+    def position_ms(self) -> float:
+        return self.position.seconds * 1000.0
+
+    @property
+    def frame_number(self) -> int:
+        """Frame number of the last frame read in the original video. If no frames have been read
+        (or the stream was reset), this is the frame number of the first frame in the file, so it
+        only advances by the number of frames read."""
+        if self._index == 0:
+            return self._timecode(0).frame_num if len(self._pts) else 0
+        return self.position.frame_num + 1
+
+    def read(self, decode: bool = True) -> np.ndarray | bool:
+        """Read the next frame. Frames are read-only views of the file."""
+        if self._index >= len(self._frames):
+            return False
+        self._index += 1
+        if not decode:
+            return True
+        frame = self._frames[self._index - 1]
+        return frame[:, :, 0] if frame.shape[2] == 1 else frame
+
+    def reset(self):
+        self._index = 0
+
+    def seek(self, target: TimecodeLike):
+        """Seek to the first frame at or after `target`. Frames before the start of the file are
+        treated as being at its start, and seeking past the end moves to the end.
+
+        Arguments:
+            target: Target position in video stream to seek to.
+                If float, interpreted as time in seconds.
+                If int, interpreted as frame number.
+        Raises:
+            ValueError: `target` is not a valid value (i.e. it is negative).
+        """
+        if not isinstance(target, FrameTimecode):
+            target = FrameTimecode(target, self.frame_rate)
+        if target < 0:
+            raise ValueError("Target seek position cannot be negative!")
+        if not len(self._pts):
+            return
+        target_pts = round(Fraction(target.pts) * target.time_base / self._time_base)
+        if self._pts_step:
+            index = -(-(target_pts - int(self._pts[0])) // self._pts_step)
+        else:
+            index = int(np.searchsorted(self._pts, target_pts, side="left"))
+        self._index = min(max(0, index), len(self._pts))
+
+    def _timecode(self, index: int) -> FrameTimecode:
+        return FrameTimecode(
+            Timecode(pts=int(self._pts[index]), time_base=self._time_base), fps=self.frame_rate
+        )
+
+    #
+    # Raw Frame File Specific Properties
+    #
+
+    @property
+    def num_frames(self) -> int:
+        """Number of frames in the file."""
+        return len(self._pts)
+
+    @property
+    def frames(self) -> np.ndarray:
+        """All frames in the file as a read-only array of shape (frames, height, width,
+        channels)."""
+        return self._frames
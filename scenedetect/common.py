@@ -160,6 +160,25 @@ class Interpolation(Enum):
     """Lanczos interpolation over 8x8 neighborhood."""
 
 
+class Subsampling(Enum):
+    """Method used to reduce the size of frames before detection, by the downscale factor of a
+    :class:`SceneManager <scenedetect.scene_manager.SceneManager>`. Methods other than
+    :attr:`RESIZE` round the downscale factor to an integer."""
+
+    RESIZE = "resize"
+    """Resize the frame, using the interpolation method of the `SceneManager`."""
+    STRIDE = "stride"
+    """Take every Nth pixel of every Nth row (nearest neighbor). Frames are views of the decoded
+    frame, so this has no cost, but it is the most prone to aliasing."""
+    POOL = "pool"
+    """Average each block of NxN pixels. Equivalent to :attr:`Interpolation.AREA` with an integer
+    factor, which is free of aliasing but the slowest."""
+    ROI = "roi"
+    """Take tiles from the center of each cell of a 3x3 grid over the frame at full resolution,
+    joined into a frame of the downscaled size. Only a fraction of the frame is processed, so
+    changes outside of the tiles are missed."""
+
+
 @dataclass(frozen=True)
 class Timecode:
     """Timing information associated with a given frame."""
@@ -845,3 +864,67 @@ def _compare_as_exact(other: ty.Any, base: FrameTimecode) -> "tuple[Fraction, Fr
             other._time.pts * other._time.time_base,
         )
     return None
+
+
+class _MinLength:
+    """Evaluates ``(end - start) >= length`` for two :class:`FrameTimecode` positions of the same
+    stream, as used by detectors to enforce a minimum scene length on every frame.
+
+    Positions read from a :class:`VideoStream` are backed by a :class:`Timecode`. For those, the
+    result only depends on the integer PTS difference, so the smallest difference which meets
+    `length` is computed once per time base and each check is a single integer comparison, without
+    allocating new timecodes. Any other combination of inputs falls back to the equivalent
+    :class:`FrameTimecode` arithmetic.
+    """
+
+    __slots__ = ("_key", "_min_pts", "length")
+
+    def __init__(self, length: "TimecodeLike"):
+        """
+        Arguments:
+            length: Minimum length, as accepted by :class:`FrameTimecode` comparisons.
+        """
+        self.length = length
+        # (time_base, frame_rate) the cached `_min_pts` was computed for.
+        self._key: tuple[Fraction, Fraction] | None = None
+        self._min_pts: int = 0
+
+    def met(self, end: FrameTimecode, start: FrameTimecode) -> bool:
+        """Return True if at least `length` has passed from `start` to `end`."""
+        end_time, start_time = end._time, start._time
+        if (
+            type(end_time) is Timecode
+            and type(start_time) is Timecode
+            and end_time.time_base == start_time.time_base
+            and end._rate is not None
+            and isinstance(self.length, (int, float, str))
+        ):
+            min_pts = self.min_pts(end_time.time_base, end._rate)
+            return max(0, end_time.pts - start_time.pts) >= min_pts
+        return (end - start) >= self.length
+
+    def min_pts(self, time_base: Fraction, rate: Fraction) -> int:
+        """Smallest PTS difference `d` (in units of `time_base`) for which ``(end - start) >=
+        length`` holds, found by evaluating the comparison exactly as :class:`FrameTimecode`
+        would. The comparison is monotonic in `d`, so we start from an estimate and step to the
+        boundary. Cached for the most recent `time_base` and `rate`."""
+        key = (time_base, rate)
+        if key != self._key:
+            self._min_pts = self._find_min_pts(time_base, rate)
+            self._key = key
+        return self._min_pts
+
+    def _find_min_pts(self, time_base: Fraction, rate: Fraction) -> int:
+        def is_met(pts: int) -> bool:
+            return FrameTimecode(Timecode(pts=pts, time_base=time_base), fps=rate) >= self.length
+
+        if isinstance(self.length, int):
+            estimate = Fraction(self.length) / rate / time_base
+        else:
+            estimate = Fraction(FrameTimecode(timecode=self.length, fps=rate).seconds) / time_base
+        pts = max(0, math.ceil(estimate))
+        while pts > 0 and is_met(pts - 1):
+            pts -= 1
+        while not is_met(pts):
+            pts += 1
+        return pts
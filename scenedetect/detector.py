@@ -27,10 +27,18 @@ in order to be compatible with PySceneDetect.
 import math
 from abc import ABC, abstractmethod
 from enum import Enum
+from fractions import Fraction
 
 import numpy
 
-from scenedetect.common import FrameTimecode, Timecode, TimecodeLike
+from scenedetect.common import (
+    FrameRate,
+    FrameTimecode,
+    Timecode,
+    TimecodeLike,
+    _MinLength,
+    framerate_to_fraction,
+)
 from scenedetect.stats_manager import StatsManager
 
 
@@ -141,12 +149,18 @@ class FlashFilter:
         self._merge_enabled = False  # Used to disable merging until at least one cut was found.
         self._merge_triggered = False  # True when the merge filter is active.
         self._merge_start: FrameTimecode | None = None  # Frame where we started merging.
+        self._min_length: _MinLength | None = None  # Built once `_filter_secs` is known.
+        self._frame_rate: float | None = None  # Framerate of the first frame filtered.
 
     @property
     def max_behind(self) -> int:
         if self._mode == FlashFilter.Mode.SUPPRESS:
             return 0
         if self._filter_secs is not None:
+            if self._frame_rate is not None:
+                # Once the framerate is known, cuts can be at most one frame more than the filter
+                # length behind.
+                return math.ceil(self._filter_secs * self._frame_rate) + 1
             # Estimate using 240fps so the event buffer is large enough for any reasonable input.
             return math.ceil(self._filter_secs * 240.0)
         return self._filter_length
@@ -168,6 +182,130 @@ class FlashFilter:
             return self._filter_suppress(timecode=timecode, above_threshold=above_threshold)
         raise RuntimeError("Unhandled FlashFilter mode.")
 
+    def filter_array(
+        self,
+        timestamps: numpy.ndarray,
+        above_threshold: numpy.ndarray,
+        time_base: Fraction | None = None,
+        frame_rate: FrameRate | None = None,
+    ) -> numpy.ndarray:
+        """Vectorized equivalent of calling :meth:`filter` once per frame, for a whole sequence of
+        frames at once. Useful for re-thresholding stored frame scores without replaying them.
+
+        The result is identical to that of a new :class:`FlashFilter` with the same mode and
+        length, fed :class:`FrameTimecode` objects backed by the same timestamps (seconds if
+        `time_base` is None, otherwise :class:`Timecode` PTS values). Does not affect the state
+        used by :meth:`filter`.
+
+        Arguments:
+            timestamps: Presentation time of each frame, in non-decreasing order. Either float
+                seconds, or integer PTS in units of `time_base` if set.
+            above_threshold: Whether each frame's score was above the detector threshold.
+            time_base: Time base of `timestamps`, if they are integer PTS values.
+            frame_rate: Frame rate of the video. Required if the filter length was given as a
+                number of frames.
+
+        Returns:
+            Indices of the frames at which cuts are emitted, in ascending order.
+
+        Raises:
+            ValueError: Array shapes don't match, or `frame_rate` is required but not set.
+        """
+        above = numpy.asarray(above_threshold, dtype=bool)
+        times = numpy.asarray(timestamps, dtype=numpy.int64 if time_base else numpy.float64)
+        if above.ndim != 1 or times.shape != above.shape:
+            raise ValueError("timestamps and above_threshold must be 1D arrays of equal length.")
+        if self._is_disabled:
+            return numpy.flatnonzero(above)
+        filter_secs = self._filter_secs
+        rate = framerate_to_fraction(frame_rate) if frame_rate is not None else None
+        if filter_secs is None:
+            if rate is None:
+                raise ValueError("frame_rate is required when the filter length is in frames.")
+            filter_secs = self._filter_length / float(rate)
+        # Minimum distance between two timestamps, compared the same way `filter` does.
+        length: float | int = filter_secs
+        if time_base:
+            length = _MinLength(filter_secs).min_pts(Fraction(time_base), rate or Fraction(1))
+        candidates = numpy.flatnonzero(above)
+        if len(times) == 0 or len(candidates) == 0:
+            return candidates
+        if self._mode == FlashFilter.Mode.SUPPRESS:
+            return self._filter_array_suppress(times, candidates, length)
+        if self._mode == FlashFilter.Mode.MERGE:
+            return self._filter_array_merge(times, candidates, length)
+        raise RuntimeError("Unhandled FlashFilter mode.")
+
+    @staticmethod
+    def _first_met(times: numpy.ndarray, start: int, origin, length) -> int:
+        """Index of the first of the (sorted) `times` at or after `start` for which
+        ``(time - origin) >= length``, or ``len(times)`` if there is none. The search is done on
+        ``origin + length`` and then corrected, since float subtraction may round differently."""
+        index = max(start, int(numpy.searchsorted(times, origin + length, side="left")))
+        while index > start and (times[index - 1] - origin) >= length:
+            index -= 1
+        while index < len(times) and not (times[index] - origin) >= length:
+            index += 1
+        return index
+
+    def _filter_array_suppress(
+        self, times: numpy.ndarray, candidates: numpy.ndarray, length
+    ) -> numpy.ndarray:
+        # A cut is emitted at the first frame above the threshold at least `length` after the
+        # previous cut (or the first frame), which then becomes the reference for the next one.
+        candidate_times = times[candidates]
+        cuts = []
+        origin, start = times[0], 0
+        while True:
+            start = self._first_met(candidate_times, start, origin, length)
+            if start >= len(candidates):
+                break
+            cuts.append(candidates[start])
+            origin = candidate_times[start]
+            start += 1
+        return numpy.array(cuts, dtype=numpy.intp)
+
+    def _filter_array_merge(
+        self, times: numpy.ndarray, candidates: numpy.ndarray, length
+    ) -> numpy.ndarray:
+        candidate_times = times[candidates]
+        # Whether each candidate is at least `length` after the previous one (or the first frame).
+        previous = numpy.concatenate((times[:1], candidate_times[:-1]))
+        gap_met = (candidate_times - previous) >= length
+        # Whether a frame below the threshold follows each candidate by at least `length` before
+        # the next candidate. The last frame before the next candidate is the latest such frame.
+        tail = numpy.append(candidates[1:] - 1, len(times) - 1)
+        tail_met = (tail > candidates) & ((times[tail] - candidate_times) >= length)
+        gap_not_met = numpy.flatnonzero(~gap_met)
+        tail_met = numpy.flatnonzero(tail_met)
+        # No merging happens until the first cut, which is the first candidate meeting the gap.
+        first = numpy.flatnonzero(gap_met)
+        if len(first) == 0:
+            return numpy.empty(0, dtype=numpy.intp)
+        cuts: list[numpy.ndarray] = []
+        start = int(first[0])
+        while start < len(candidates):
+            # Every candidate meeting the gap emits a cut, up until the first which doesn't.
+            index = int(numpy.searchsorted(gap_not_met, start, side="left"))
+            if index == len(gap_not_met):
+                cuts.append(candidates[start:])
+                break
+            merge_start = int(gap_not_met[index])
+            cuts.append(candidates[start:merge_start])
+            # That candidate starts merging. Merging ends (emitting a cut at the last candidate)
+            # once a candidate is at least `length` after the merge start, and is followed by
+            # `length` below the threshold.
+            index = self._first_met(
+                candidate_times, merge_start, candidate_times[merge_start], length
+            )
+            index = int(numpy.searchsorted(tail_met, index, side="left"))
+            if index == len(tail_met):
+                break
+            merge_end = int(tail_met[index])
+            cuts.append(candidates[merge_end : merge_end + 1])
+            start = merge_end + 1
+        return numpy.concatenate(cuts).astype(numpy.intp)
+
     def _filter_suppress(
         self, timecode: FrameTimecode, above_threshold: bool
     ) -> list[FrameTimecode]:
@@ -176,9 +314,12 @@ class FlashFilter:
         assert self._last_above is not None
         # Compute the threshold in seconds once from the first frame's framerate. This avoids
         # using an incorrect average fps (e.g. OpenCV on VFR video) on subsequent frames.
-        if self._filter_secs is None:
-            self._filter_secs = self._filter_length / float(frame_rate)
-        min_length_met: bool = (timecode - self._last_above) >= self._filter_secs
+        if self._min_length is None:
+            if self._filter_secs is None:
+                self._filter_secs = self._filter_length / float(frame_rate)
+            self._min_length = _MinLength(self._filter_secs)
+            self._frame_rate = float(frame_rate)
+        min_length_met: bool = self._min_length.met(timecode, self._last_above)
         if not (above_threshold and min_length_met):
             return []
         # Both length and threshold requirements were satisfied. Emit the cut, and wait until both
@@ -191,9 +332,12 @@ class FlashFilter:
         assert frame_rate is not None and frame_rate >= 0
         assert self._last_above is not None
         # Compute the threshold in seconds once from the first frame's framerate.
-        if self._filter_secs is None:
-            self._filter_secs = self._filter_length / float(frame_rate)
-        min_length_met: bool = (timecode - self._last_above) >= self._filter_secs
+        if self._min_length is None:
+            if self._filter_secs is None:
+                self._filter_secs = self._filter_length / float(frame_rate)
+            self._min_length = _MinLength(self._filter_secs)
+            self._frame_rate = float(frame_rate)
+        min_length_met: bool = self._min_length.met(timecode, self._last_above)
         # Ensure last frame is always advanced to the most recent one that was above the threshold.
         if above_threshold:
             self._last_above = timecode
@@ -203,7 +347,7 @@ class FlashFilter:
             if (
                 min_length_met
                 and not above_threshold
-                and (self._last_above - self._merge_start) >= self._filter_secs
+                and self._min_length.met(self._last_above, self._merge_start)
             ):
                 self._merge_triggered = False
                 return [self._last_above]
@@ -20,7 +20,7 @@ from logging import getLogger
 
 import numpy as np
 
-from scenedetect.common import FrameTimecode, TimecodeLike
+from scenedetect.common import FrameTimecode, TimecodeLike, _MinLength
 from scenedetect.detectors import ContentDetector
 
 logger = getLogger("pyscenedetect")
@@ -77,7 +77,7 @@ class AdaptiveDetector(ContentDetector):
         )
 
         # TODO: Turn these public options into properties.
-        self.min_scene_len = min_scene_len
+        self._min_length = _MinLength(min_scene_len)
         self.adaptive_threshold = adaptive_threshold
         self.min_content_val = min_content_val
         self.window_width = window_width
@@ -90,6 +90,15 @@ class AdaptiveDetector(ContentDetector):
         # and serves a different purpose!
         self._last_cut: FrameTimecode | None = None
 
+    @property
+    def min_scene_len(self) -> TimecodeLike:
+        """Once a cut is detected, this much time must pass before a new one can be added."""
+        return self._min_length.length
+
+    @min_scene_len.setter
+    def min_scene_len(self, value: TimecodeLike):
+        self._min_length = _MinLength(value)
+
     @property
     def event_buffer_length(self) -> int:
         return self.window_width
@@ -136,7 +145,7 @@ class AdaptiveDetector(ContentDetector):
         threshold_met: bool = (
             adaptive_ratio >= self.adaptive_threshold and target_score >= self.min_content_val
         )
-        min_length_met: bool = (timecode - self._last_cut) >= self.min_scene_len
+        min_length_met: bool = self._min_length.met(timecode, self._last_cut)
         if threshold_met and min_length_met:
             self._last_cut = target_timecode
             return [target_timecode]
@@ -19,7 +19,7 @@ This detector is available from the command-line interface by using the `detect-
 import cv2
 import numpy
 
-from scenedetect.common import FrameTimecode, TimecodeLike
+from scenedetect.common import FrameTimecode, TimecodeLike, _MinLength
 from scenedetect.detector import SceneDetector
 
 
@@ -53,7 +53,7 @@ class HashDetector(SceneDetector):
     ):
         super().__init__()
         self._threshold = threshold
-        self._min_scene_len = min_scene_len
+        self._min_scene_len = _MinLength(min_scene_len)
         self._size = size
         self._size_sq = float(size * size)
         self._factor = lowpass
@@ -107,7 +107,7 @@ class HashDetector(SceneDetector):
             # We consider any frame over the threshold a new scene, but only if
             # the minimum scene length has been reached (otherwise it is ignored).
             if hash_dist_norm >= self._threshold and (
-                (timecode - self._last_scene_cut) >= self._min_scene_len
+                self._min_scene_len.met(timecode, self._last_scene_cut)
             ):
                 cut_list.append(timecode)
                 self._last_scene_cut = timecode
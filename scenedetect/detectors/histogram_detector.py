@@ -20,7 +20,7 @@ import typing as ty
 import cv2
 import numpy
 
-from scenedetect.common import FrameTimecode, TimecodeLike
+from scenedetect.common import FrameTimecode, TimecodeLike, _MinLength
 from scenedetect.detector import SceneDetector
 
 
@@ -51,7 +51,7 @@ class HistogramDetector(SceneDetector):
         # between -1.0 and 1.0.
         self._threshold = max(0.0, min(1.0, 1.0 - threshold))
         self._bins = bins
-        self._min_scene_len = min_scene_len
+        self._min_scene_len = _MinLength(min_scene_len)
         self._last_hist = None
         self._last_cut = None
         self._metric_key = f"hist_diff [bins={self._bins}]"
@@ -105,9 +105,7 @@ class HistogramDetector(SceneDetector):
             # Example: If `_threshold` is set to 0.8, it implies that only changes resulting in a
             # correlation less than 0.8 between histograms will be considered significant enough to
             # denote a scene change.
-            if hist_diff <= self._threshold and (
-                (timecode - self._last_cut) >= self._min_scene_len
-            ):
+            if hist_diff <= self._threshold and (self._min_scene_len.met(timecode, self._last_cut)):
                 cut_list.append(timecode)
                 self._last_cut = timecode
 
@@ -93,6 +93,16 @@ class ThresholdDetector(SceneDetector):
             "type": None,  # type of fade, can be either 'in' or 'out'
         }
         self._metric_keys = [ThresholdDetector.THRESHOLD_VALUE_KEY]
+        # Position of the last frame that was processed.
+        self._last_position: FrameTimecode | None = None
+
+    @property
+    def event_buffer_length(self) -> int:
+        # Cuts are placed between a fade-out and the following fade-in, so while faded out, a cut
+        # can still be emitted as far back as the frame where the fade-out started.
+        if self.last_fade["type"] != "out" or self._last_position is None:
+            return 0
+        return self._last_position.frame_num - self.last_fade["frame"].frame_num
 
     def get_metrics(self) -> list[str]:
         return self._metric_keys
@@ -165,6 +175,7 @@ class ThresholdDetector(SceneDetector):
             else:
                 self.last_fade["type"] = "in"
         self.processed_frame = True
+        self._last_position = timecode
         return cuts
 
     def post_process(self, timecode: FrameTimecode) -> list[FrameTimecode]:
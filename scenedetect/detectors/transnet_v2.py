@@ -14,6 +14,8 @@
 This detector is available from the command-line as the `detect-transnetv2` command.
 """
 
+import threading
+import typing as ty
 from logging import getLogger
 from pathlib import Path
 
@@ -25,6 +27,29 @@ from scenedetect.detector import FlashFilter, SceneDetector
 
 logger = getLogger("pyscenedetect")
 
+_SESSIONS: dict[tuple[str, tuple[str, ...]], ty.Any] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_session(model_path: str | Path, onnx_providers: list[str] | None) -> ty.Any:
+    """Get an inference session for the model at `model_path`, loading it on first use. Sessions
+    are shared by all detectors in the process (running a session is thread-safe), so the model
+    is only loaded once when processing many videos (e.g. with `scenedetect serve`)."""
+    import onnxruntime as ort  # pyright: ignore[reportMissingImports]
+
+    if onnx_providers is None:
+        onnx_providers = ort.get_available_providers()
+    key = (str(Path(model_path).resolve()), tuple(onnx_providers))
+    with _SESSIONS_LOCK:
+        if key not in _SESSIONS:
+            ort.set_default_logger_severity(3)
+            sess_opt = ort.SessionOptions()
+            sess_opt.log_severity_level = 3
+            _SESSIONS[key] = ort.InferenceSession(
+                model_path, sess_opt=sess_opt, providers=onnx_providers
+            )
+        return _SESSIONS[key]
+
 
 class Detector:
     def __init__(self, threshold: float, flash_filter: FlashFilter):
@@ -54,17 +79,7 @@ class Predictor:
         onnx_providers: list[str] | None,
         threshold,
     ):
-        import onnxruntime as ort  # pyright: ignore[reportMissingImports]
-
-        ort.set_default_logger_severity(3)
-
-        if onnx_providers is None:
-            onnx_providers = ort.get_available_providers()
-
-        sess_opt = ort.SessionOptions()
-        sess_opt.log_severity_level = 3
-
-        self.session = ort.InferenceSession(model_path, sess_opt=sess_opt, providers=onnx_providers)
+        self.session = _get_session(model_path, onnx_providers)
 
         self.pixels = None
         self.time = None
@@ -157,6 +172,12 @@ class TransnetV2Detector(SceneDetector):
         # `min_scene_len` which should be specified in seconds, not frames.
         self._flash_filter = FlashFilter(mode=filter_mode, length=min_scene_len)
 
+    @property
+    def event_buffer_length(self) -> int:
+        # Predictions are made once a full window of frames is buffered, and each one also needs
+        # frames from the previous window for context.
+        return 2 * self.px.shape[1] + self._flash_filter.max_behind
+
     def mk_ft(self, pts: int):
         # t = Timecode(pts=pts, time_base=self.time_base)
         t = float(pts * self.time_base)
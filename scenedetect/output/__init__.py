@@ -20,6 +20,7 @@ import json
 import logging
 import math
 import typing as ty
+from abc import ABC, abstractmethod
 from fractions import Fraction
 from pathlib import Path
 from xml.dom import minidom
@@ -58,12 +59,18 @@ from scenedetect.output.video import (
 from scenedetect.output.video import (
     is_mkvmerge_available as is_mkvmerge_available,
 )
+from scenedetect.output.video import (
+    is_pyav_available as is_pyav_available,
+)
 from scenedetect.output.video import (
     split_video_ffmpeg as split_video_ffmpeg,
 )
 from scenedetect.output.video import (
     split_video_mkvmerge as split_video_mkvmerge,
 )
+from scenedetect.output.video import (
+    split_video_pyav as split_video_pyav,
+)
 
 logger = logging.getLogger("pyscenedetect")
 
@@ -112,36 +119,157 @@ def write_scene_list(
             if cut_list
             else [start.get_timecode() for start, _ in scene_list[1:]]
         )
-    csv_writer.writerow(
-        [
-            "Scene Number",
-            "Start Frame",
-            "Start Timecode",
-            "Start Time (seconds)",
-            "End Frame",
-            "End Timecode",
-            "End Time (seconds)",
-            "Length (frames)",
-            "Length (timecode)",
-            "Length (seconds)",
-        ]
-    )
+    csv_writer.writerow(_SCENE_LIST_HEADER)
     for i, (start, end) in enumerate(scene_list):
-        duration = end - start
-        csv_writer.writerow(
-            [
-                f"{i + 1:d}",
-                f"{start.frame_num + 1:d}",
-                start.get_timecode(),
-                f"{start.seconds:.3f}",
-                f"{end.frame_num:d}",
-                end.get_timecode(),
-                f"{end.seconds:.3f}",
-                f"{duration.frame_num:d}",
-                duration.get_timecode(),
-                f"{duration.seconds:.3f}",
-            ]
+        csv_writer.writerow(_scene_list_row(i + 1, start, end))
+
+
+_SCENE_LIST_HEADER = [
+    "Scene Number",
+    "Start Frame",
+    "Start Timecode",
+    "Start Time (seconds)",
+    "End Frame",
+    "End Timecode",
+    "End Time (seconds)",
+    "Length (frames)",
+    "Length (timecode)",
+    "Length (seconds)",
+]
+"""Header row of scene list CSV files."""
+
+
+def _scene_list_row(scene_number: int, start: FrameTimecode, end: FrameTimecode) -> list[str]:
+    """Get the row of a scene list CSV file for a scene, in the order of `_SCENE_LIST_HEADER`."""
+    duration = end - start
+    return [
+        f"{scene_number:d}",
+        f"{start.frame_num + 1:d}",
+        start.get_timecode(),
+        f"{start.seconds:.3f}",
+        f"{end.frame_num:d}",
+        end.get_timecode(),
+        f"{end.seconds:.3f}",
+        f"{duration.frame_num:d}",
+        duration.get_timecode(),
+        f"{duration.seconds:.3f}",
+    ]
+
+
+class SceneListWriter(ABC):
+    """Base class for writing scenes to a file one at a time, e.g. as they are yielded by
+    :meth:`SceneManager.stream_scenes <scenedetect.scene_manager.SceneManager.stream_scenes>`.
+
+    The file is flushed after every scene so other processes can start reading the scenes before
+    detection is complete. Can be used as a context manager to close the file when done.
+    """
+
+    def __init__(self, output_file: ty.TextIO | str | Path):
+        """
+        Arguments:
+            output_file: Handle to open file in write mode, or a filesystem path. A path is
+                opened when the writer is created and closed by :meth:`close`.
+        """
+        self._owns_file = isinstance(output_file, (str, Path))
+        self._file: ty.TextIO = (
+            open(output_file, "w", newline="")  # noqa: SIM115
+            if self._owns_file
+            else output_file
         )
+        self._num_scenes = 0
+
+    @property
+    def num_scenes(self) -> int:
+        """Number of scenes written so far."""
+        return self._num_scenes
+
+    def write(self, scene: tuple[FrameTimecode, FrameTimecode]) -> None:
+        """Write the next scene and flush it to the file."""
+        (start, end) = scene
+        self._num_scenes += 1
+        self._write_scene(self._num_scenes, start, end)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the output file if it was opened by this writer, otherwise just flush it."""
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "SceneListWriter":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @abstractmethod
+    def _write_scene(self, scene_number: int, start: FrameTimecode, end: FrameTimecode) -> None:
+        pass
+
+
+class CsvSceneListWriter(SceneListWriter):
+    """Writes scenes to a CSV file as they are detected, using the same columns as
+    :func:`write_scene_list`. The cut list row is never written since the cuts are not known
+    ahead of time, so the output is RFC 4180 compliant."""
+
+    def __init__(
+        self,
+        output_file: ty.TextIO | str | Path,
+        col_separator: str = ",",
+        row_separator: str = "\n",
+    ):
+        """
+        Arguments:
+            output_file: Handle to open file in write mode, or a filesystem path.
+            col_separator: Delimiter to use between values. Must be single character.
+            row_separator: Line terminator to use between rows.
+
+        Raises:
+            TypeError: "delimiter" must be a 1-character string
+        """
+        super().__init__(output_file)
+        try:
+            self._csv_writer = csv.writer(
+                self._file, delimiter=col_separator, lineterminator=row_separator
+            )
+            self._csv_writer.writerow(_SCENE_LIST_HEADER)
+        except BaseException:
+            self.close()
+            raise
+        self._file.flush()
+
+    def _write_scene(self, scene_number: int, start: FrameTimecode, end: FrameTimecode) -> None:
+        self._csv_writer.writerow(_scene_list_row(scene_number, start, end))
+
+
+class JsonLinesSceneListWriter(SceneListWriter):
+    """Writes scenes to a JSON Lines file as they are detected, one JSON object per line. Each
+    object has the same fields as the columns of :func:`write_scene_list`:
+
+    .. code:: json
+
+        {"scene_number": 1, "start_frame": 1, "start_timecode": "00:00:00.000",
+         "start_seconds": 0.0, "end_frame": 90, "end_timecode": "00:00:03.754",
+         "end_seconds": 3.754, "length_frames": 90, "length_timecode": "00:00:03.754",
+         "length_seconds": 3.754}
+    """
+
+    def _write_scene(self, scene_number: int, start: FrameTimecode, end: FrameTimecode) -> None:
+        duration = end - start
+        scene = {
+            "scene_number": scene_number,
+            "start_frame": start.frame_num + 1,
+            "start_timecode": start.get_timecode(),
+            "start_seconds": round(start.seconds, 3),
+            "end_frame": end.frame_num,
+            "end_timecode": end.get_timecode(),
+            "end_seconds": round(end.seconds, 3),
+            "length_frames": duration.frame_num,
+            "length_timecode": duration.get_timecode(),
+            "length_seconds": round(duration.seconds, 3),
+        }
+        self._file.write(json.dumps(scene) + "\n")
 
 
 def write_scene_list_html(
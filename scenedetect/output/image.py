@@ -321,7 +321,7 @@ class _ImageExtractor:
                 continue
             save_queue.put((encoded, dest_path))
 
-    def image_save_thread(self, save_queue: queue.Queue, progress_bar: tqdm):
+    def image_save_thread(self, save_queue: queue.Queue, progress_bar: ty.Any):
         while True:
             encoded, dest_path = save_queue.get()
             if encoded is None:
@@ -16,7 +16,7 @@
 # see the included LICENSE-FFMPEG and LICENSE-MKVMERGE files.
 #
 """The ``scenedetect.output.video`` module contains functions to split existing videos into clips
-using ffmpeg or mkvmerge.
+using ffmpeg or mkvmerge, or in-process using PyAV (:func:`split_video_pyav`).
 
 These programs can be obtained from following URLs (note that mkvmerge is a part mkvtoolnix):
 
@@ -28,8 +28,11 @@ If you are a Linux user, you can likely obtain the above programs from your pack
 Once installed, ensure the program can be accessed system-wide by calling the `mkvmerge` or `ffmpeg`
 command from a terminal/command prompt. PySceneDetect will automatically use whichever program is
 available on the computer, depending on the specified command-line options.
+
+:func:`split_video_pyav` does not require any external programs, only the optional `av` package.
 """
 
+import importlib.util
 import logging
 import math
 import time
@@ -69,6 +72,10 @@ _DEFAULT_FFMPEG_ARGS = (
 )
 """Default arguments passed to ffmpeg when invoking the `split_video_ffmpeg` function."""
 
+_DEFAULT_PYAV_CODEC_OPTIONS = {"preset": "veryfast", "crf": "22"}
+"""Default encoder options used by `split_video_pyav` when re-encoding (equivalent to the
+video options in `_DEFAULT_FFMPEG_ARGS`)."""
+
 ##
 ## Command Availability Checking Functions
 ##
@@ -92,6 +99,15 @@ def is_ffmpeg_available() -> bool:
     return _FFMPEG_PATH is not None
 
 
+def is_pyav_available() -> bool:
+    """Is PyAV Available: Gracefully checks if the `av` module can be imported.
+
+    Returns:
+        True if :func:`split_video_pyav` can be used, False otherwise.
+    """
+    return importlib.util.find_spec("av") is not None
+
+
 ##
 ## Output Naming
 ##
@@ -387,3 +403,294 @@ def split_video_ffmpeg(
             " Please install ffmpeg to enable video output support."
         )
     return ret_val
+
+
+class _PyAVSceneOutput:
+    """Output container for one scene being written by :func:`split_video_pyav`."""
+
+    def __init__(self, container: ty.Any, start: float, end: float, offset: float):
+        self.container = container
+        self.start = start
+        self.end = end
+        # Time of the first frame written to this output. All timestamps are shifted by this
+        # amount so each output starts at zero. May precede `start` in copy mode, since output
+        # has to begin on a keyframe.
+        self.offset = offset
+        # Maps each input stream index to the corresponding output stream.
+        self.streams: dict[int, ty.Any] = {}
+        # Set once the video stream has moved past `end`.
+        self.video_done = False
+        # Indices of the audio streams which have moved past `end`.
+        self.audio_done: set[int] = set()
+
+    def is_done(self, num_audio_streams: int) -> bool:
+        return self.video_done and len(self.audio_done) == num_audio_streams
+
+
+def _stream_seconds(stream: ty.Any, timestamp: int) -> float:
+    """Convert `timestamp` (in the time base of `stream`) to seconds relative to the first
+    presentation time of the stream. Matches the normalization done by `VideoStreamAv`."""
+    return float((timestamp - (stream.start_time or 0)) * stream.time_base)
+
+
+def _stream_timestamp(stream: ty.Any, seconds: float) -> int:
+    """Inverse of `_stream_seconds`."""
+    return round(seconds / stream.time_base) + (stream.start_time or 0)
+
+
+def _mux_packet(output: _PyAVSceneOutput, packet: ty.Any, pts: int, dts: int | None) -> None:
+    """Write `packet` to `output`, shifting timestamps by the output's offset. `pts` and `dts` are
+    the original values from the input: muxing rebases the packet in place, and the same packet
+    may be written to more than one output in copy mode."""
+    in_stream = packet.stream
+    shift = _stream_timestamp(in_stream, output.offset) - (in_stream.start_time or 0)
+    packet.stream = output.streams[in_stream.index]
+    packet.time_base = in_stream.time_base
+    packet.pts = pts - shift
+    packet.dts = None if dts is None else dts - shift
+    try:
+        output.container.mux(packet)
+    finally:
+        packet.stream = in_stream
+        packet.time_base = in_stream.time_base
+        packet.pts = pts
+        packet.dts = dts
+
+
+def split_video_pyav(
+    input_video_path: str,
+    scene_list: Sequence[TimecodePair],
+    output_dir: str | Path | None = None,
+    output_file_template: str = "$VIDEO_NAME-Scene-$SCENE_NUMBER.mp4",
+    video_name: str | None = None,
+    copy: bool = False,
+    video_codec: str = "libx264",
+    codec_options: dict[str, str] | None = None,
+    show_progress: bool = False,
+    formatter: PathFormatter | None = None,
+) -> int:
+    """Split `input_video_path` in-process using PyAV based on the scenes in `scene_list`.
+
+    Unlike :func:`split_video_ffmpeg`, the input is only demuxed once, and packets are routed to
+    the output for each scene as they are read. No external programs are required, only the `av`
+    package. Audio streams are always copied. Video is re-encoded using `video_codec` unless
+    `copy` is set, in which case packets are copied as-is and each output starts on the nearest
+    keyframe before the scene (faster, but less precise).
+
+    Arguments:
+        input_video_path: Path to the video to be split.
+        scene_list: List of scenes (pairs of FrameTimecodes) denoting the start/end of each scene.
+        output_dir: Directory to output videos. If not set, output will be in working directory.
+        output_file_template: Template to use for generating output filenames.
+            The following variables will be replaced in the template for each scene:
+            $VIDEO_NAME, $SCENE_NUMBER, $START_TIME, $END_TIME, $START_FRAME, $END_FRAME
+        video_name: Name of the video to be substituted in output_file_template. If not
+            passed will be calculated from input_video_path automatically.
+        copy: If True, copy the video stream instead of re-encoding it.
+        video_codec: Name of the codec used to encode video if `copy` is False.
+        codec_options: Options passed to the video encoder. Defaults to the same preset and
+            rate factor used by :func:`split_video_ffmpeg`.
+        show_progress: If True, will show progress bar provided by tqdm (if installed).
+        formatter: Custom formatter callback. Overrides `output_file_template`.
+
+    Returns:
+        0 on success, or 1 if an error occurred. If scene_list is empty, will still return 0,
+        but the input will not be opened.
+    """
+    if not scene_list:
+        return 0
+    # PyAV is an optional dependency, so only import it when it is actually used.
+    import av
+
+    if video_name is None:
+        video_name = Path(input_video_path).stem
+    if formatter is None:
+        formatter = default_formatter(output_file_template)
+    if codec_options is None:
+        codec_options = dict(_DEFAULT_PYAV_CODEC_OPTIONS)
+    video_metadata = VideoMetadata(
+        name=video_name, path=Path(input_video_path), total_scenes=len(scene_list)
+    )
+    bounds = [(start.seconds, end.seconds) for start, end in scene_list]
+    logger.info(
+        "Splitting video with PyAV (%s), output path template:\n  %s",
+        "copy" if copy else video_codec,
+        output_file_template,
+    )
+
+    try:
+        input_container = av.open(input_video_path)
+    except (OSError, av.error.FFmpegError) as ex:  # type: ignore[attr-defined]
+        logger.error("Failed to open %s: %s", input_video_path, ex)
+        return 1
+    in_video = input_container.streams.video[0]
+    in_audio = list(input_container.streams.audio)
+    frame_rate = in_video.average_rate or in_video.guessed_rate
+    # Frames within half a frame of a scene boundary are considered to be on it, since scene
+    # timecodes may be derived from frame numbers rather than from the stream timestamps.
+    epsilon = 0.5 / float(frame_rate) if frame_rate else 1.0e-6
+
+    outputs: list[_PyAVSceneOutput] = []
+    next_scene = 0
+    # Packets which may still belong to a scene that has not been opened yet, along with their
+    # original pts/dts. In copy mode this holds everything since the last video keyframe.
+    # Otherwise it only holds audio, since decoder delay means audio for a scene can be demuxed
+    # before the first video frame of that scene is decoded.
+    pending: list[tuple[ty.Any, int, int | None]] = []
+
+    def open_scene(offset: float) -> _PyAVSceneOutput:
+        nonlocal next_scene
+        start_time, end_time = scene_list[next_scene]
+        scene_metadata = SceneMetadata(index=next_scene, start=start_time, end=end_time)
+        output_path = Path(formatter(video_metadata, scene_metadata))
+        if output_dir:
+            output_path = Path(output_dir) / output_path
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output = _PyAVSceneOutput(
+            container=av.open(str(output_path), "w"),
+            start=bounds[next_scene][0],
+            end=bounds[next_scene][1],
+            offset=offset,
+        )
+        next_scene += 1
+        outputs.append(output)
+        if copy:
+            output.streams[in_video.index] = output.container.add_stream_from_template(in_video)
+        else:
+            out_video = output.container.add_stream(
+                video_codec, rate=frame_rate, options=codec_options
+            )
+            out_video.width = in_video.codec_context.width
+            out_video.height = in_video.codec_context.height
+            out_video.pix_fmt = "yuv420p"
+            output.streams[in_video.index] = out_video
+        for stream in in_audio:
+            output.streams[stream.index] = output.container.add_stream_from_template(stream)
+        for packet, pts, dts in pending:
+            packet_time = _stream_seconds(packet.stream, pts)
+            if output.offset - epsilon <= packet_time < output.end - epsilon:
+                _mux_packet(output, packet, pts, dts)
+        return output
+
+    def finish_video(output: _PyAVSceneOutput) -> None:
+        output.video_done = True
+        if not copy:
+            for packet in output.streams[in_video.index].encode(None):
+                output.container.mux(packet)
+
+    def close_scene(output: _PyAVSceneOutput) -> None:
+        if not output.video_done:
+            finish_video(output)
+        outputs.remove(output)
+        output.container.close()
+
+    def route_packet(packet: ty.Any, packet_time: float) -> None:
+        is_video = packet.stream.index == in_video.index
+        # Decode order is monotonic in dts, so once it passes the end of a scene, no later
+        # packets from the same stream can belong to that scene.
+        order_time = packet_time
+        if packet.dts is not None:
+            order_time = _stream_seconds(packet.stream, packet.dts)
+        for output in list(outputs):
+            if output.video_done if is_video else packet.stream.index in output.audio_done:
+                continue
+            if order_time >= output.end - epsilon:
+                if is_video:
+                    finish_video(output)
+                else:
+                    output.audio_done.add(packet.stream.index)
+                if output.is_done(len(in_audio)):
+                    close_scene(output)
+            elif output.offset - epsilon <= packet_time < output.end - epsilon:
+                _mux_packet(output, packet, packet.pts, packet.dts)
+
+    last_frame_time = -1.0
+
+    def route_frame(frame: ty.Any) -> None:
+        nonlocal last_frame_time
+        frame_pts = frame.pts
+        if frame_pts is None:
+            frame_pts = _stream_timestamp(in_video, last_frame_time + float(1 / frame_rate))
+        frame_time = _stream_seconds(in_video, frame_pts)
+        last_frame_time = frame_time
+        while next_scene < len(bounds) and frame_time >= bounds[next_scene][0] - epsilon:
+            open_scene(offset=frame_time)
+        for output in list(outputs):
+            if output.video_done:
+                continue
+            if frame_time >= output.end - epsilon:
+                finish_video(output)
+                if output.is_done(len(in_audio)):
+                    close_scene(output)
+                continue
+            frame.pts = frame_pts - _stream_timestamp(in_video, output.offset)
+            frame.pts += in_video.start_time or 0
+            frame.time_base = in_video.time_base
+            for packet in output.streams[in_video.index].encode(frame):
+                output.container.mux(packet)
+            if progress_bar is not None:
+                progress_bar.update(1)
+
+    ret_val = 0
+    progress_bar = None
+    total_frames = scene_list[-1][1].frame_num - scene_list[0][0].frame_num
+    processing_start_time = time.time()
+    try:
+        if show_progress:
+            progress_bar = tqdm(total=total_frames, unit="frame", miniters=1, dynamic_ncols=True)
+        for packet in input_container.demux([in_video, *in_audio]):
+            if next_scene >= len(bounds) and not outputs:
+                break
+            is_video = packet.stream.index == in_video.index
+            if is_video and not copy:
+                for frame in packet.decode():
+                    route_frame(frame)
+                continue
+            # Packets used to flush the demuxer have no timestamps.
+            if packet.pts is None:
+                continue
+            packet_time = _stream_seconds(packet.stream, packet.pts)
+            if is_video:
+                if packet.is_keyframe:
+                    pending.clear()
+                # Outputs have to start on the keyframe at the beginning of `pending`.
+                while next_scene < len(bounds) and packet_time >= bounds[next_scene][0] - epsilon:
+                    offset = packet_time
+                    if pending:
+                        keyframe, keyframe_pts, _ = pending[0]
+                        offset = min(offset, _stream_seconds(keyframe.stream, keyframe_pts))
+                    open_scene(offset=offset)
+                if progress_bar is not None and bounds[0][0] <= packet_time < bounds[-1][1]:
+                    progress_bar.update(1)
+            route_packet(packet, packet_time)
+            pending.append((packet, packet.pts, packet.dts))
+            if not copy:
+                # Audio before the start of the next scene to be opened is no longer needed.
+                next_start = bounds[next_scene][0] if next_scene < len(bounds) else math.inf
+                pending = [
+                    entry
+                    for entry in pending
+                    if _stream_seconds(entry[0].stream, entry[1]) >= next_start - epsilon
+                ]
+        # Any frames still buffered in the decoder are flushed by the final (empty) packet from
+        # the demuxer, so all that remains is to finish the outputs still open.
+        for output in list(outputs):
+            close_scene(output)
+        if next_scene < len(bounds):
+            logger.warning(
+                "Input ended before all scenes were written (%d of %d).", next_scene, len(bounds)
+            )
+    except (OSError, av.error.FFmpegError) as ex:  # type: ignore[attr-defined]
+        logger.error("Error splitting video (PyAV): %s", ex)
+        ret_val = 1
+    finally:
+        for output in outputs:
+            output.container.close()
+        input_container.close()
+        if progress_bar is not None:
+            progress_bar.close()
+    logger.debug(
+        "Average processing speed %.2f frames/sec.",
+        float(total_frames) / max(time.time() - processing_start_time, 1.0e-6),
+    )
+    return ret_val
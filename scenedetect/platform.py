@@ -15,7 +15,7 @@ This module contains all platform/library specific compatibility fixes, as well
 functions to handle logging and invoking external commands.
 """
 
-import importlib.metadata
+import importlib
 import logging
 import os
 import os.path
@@ -79,13 +79,28 @@ class FakeTqdmLoggingRedirect:
         """No-op."""
 
 
-# Try to import tqdm and the logging redirect, otherwise provide fake implementations..
-try:
-    from tqdm import tqdm
-    from tqdm.contrib.logging import logging_redirect_tqdm
-except ModuleNotFoundError:
-    tqdm = FakeTqdmObject
-    logging_redirect_tqdm = FakeTqdmLoggingRedirect
+# tqdm is only imported once the first progress bar is created, since importing it takes longer
+# than the rest of this package. If it isn't available, fake implementations are used instead.
+
+
+def tqdm(*args, **kwargs):
+    """Create a `tqdm.tqdm` progress bar, or a no-op one if tqdm is not installed."""
+    try:
+        from tqdm import tqdm as _tqdm
+    except ModuleNotFoundError:
+        return FakeTqdmObject(**kwargs)
+    return _tqdm(*args, **kwargs)
+
+
+def logging_redirect_tqdm(**kwargs):
+    """Redirect log messages so they don't conflict with any progress bars. Wraps
+    `tqdm.contrib.logging.logging_redirect_tqdm`, or is a no-op if tqdm is not installed."""
+    try:
+        from tqdm.contrib.logging import logging_redirect_tqdm as _logging_redirect_tqdm
+    except ModuleNotFoundError:
+        return FakeTqdmLoggingRedirect(**kwargs)
+    return _logging_redirect_tqdm(**kwargs)
+
 
 ##
 ## OpenCV imwrite Supported Image Types & Quality/Compression Parameters
@@ -323,6 +338,8 @@ def _query_package_version(dist_name: str, fallback_module: str | None) -> str |
     `importlib.metadata` reads, so the fallback is required for frozen builds.
     Returns None when the package isn't installed.
     """
+    import importlib.metadata  # Slow to import, and only needed for version info.
+
     try:
         return importlib.metadata.version(dist_name)
     except importlib.metadata.PackageNotFoundError:
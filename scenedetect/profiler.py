@@ -0,0 +1,238 @@
+#
+#            PySceneDetect: Python-Based Video Scene Detector
+#   -------------------------------------------------------------------
+#     [  Site:    https://scenedetect.com                           ]
+#     [  Docs:    https://scenedetect.com/docs/                     ]
+#     [  Github:  https://github.com/Breakthrough/PySceneDetect/    ]
+#
+# Copyright (C) 2026 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""``scenedetect.profiler`` Module
+
+This module contains the :class:`DetectionProfile` class, which records how much time a
+:class:`SceneManager <scenedetect.scene_manager.SceneManager>` spends in each stage of scene
+detection. This shows whether detection is limited by decoding the video or by the detectors,
+without needing to attach a profiler:
+
+.. code:: python
+
+    from scenedetect import open_video, ContentDetector, DetectionProfile, SceneManager
+    video = open_video(test_video_file)
+    scene_manager = SceneManager(profile=DetectionProfile())
+    scene_manager.add_detector(ContentDetector())
+    scene_manager.detect_scenes(video=video)
+    print(scene_manager.profile.summary())
+    scene_manager.profile.save_to_json(PROFILE_FILE_PATH)
+
+Frames are decoded in a background thread, so the decode stages run in parallel with the others.
+The stages on whichever side of the frame queue took longer in total are the bottleneck.
+"""
+
+import json
+import os
+import typing as ty
+from dataclasses import dataclass
+from pathlib import Path
+
+from scenedetect.platform import StrPath
+
+STAGE_DECODE = "decode"
+"""Decoding frames, including frames which are skipped (decode thread)."""
+
+STAGE_CROP_RESIZE = "crop_resize"
+"""Cropping and downscaling decoded frames (decode thread)."""
+
+STAGE_QUEUE_WAIT = "queue_wait"
+"""Waiting for the next frame to be decoded."""
+
+STAGE_DETECTOR_PREFIX = "detector."
+"""Prefix of the stages for calling `process_frame` on each detector, followed by its type."""
+
+STAGE_CALLBACK = "callback"
+"""Calling the callback passed to :meth:`SceneManager.detect_scenes` for each new cut."""
+
+STAGE_POST_PROCESS = "post_process"
+"""Calling `post_process` on each detector after the last frame."""
+
+DECODE_STAGES = (STAGE_DECODE, STAGE_CROP_RESIZE)
+"""Stages which run in the decode thread."""
+
+
+@dataclass
+class StageTiming:
+    """Time spent in a single stage of detection."""
+
+    count: int = 0
+    """Number of times the stage was run."""
+    total: float = 0.0
+    """Total time spent in the stage in seconds."""
+    max: float = 0.0
+    """Longest time the stage took in seconds."""
+
+    @property
+    def mean(self) -> float:
+        """Average time the stage took in seconds, or 0 if it was never run."""
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, elapsed: float) -> None:
+        """Record one run of the stage which took `elapsed` seconds."""
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+
+@dataclass
+class QueueStats:
+    """Occupancy and stalls of the queue of decoded frames between the decode thread and the
+    detectors. If the producer (decode thread) is often blocked, detection is limited by the
+    detectors. If the consumer (detectors) is often starved, it is limited by decoding."""
+
+    capacity: int = 0
+    """Maximum number of frames the queue can hold."""
+    num_gets: int = 0
+    """Number of times a frame was taken from the queue."""
+    total_occupancy: int = 0
+    """Sum of the number of frames in the queue each time one was taken."""
+    max_occupancy: int = 0
+    """Most frames in the queue when one was taken."""
+    producer_blocked: int = 0
+    """Number of times the decode thread had to wait for room in the queue."""
+    producer_blocked_time: float = 0.0
+    """Time the decode thread spent waiting for room in the queue in seconds."""
+    consumer_starved: int = 0
+    """Number of times the detectors had to wait for a frame to be decoded."""
+    consumer_starved_time: float = 0.0
+    """Time the detectors spent waiting for a frame to be decoded in seconds."""
+
+    @property
+    def mean_occupancy(self) -> float:
+        """Average number of frames in the queue when one was taken."""
+        return self.total_occupancy / self.num_gets if self.num_gets else 0.0
+
+    def add(self, other: "QueueStats") -> None:
+        """Add the counters of `other` to this one."""
+        self.capacity = max(self.capacity, other.capacity)
+        self.num_gets += other.num_gets
+        self.total_occupancy += other.total_occupancy
+        self.max_occupancy = max(self.max_occupancy, other.max_occupancy)
+        self.producer_blocked += other.producer_blocked
+        self.producer_blocked_time += other.producer_blocked_time
+        self.consumer_starved += other.consumer_starved
+        self.consumer_starved_time += other.consumer_starved_time
+
+    def summary(self) -> str:
+        """Get a description of the queue statistics, suitable for printing."""
+        return (
+            f"Frame queue: capacity {self.capacity}, mean occupancy {self.mean_occupancy:.1f}, "
+            f"decoder blocked {self.producer_blocked} times ({self.producer_blocked_time:.3f} s), "
+            f"detectors starved {self.consumer_starved} times "
+            f"({self.consumer_starved_time:.3f} s)."
+        )
+
+
+class DetectionProfile:
+    """Per-stage timings of scene detection, recorded by the
+    :class:`SceneManager <scenedetect.scene_manager.SceneManager>` it is passed to. Timings of
+    each call to `detect_scenes` are added to the ones before it."""
+
+    def __init__(self):
+        self.stages: dict[str, StageTiming] = {}
+        """Timing of each stage by name, in the order the stages were first run."""
+        self.num_frames: int = 0
+        """Number of frames processed."""
+        self.wall_time: float = 0.0
+        """Total time spent detecting scenes in seconds."""
+        self.queue = QueueStats()
+        """Occupancy and stalls of the frame queue."""
+
+    def stage(self, name: str) -> StageTiming:
+        """Get the timing of the stage called `name`, adding it if it doesn't exist."""
+        timing = self.stages.get(name)
+        if timing is None:
+            timing = self.stages[name] = StageTiming()
+        return timing
+
+    @property
+    def decode_time(self) -> float:
+        """Time spent in the decode thread in seconds."""
+        return sum(self.stages[name].total for name in DECODE_STAGES if name in self.stages)
+
+    @property
+    def detect_time(self) -> float:
+        """Time spent running detectors and callbacks in seconds."""
+        return sum(
+            timing.total
+            for name, timing in self.stages.items()
+            if name.startswith(STAGE_DETECTOR_PREFIX) or name == STAGE_CALLBACK
+        )
+
+    @property
+    def bottleneck(self) -> str | None:
+        """Which side of the frame queue limits the speed of detection: "decode" or "detect",
+        or None if no frames were processed."""
+        if not self.num_frames:
+            return None
+        return "decode" if self.decode_time >= self.detect_time else "detect"
+
+    def to_dict(self) -> dict[str, ty.Any]:
+        """Get the profile as a dictionary which can be serialized as JSON. Times are in
+        seconds."""
+        return {
+            "num_frames": self.num_frames,
+            "wall_time": self.wall_time,
+            "fps": self.num_frames / self.wall_time if self.wall_time > 0 else 0.0,
+            "bottleneck": self.bottleneck,
+            "stages": {
+                name: {
+                    "count": timing.count,
+                    "total": timing.total,
+                    "mean": timing.mean,
+                    "max": timing.max,
+                }
+                for name, timing in self.stages.items()
+            },
+            "queue": {
+                "capacity": self.queue.capacity,
+                "mean_occupancy": self.queue.mean_occupancy,
+                "max_occupancy": self.queue.max_occupancy,
+                "producer_blocked": self.queue.producer_blocked,
+                "producer_blocked_time": self.queue.producer_blocked_time,
+                "consumer_starved": self.queue.consumer_starved,
+                "consumer_starved_time": self.queue.consumer_starved_time,
+            },
+        }
+
+    def save_to_json(self, json_file: StrPath | ty.TextIO) -> None:
+        """Save the profile to a JSON file.
+
+        Arguments:
+            json_file: A file handle opened in write mode (e.g. open('...', 'w')) or a path as str.
+
+        Raises:
+            OSError: If `path` cannot be opened or a write failure occurs.
+        """
+        if isinstance(json_file, (str, bytes, Path, os.PathLike)):
+            with open(json_file, "w") as file:
+                self.save_to_json(file)
+                return
+        json.dump(self.to_dict(), json_file, indent=2)
+        json_file.write("\n")
+
+    def summary(self) -> str:
+        """Get a table of the time spent in each stage, suitable for printing."""
+        lines = [f"{'Stage':<32}{'Total (s)':>12}{'Per Frame (ms)':>16}{'% of Time':>11}"]
+        for name, timing in self.stages.items():
+            per_frame = 1000.0 * timing.total / self.num_frames if self.num_frames else 0.0
+            percent = 100.0 * timing.total / self.wall_time if self.wall_time > 0 else 0.0
+            lines.append(f"{name:<32}{timing.total:>12.3f}{per_frame:>16.3f}{percent:>11.1f}")
+        if self.queue.num_gets:
+            lines.append(self.queue.summary())
+        if self.bottleneck is not None:
+            lines.append(
+                f"Processed {self.num_frames} frames in {self.wall_time:.3f} seconds, "
+                f"limited by {self.bottleneck} time."
+            )
+        return "\n".join(lines)
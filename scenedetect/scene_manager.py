@@ -49,6 +49,15 @@ An optional callback can also be invoked on each detected scene, for example:
     scene_manager.add_detector(ContentDetector())
     scene_manager.detect_scenes(video=video, callback=on_new_scene)
 
+Detection can also be run from an :mod:`asyncio` event loop without blocking it, using
+:meth:`SceneManager.detect_scenes_async`:
+
+.. code:: python
+
+    async for update in scene_manager.detect_scenes_async(video):
+        for cut in update.cuts:
+            print("New scene found at frame %d." % cut.frame_num)
+
 To use a `SceneManager` with a webcam/device or existing `cv2.VideoCapture` device, use the
 :class:`VideoCaptureAdapter <scenedetect.backends.opencv.VideoCaptureAdapter>` instead of
 `open_video`.
@@ -76,22 +85,30 @@ The statsfile can be used to find a better threshold for certain inputs, or perf
 analysis of the video.
 """
 
+import asyncio
+import bisect
+import collections
 import logging
 import queue
+import statistics
 import sys
 import threading
+import time
 import typing as ty
 import warnings
+from dataclasses import dataclass
 
 import cv2
 import numpy as np
 
+from scenedetect._frame_pool import FramePool, PooledFrame
 from scenedetect.common import (
     CropRegion,
     CutList,
     FrameTimecode,
     Interpolation,
     SceneList,
+    Subsampling,
     TimecodeLike,
 )
 from scenedetect.detector import SceneDetector
@@ -99,6 +116,17 @@ from scenedetect.detector import SceneDetector
 # TODO(v0.8): Remove the import * below, for backwards compatibility with v0.6 only.
 from scenedetect.output import *  # noqa: F403
 from scenedetect.platform import tqdm
+from scenedetect.profiler import (
+    STAGE_CALLBACK,
+    STAGE_CROP_RESIZE,
+    STAGE_DECODE,
+    STAGE_DETECTOR_PREFIX,
+    STAGE_POST_PROCESS,
+    STAGE_QUEUE_WAIT,
+    DetectionProfile,
+    QueueStats,
+    StageTiming,
+)
 from scenedetect.stats_manager import StatsManager
 from scenedetect.video_stream import VideoStream
 
@@ -111,11 +139,46 @@ DEFAULT_MIN_WIDTH: int = 256
 """The default minimum width a frame will be downscaled to when calculating a downscale factor."""
 
 MAX_FRAME_QUEUE_LENGTH: int = 4
-"""Maximum number of decoded frames which can be buffered while waiting to be processed."""
+"""Maximum number of decoded frames which can be buffered while waiting to be processed, unless
+the queue length is chosen from a memory budget (see :attr:`SceneManager.frame_queue_memory`)."""
+
+MIN_ADAPTIVE_FRAME_QUEUE_LENGTH: int = 2
+"""Minimum length of the frame queue when chosen from a memory budget."""
+
+MAX_ADAPTIVE_FRAME_QUEUE_LENGTH: int = 64
+"""Maximum length of the frame queue when chosen from a memory budget."""
 
 MAX_FRAME_SIZE_ERRORS: int = 16
 """Maximum number of frame size error messages that can be logged."""
 
+ROI_GRID_SIZE: int = 3
+"""Number of rows and columns of tiles taken from each frame with :attr:`Subsampling.ROI`."""
+
+ADAPTIVE_FRAME_SKIP_THRESHOLD: float = 8.0
+"""Minimum mean absolute difference between the pixels of two frames (after cropping and
+downscaling, from 0 to 255) for the frames skipped between them to be processed, when using
+adaptive frame skip (see :attr:`SceneManager.adaptive_frame_skip`)."""
+
+ADAPTIVE_FRAME_SKIP_RATIO: float = 1.5
+"""Minimum ratio of the difference between two frames to the median difference between the
+previous frames compared for the frames skipped between them to be processed, when using
+adaptive frame skip. Prevents processing every frame during fast motion."""
+
+ADAPTIVE_FRAME_SKIP_WINDOW: int = 8
+"""Number of previous differences between frames to take the median of for
+:data:`ADAPTIVE_FRAME_SKIP_RATIO`."""
+
+AUTO_CROP_SAMPLES: int = 12
+"""Number of frames sampled across a video to find black bars in :func:`detect_crop_region`."""
+
+AUTO_CROP_THRESHOLD: int = 24
+"""Maximum luma (0 to 255) of pixels considered black by :func:`detect_crop_region`. Video black
+is usually 16, plus some noise from compression."""
+
+AUTO_CROP_MIN_COVERAGE: float = 0.02
+"""Minimum fraction of the pixels in a row or column which must be brighter than
+:data:`AUTO_CROP_THRESHOLD` for it to be kept by :func:`detect_crop_region`."""
+
 PROGRESS_BAR_DESCRIPTION = "  Detected: %d | Progress"
 """Template to use for progress bar."""
 
@@ -140,6 +203,204 @@ def compute_downscale_factor(frame_width: int, effective_width: int = DEFAULT_MI
     return frame_width / float(effective_width)
 
 
+def _integer_factor(frame_size: tuple[int, int], factor: float) -> int:
+    """Downscale factor rounded to an integer, no larger than the frame."""
+    return max(1, min(round(factor), *frame_size))
+
+
+def _roi_tile_size(frame_size: tuple[int, int], factor: float) -> tuple[int, int]:
+    """Size (width, height) of each tile taken from frames of `frame_size` with
+    :attr:`Subsampling.ROI`. Tiles are no larger than a cell of the grid."""
+    return tuple(
+        max(1, min(length // ROI_GRID_SIZE, round(length / factor / ROI_GRID_SIZE)))
+        for length in frame_size
+    )
+
+
+def downscaled_size(
+    frame_size: tuple[int, int], factor: float, subsampling: Subsampling = Subsampling.RESIZE
+) -> tuple[int, int]:
+    """Get the size of frames after :func:`downscale_frame`.
+
+    Arguments:
+        frame_size: Size of the frames to downscale as (width, height).
+        factor: Downscale factor. Values of 1 or less leave frames unchanged.
+        subsampling: Method used to downscale frames.
+
+    Returns:
+        Size of the downscaled frames as (width, height).
+    """
+    if factor <= 1.0:
+        return frame_size
+    width, height = frame_size
+    if subsampling == Subsampling.RESIZE:
+        return (max(1, round(width / factor)), max(1, round(height / factor)))
+    if subsampling == Subsampling.ROI:
+        tile_width, tile_height = _roi_tile_size(frame_size, factor)
+        return (tile_width * ROI_GRID_SIZE, tile_height * ROI_GRID_SIZE)
+    step = _integer_factor(frame_size, factor)
+    if subsampling == Subsampling.STRIDE:
+        return (-(-width // step), -(-height // step))
+    return (width // step, height // step)
+
+
+def downscale_frame(
+    frame: np.ndarray,
+    factor: float,
+    subsampling: Subsampling = Subsampling.RESIZE,
+    interpolation: Interpolation = Interpolation.LINEAR,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Reduce the size of a frame before processing it.
+
+    Arguments:
+        frame: Frame to downscale.
+        factor: Downscale factor. Values of 1 or less leave `frame` unchanged.
+        subsampling: Method used to downscale the frame.
+        interpolation: Interpolation method used with :attr:`Subsampling.RESIZE`.
+        out: Contiguous array to write the downscaled frame to instead of allocating a new one.
+            Must be of :func:`downscaled_size`, with the same type and channels as `frame`.
+
+    Returns:
+        The downscaled frame, of :func:`downscaled_size`. If `out` is not set, this is `frame`
+        itself when it is left unchanged, and a view of `frame` with :attr:`Subsampling.STRIDE`.
+    """
+    if factor <= 1.0:
+        return _copy_to(out, frame)
+    frame_size = (frame.shape[1], frame.shape[0])
+    if subsampling == Subsampling.RESIZE:
+        return cv2.resize(
+            frame,
+            downscaled_size(frame_size, factor, subsampling),
+            dst=out,
+            interpolation=interpolation.value,
+        )
+    if subsampling == Subsampling.ROI:
+        width, height = frame_size
+        tile_width, tile_height = _roi_tile_size(frame_size, factor)
+        tiles = out
+        if tiles is None:
+            tiles = np.empty(
+                (tile_height * ROI_GRID_SIZE, tile_width * ROI_GRID_SIZE, *frame.shape[2:]),
+                dtype=frame.dtype,
+            )
+        for row in range(ROI_GRID_SIZE):
+            y = (2 * row + 1) * height // (2 * ROI_GRID_SIZE) - tile_height // 2
+            y = min(max(0, y), height - tile_height)
+            for col in range(ROI_GRID_SIZE):
+                x = (2 * col + 1) * width // (2 * ROI_GRID_SIZE) - tile_width // 2
+                x = min(max(0, x), width - tile_width)
+                tiles[
+                    row * tile_height : (row + 1) * tile_height,
+                    col * tile_width : (col + 1) * tile_width,
+                ] = frame[y : y + tile_height, x : x + tile_width]
+        return tiles
+    step = _integer_factor(frame_size, factor)
+    if step == 1:
+        return _copy_to(out, frame)
+    if subsampling == Subsampling.STRIDE:
+        return _copy_to(out, frame[::step, ::step])
+    # OpenCV's area interpolation averages each block of pixels when the factor is an integer,
+    # which is much faster than doing so with numpy.
+    width, height = downscaled_size(frame_size, factor, subsampling)
+    return cv2.resize(
+        frame[: height * step, : width * step],
+        (width, height),
+        dst=out,
+        interpolation=cv2.INTER_AREA,
+    )
+
+
+def _copy_to(out: np.ndarray | None, frame: np.ndarray) -> np.ndarray:
+    """Copy `frame` to `out` and return it, or return `frame` if `out` is None."""
+    if out is None:
+        return frame
+    np.copyto(out, frame)
+    return out
+
+
+def _mean_abs_difference(left: np.ndarray, right: np.ndarray) -> float:
+    """Mean absolute difference between the pixels of two frames of the same size."""
+    return cv2.norm(left, right, cv2.NORM_L1) / left.size
+
+
+def compute_frame_queue_length(frame_size: tuple[int, int], memory: int) -> int:
+    """Get how many decoded frames can be buffered within a memory budget.
+
+    Arguments:
+        frame_size: Size of the frames to buffer as (width, height), after any cropping and
+            downscaling. Frames are assumed to have 3 channels of 8 bits each.
+        memory: Memory budget in bytes.
+
+    Returns:
+        Number of frames which fit in `memory`, between :data:`MIN_ADAPTIVE_FRAME_QUEUE_LENGTH`
+        and :data:`MAX_ADAPTIVE_FRAME_QUEUE_LENGTH`.
+    """
+    frame_bytes = max(1, frame_size[0] * frame_size[1] * 3)
+    return max(
+        MIN_ADAPTIVE_FRAME_QUEUE_LENGTH, min(MAX_ADAPTIVE_FRAME_QUEUE_LENGTH, memory // frame_bytes)
+    )
+
+
+def detect_crop_region(
+    video: VideoStream,
+    num_samples: int = AUTO_CROP_SAMPLES,
+    threshold: int = AUTO_CROP_THRESHOLD,
+) -> CropRegion | None:
+    """Find the region of a video inside any black bars (e.g. letterboxing or pillarboxing), to
+    use as :attr:`SceneManager.crop`.
+
+    Frames are sampled at even intervals across the video, and the region covers the non-black
+    pixels of all of them. Frames which are entirely black (e.g. fades) are ignored. The video is
+    returned to its original position afterwards.
+
+    Arguments:
+        video: Video to analyze. Must be seekable and have a known duration.
+        num_samples: Number of frames to sample.
+        threshold: Maximum luma (0 to 255) of pixels considered black.
+
+    Returns:
+        Region of the frame inside the black bars as inclusive (X0, Y0, X1, Y1), or None if there
+        are no black bars (or every sampled frame is black).
+
+    Raises:
+        ValueError: The video is not seekable or its duration is unknown.
+    """
+    if not video.is_seekable or video.duration is None:
+        raise ValueError("Detecting the crop region requires a seekable video of known duration.")
+    num_frames = video.duration.frame_num
+    start_frame = video.frame_number
+    frame_size: tuple[int, int] | None = None
+    bounds: list[int] | None = None
+    try:
+        for i in range(num_samples):
+            video.seek(int((i + 0.5) * num_frames / num_samples))
+            frame_im = video.read()
+            if frame_im is False:
+                continue
+            if frame_im.ndim == 3:
+                frame_im = cv2.cvtColor(frame_im, cv2.COLOR_BGR2GRAY)
+            bright = frame_im > threshold
+            height, width = bright.shape
+            rows = np.flatnonzero(bright.sum(axis=1) > AUTO_CROP_MIN_COVERAGE * width)
+            cols = np.flatnonzero(bright.sum(axis=0) > AUTO_CROP_MIN_COVERAGE * height)
+            if not len(rows) or not len(cols):
+                continue
+            frame_size = (width, height)
+            found = [cols[0], rows[0], cols[-1], rows[-1]]
+            if bounds is not None:
+                found = [*np.minimum(bounds[:2], found[:2]), *np.maximum(bounds[2:], found[2:])]
+            bounds = found
+    finally:
+        video.seek(start_frame)
+    if bounds is None or frame_size is None:
+        return None
+    x0, y0, x1, y1 = (int(coordinate) for coordinate in bounds)
+    if (x0, y0, x1, y1) == (0, 0, frame_size[0] - 1, frame_size[1] - 1):
+        return None
+    return (x0, y0, x1, y1)
+
+
 def expand_scenes_to_bounds(
     scenes: SceneList,
     start: FrameTimecode,
@@ -210,6 +471,52 @@ def get_scenes_from_cuts(
     return scene_list
 
 
+@dataclass
+class CutLatency:
+    """Wall-clock latency of the scenes output by :meth:`SceneManager.stream_scenes`.
+
+    The latency of a scene is the time from when the frame it ends on was decoded, until the scene
+    was output. It includes the time spent waiting for detectors to be sure no earlier cut can be
+    found. The time the frame was decoded is estimated from the presentation time of the frames
+    after it, so for live inputs this approximates the delay from when the cut was broadcast.
+    """
+
+    count: int = 0
+    """Number of scenes output."""
+    total: float = 0.0
+    """Sum of the latency of all scenes in seconds."""
+    max: float = 0.0
+    """Largest latency of any scene in seconds."""
+    last: float = 0.0
+    """Latency of the most recent scene in seconds."""
+
+    @property
+    def mean(self) -> float:
+        """Average latency in seconds, or 0 if no scenes were output."""
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, latency: float) -> None:
+        """Record the latency of a scene in seconds."""
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+        self.last = latency
+
+
+@dataclass(frozen=True)
+class DetectionProgress:
+    """Progress update yielded by :meth:`SceneManager.detect_scenes_async`."""
+
+    position: FrameTimecode
+    """Position of the last frame that was processed."""
+    frames_processed: int
+    """Number of frames processed so far."""
+    cuts: list[FrameTimecode]
+    """Cuts detected since the previous update."""
+    complete: bool = False
+    """True for the final update, once detection has finished."""
+
+
 ##
 ## SceneManager Class Implementation
 ##
@@ -224,13 +531,30 @@ class SceneManager:
     def __init__(
         self,
         stats_manager: StatsManager | None = None,
+        max_cuts: int | None = None,
+        profile: DetectionProfile | None = None,
     ):
         """
         Arguments:
             stats_manager: :class:`StatsManager` to bind to this `SceneManager`. Can be
                 accessed via the `stats_manager` property of the resulting object to save to disk.
+            max_cuts: If set, only the most recent `max_cuts` cuts are kept, and the scene list
+                starts at the last cut that was discarded. Use this with :meth:`stream_scenes`
+                to bound memory usage when processing live or very long inputs (together with
+                the `max_frames` option of the :class:`StatsManager`, if any).
+            profile: :class:`DetectionProfile <scenedetect.profiler.DetectionProfile>` to record
+                the time spent in each stage of detection to. Can be accessed via the `profile`
+                property of the resulting object.
+
+        Raises:
+            ValueError: `max_cuts` is less than 1.
         """
+        if max_cuts is not None and max_cuts < 1:
+            raise ValueError("max_cuts must be at least 1")
         self._cutting_list: list[FrameTimecode] = []
+        self._max_cuts = max_cuts
+        # Number of cuts discarded from the start of `_cutting_list` due to `max_cuts`.
+        self._num_cuts_dropped = 0
         self._detector_list: list[SceneDetector] = []
         # TODO(v1.0): This class should own a StatsManager instead of taking an optional one.
         # Expose a new `stats_manager` @property from the SceneManager, and either change the
@@ -251,9 +575,11 @@ class SceneManager:
         self._base_timecode: FrameTimecode | None = None
         self._downscale: int = 1
         self._auto_downscale: bool = True
+        self._adaptive_frame_skip: bool = False
         # Interpolation method to use when downscaling. Defaults to linear interpolation
         # as a good balance between quality and performance.
         self._interpolation: Interpolation = Interpolation.LINEAR
+        self._subsampling: Subsampling = Subsampling.RESIZE
         # Set by decode thread when an exception occurs.
         self._exception_info = None
         self._stop = threading.Event()
@@ -261,6 +587,18 @@ class SceneManager:
         self._frame_buffer: list[tuple[FrameTimecode, np.ndarray]] = []
         self._frame_buffer_size = 0
         self._crop = None
+        # Wall-clock time (`time.monotonic()`) the last processed frame was decoded.
+        self._frame_decode_time: float = 0.0
+        self._cut_latency = CutLatency()
+        self._profile: DetectionProfile | None = profile
+        # Timing of `process_frame` for each detector, if profiling.
+        self._detector_timings: list[StageTiming] = []
+        self._frame_queue_memory: int | None = None
+        self._queue_stats = QueueStats()
+        # Buffers that cropped/downscaled frames are written to, reused once each frame is no
+        # longer referenced. Only set during detection.
+        self._output_pool: FramePool | None = None
+        self._frame_callback: ty.Callable[[np.ndarray, FrameTimecode], None] | None = None
 
     @property
     def interpolation(self) -> Interpolation:
@@ -271,11 +609,57 @@ class SceneManager:
     def interpolation(self, value: Interpolation):
         self._interpolation = value
 
+    @property
+    def subsampling(self) -> Subsampling:
+        """Method used to downscale frames. Defaults to :attr:`Subsampling.RESIZE`, which uses
+        :attr:`interpolation`. The other methods are faster on high resolution video, at some
+        cost in accuracy. See :class:`Subsampling` for details."""
+        return self._subsampling
+
+    @subsampling.setter
+    def subsampling(self, value: Subsampling):
+        self._subsampling = value
+
     @property
     def stats_manager(self) -> StatsManager | None:
         """Getter for the StatsManager associated with this SceneManager, if any."""
         return self._stats_manager
 
+    @property
+    def profile(self) -> DetectionProfile | None:
+        """Getter for the DetectionProfile associated with this SceneManager, if any."""
+        return self._profile
+
+    @property
+    def frame_queue_memory(self) -> int | None:
+        """Memory budget in bytes for decoded frames waiting to be processed. If set, the length
+        of the frame queue is chosen so the frames fit within this budget (see
+        :func:`compute_frame_queue_length`). Larger queues absorb more variation in decoding time.
+        If None (the default), up to :data:`MAX_FRAME_QUEUE_LENGTH` frames are buffered."""
+        return self._frame_queue_memory
+
+    @frame_queue_memory.setter
+    def frame_queue_memory(self, value: int | None):
+        if value is not None and value <= 0:
+            raise ValueError("frame_queue_memory must be greater than 0!")
+        self._frame_queue_memory = value
+
+    @property
+    def queue_stats(self) -> QueueStats:
+        """Occupancy and stalls of the frame queue during the last call to :meth:`detect_scenes`.
+        These show whether detection was limited by decoding or by the detectors."""
+        return self._queue_stats
+
+    @property
+    def max_cuts(self) -> int | None:
+        """Maximum number of cuts to keep, or None if unbounded."""
+        return self._max_cuts
+
+    @property
+    def cut_latency(self) -> CutLatency:
+        """Latency of the scenes output by the last call to :meth:`stream_scenes`."""
+        return self._cut_latency
+
     @property
     def crop(self) -> CropRegion | None:
         """Portion of the frame to crop. Tuple of 4 ints in the form (X0, Y0, X1, Y1) where X0, Y0
@@ -334,6 +718,39 @@ class SceneManager:
     def auto_downscale(self, value: bool):
         self._auto_downscale = value
 
+    @property
+    def adaptive_frame_skip(self) -> bool:
+        """If set to True, frames skipped with the `frame_skip` argument of :meth:`detect_scenes`
+        are processed when there may be a cut between the frames either side of them, so cuts are
+        found at the same frame as without skipping frames.
+
+        Every ``frame_skip + 1`` frames, the current frame is compared with the last frame
+        processed. If the difference between them jumps (their pixels differ by at least
+        :data:`ADAPTIVE_FRAME_SKIP_THRESHOLD` on average, and by at least
+        :data:`ADAPTIVE_FRAME_SKIP_RATIO` times the median of the last few comparisons), the
+        video is seeked back to process every frame in between. If the video isn't seekable,
+        the skipped frames are decoded and kept until then instead.
+
+        Frame scores of detectors still differ from processing every frame in the rest of the
+        video, and gradual transitions which differ little between frames (e.g. long fades)
+        are only partly processed densely."""
+        return self._adaptive_frame_skip
+
+    @adaptive_frame_skip.setter
+    def adaptive_frame_skip(self, value: bool):
+        self._adaptive_frame_skip = value
+
+    @property
+    def frame_callback(self) -> ty.Callable[[np.ndarray, FrameTimecode], None] | None:
+        """If set, called with each frame and its position before it is processed, after it has
+        been cropped and downscaled (i.e. the frames detectors see). Frames are read-only. Allows
+        saving frames as they are processed, without decoding the video again."""
+        return self._frame_callback
+
+    @frame_callback.setter
+    def frame_callback(self, value: ty.Callable[[np.ndarray, FrameTimecode], None] | None):
+        self._frame_callback = value
+
     def add_detector(self, detector: SceneDetector) -> None:
         """Add/register a SceneDetector (e.g. ContentDetector, ThresholdDetector) to
         run when detect_scenes is called. The SceneManager owns the detector object,
@@ -364,6 +781,7 @@ class SceneManager:
         cached frame metrics that were computed and saved in the previous call to detect_scenes.
         """
         self._cutting_list.clear()
+        self._num_cuts_dropped = 0
         self._last_pos = None
         self._start_pos = None
         self._frame_size = None
@@ -405,7 +823,22 @@ class SceneManager:
         if not self._cutting_list:
             return []
         # Ensure all cuts are unique by using a set to remove all duplicates.
-        return [cut for cut in sorted(set(self._cutting_list))]
+        cuts = sorted(set(self._cutting_list))
+        # If cuts were discarded, the scene list starts at the last one.
+        if self._num_cuts_dropped and self._start_pos is not None:
+            cuts = [cut for cut in cuts if cut > self._start_pos]
+        return cuts
+
+    def _discard_old_cuts(self) -> None:
+        """Discard the oldest cuts if there are more than `max_cuts`."""
+        if self._max_cuts is None or len(self._cutting_list) <= self._max_cuts:
+            return
+        num_dropped = len(self._cutting_list) - self._max_cuts
+        last_dropped = max(self._cutting_list[:num_dropped])
+        del self._cutting_list[:num_dropped]
+        self._num_cuts_dropped += num_dropped
+        if self._start_pos is None or last_dropped > self._start_pos:
+            self._start_pos = last_dropped
 
     def _process_frame(
         self,
@@ -423,21 +856,34 @@ class SceneManager:
         # frame_buffer[-1] is current frame, -2 is one behind, etc
         # so index based on cut frame should be [event_frame - (frame_num + 1)]
         self._frame_buffer = self._frame_buffer[-(self._frame_buffer_size + 1) :]
-        for detector in self._detector_list:
-            cuts = detector.process_frame(position, frame_im)
+        for i, detector in enumerate(self._detector_list):
+            if self._profile is None:
+                cuts = detector.process_frame(position, frame_im)
+            else:
+                start = time.perf_counter()
+                cuts = detector.process_frame(position, frame_im)
+                self._detector_timings[i].add(time.perf_counter() - start)
             self._cutting_list += cuts
             new_cuts = bool(cuts)
-            if callback:
+            if callback and cuts:
+                start = time.perf_counter()
                 for cut in cuts:
                     for position, frame in self._frame_buffer:
                         if cut == position:
                             callback(frame, position)
+                if self._profile is not None:
+                    self._profile.stage(STAGE_CALLBACK).add(time.perf_counter() - start)
+        self._discard_old_cuts()
         return new_cuts
 
     def _post_process(self, timecode: FrameTimecode) -> None:
         """Add remaining cuts to the cutting list, after processing the last frame."""
+        start = time.perf_counter()
         for detector in self._detector_list:
             self._cutting_list += detector.post_process(timecode)
+        if self._profile is not None:
+            self._profile.stage(STAGE_POST_PROCESS).add(time.perf_counter() - start)
+        self._discard_old_cuts()
 
     def stop(self) -> None:
         """Stop the current :meth:`detect_scenes` call, if any. Thread-safe."""
@@ -470,7 +916,8 @@ class SceneManager:
             frame_skip: Not recommended except for extremely high framerate videos.
                 Number of frames to skip (i.e. process every 1 in N+1 frames,
                 where N is frame_skip, processing only 1/N+1 percent of the video,
-                speeding up the detection time at the expense of accuracy).
+                speeding up the detection time at the expense of accuracy). See
+                :attr:`adaptive_frame_skip` to keep the accuracy of processing every frame.
                 `frame_skip` **must** be 0 (the default) when using a StatsManager.
             show_progress: If True, and the ``tqdm`` module is available, displays
                 a progress bar with the progress, framerate, and expected time to
@@ -495,6 +942,243 @@ class SceneManager:
         # TODO(v0.8): Remove default value for `video` after `frame_source` is removed.
         if video is None:
             raise TypeError("detect_scenes() missing 1 required positional argument: 'video'")
+        start_frame_num: int = video.frame_number
+        self._stop.clear()
+        for _ in self._run_detection(
+            video=video,
+            duration=duration,
+            end_time=end_time,
+            frame_skip=frame_skip,
+            show_progress=show_progress,
+            callback=callback,
+        ):
+            pass
+        return video.frame_number - start_frame_num
+
+    def stream_scenes(
+        self,
+        video: VideoStream,
+        duration: TimecodeLike | None = None,
+        end_time: TimecodeLike | None = None,
+        frame_skip: int = 0,
+        show_progress: bool = False,
+        callback: ty.Callable[[np.ndarray, FrameTimecode], None] | None = None,
+        start_in_scene: bool = False,
+    ) -> ty.Iterator[tuple[FrameTimecode, FrameTimecode]]:
+        """Perform scene detection like :meth:`detect_scenes`, but yield each scene as soon as it
+        is final instead of waiting for the whole video to be processed.
+
+        A scene is final once its ending cut has been detected, and no detector can still emit
+        an earlier cut. How far back a detector can emit cuts is given by its
+        :attr:`SceneDetector.event_buffer_length`, so scenes are yielded that many frames after
+        the frame they end on. The last scene is yielded once detection is complete. The yielded
+        scenes are the same as the ones returned by :meth:`get_scene_list` afterwards.
+
+        Arguments:
+            video: VideoStream obtained from either `scenedetect.open_video`, or by creating
+                one directly (e.g. `scenedetect.backends.opencv.VideoStreamCv2`).
+            duration: Amount of time to detect from current video position. Cannot be
+                specified if `end_time` is set.
+            end_time: Time to stop processing at. Cannot be specified if `duration` is set.
+            frame_skip: Number of frames to skip. See :meth:`detect_scenes`.
+            show_progress: If True, and the ``tqdm`` module is available, displays
+                a progress bar.
+            callback: If set, called after each scene/event detected.
+            start_in_scene: Assume the video begins in a scene. See :meth:`get_scene_list`.
+
+        Yields:
+            Tuples in the form (start_time, end_time) for each scene, in order.
+
+        Raises:
+            ValueError: `frame_skip` **must** be 0 (the default) if the SceneManager
+                was constructed with a StatsManager object.
+        """
+        # Cuts we have seen but which could still be preceded by an earlier one, in order.
+        pending: list[FrameTimecode] = []
+        # Number of cuts taken from `_cutting_list` so far, including any that were discarded.
+        num_cuts = 0
+        scene_start: FrameTimecode | None = None
+        position: FrameTimecode | None = None
+        warned_late_cut = False
+        self._cut_latency = CutLatency()
+
+        def add_new_cuts():
+            nonlocal num_cuts, warned_late_cut
+            new_cuts = self._cutting_list[max(0, num_cuts - self._num_cuts_dropped) :]
+            num_cuts = self._num_cuts_dropped + len(self._cutting_list)
+            for cut in new_cuts:
+                if scene_start is not None and cut <= scene_start:
+                    if cut < scene_start and not warned_late_cut:
+                        logger.warning(
+                            "Cut at %s was detected after a later scene was already output. "
+                            "The detector may not report the correct event_buffer_length.",
+                            cut.get_timecode(),
+                        )
+                        warned_late_cut = True
+                    continue
+                if cut not in pending:
+                    bisect.insort(pending, cut)
+
+        def next_scene(end: FrameTimecode) -> tuple[FrameTimecode, FrameTimecode]:
+            nonlocal scene_start
+            assert self._start_pos is not None
+            start = self._start_pos if scene_start is None else scene_start
+            scene_start = end
+            latency = time.monotonic() - self._frame_decode_time
+            if position is not None:
+                latency += max(0.0, position.seconds - end.seconds)
+            self._cut_latency.add(latency)
+            return (start, end)
+
+        self._stop.clear()
+        detection = self._run_detection(
+            video=video,
+            duration=duration,
+            end_time=end_time,
+            frame_skip=frame_skip,
+            show_progress=show_progress,
+            callback=callback,
+        )
+        try:
+            for position in detection:
+                add_new_cuts()
+                # Any cut detected from now on will be at or after this frame.
+                horizon = position.frame_num + 1 - self._max_event_buffer_length()
+                while pending and pending[0].frame_num <= horizon:
+                    yield next_scene(pending.pop(0))
+        finally:
+            # Stop detecting if the caller stopped iterating early.
+            detection.close()
+
+        # Detection is complete, so all remaining cuts are final.
+        add_new_cuts()
+        if self._start_pos is None or self._last_pos is None:
+            return
+        for cut in pending:
+            yield next_scene(cut)
+        if scene_start is not None or start_in_scene:
+            yield next_scene(self._last_pos + 1)
+
+    async def detect_scenes_async(
+        self,
+        video: VideoStream,
+        duration: TimecodeLike | None = None,
+        end_time: TimecodeLike | None = None,
+        frame_skip: int = 0,
+        callback: ty.Callable[[np.ndarray, FrameTimecode], None] | None = None,
+        progress_interval: float = 1.0,
+    ) -> ty.AsyncIterator[DetectionProgress]:
+        """Perform scene detection like :meth:`detect_scenes` without blocking the event loop,
+        yielding progress updates as an asynchronous iterator.
+
+        Frames are decoded by the same background thread as :meth:`detect_scenes`, and the
+        detectors are run in the default executor of the running event loop. An update is yielded
+        whenever new cuts are detected, at least every `progress_interval` seconds otherwise, and
+        once more when detection is complete. Results can also be obtained by calling
+        :meth:`get_scene_list` or :meth:`get_cut_list` afterwards.
+
+        Detection is stopped if the task iterating over the updates is cancelled, or the iterator
+        is closed before it is exhausted. Calling :meth:`stop` ends detection early, after which
+        the final update is yielded as usual.
+
+        Arguments:
+            video: VideoStream obtained from either `scenedetect.open_video`, or by creating
+                one directly (e.g. `scenedetect.backends.opencv.VideoStreamCv2`).
+            duration: Amount of time to detect from current video position. Cannot be
+                specified if `end_time` is set.
+            end_time: Time to stop processing at. Cannot be specified if `duration` is set.
+            frame_skip: Number of frames to skip. See :meth:`detect_scenes`.
+            callback: If set, called after each scene/event detected. Called from a worker
+                thread, not the event loop.
+            progress_interval: Maximum time in seconds between updates.
+
+        Yields:
+            :class:`DetectionProgress` with the position and any new cuts.
+
+        Raises:
+            ValueError: `frame_skip` **must** be 0 (the default) if the SceneManager
+                was constructed with a StatsManager object.
+        """
+        loop = asyncio.get_running_loop()
+        updates: asyncio.Queue[DetectionProgress | BaseException | None] = asyncio.Queue()
+        start_frame_num: int = video.frame_number
+        # Cleared before the worker starts, so cancelling before then still stops detection.
+        self._stop.clear()
+        detection = self._run_detection(
+            video=video,
+            duration=duration,
+            end_time=end_time,
+            frame_skip=frame_skip,
+            show_progress=False,
+            callback=callback,
+        )
+
+        def run():
+            # Number of cuts reported so far, including any that were discarded.
+            num_cuts = 0
+
+            def make_update(position: FrameTimecode, complete: bool = False):
+                nonlocal num_cuts
+                cuts = self._cutting_list[max(0, num_cuts - self._num_cuts_dropped) :]
+                num_cuts = self._num_cuts_dropped + len(self._cutting_list)
+                frames_processed = video.frame_number - start_frame_num
+                return DetectionProgress(position, frames_processed, cuts, complete)
+
+            try:
+                last_update = time.monotonic()
+                for position in detection:
+                    now = time.monotonic()
+                    num_new_cuts = self._num_cuts_dropped + len(self._cutting_list) - num_cuts
+                    if num_new_cuts or now - last_update >= progress_interval:
+                        loop.call_soon_threadsafe(updates.put_nowait, make_update(position))
+                        last_update = now
+                assert self._last_pos is not None
+                update = make_update(self._last_pos, complete=True)
+                loop.call_soon_threadsafe(updates.put_nowait, update)
+            except BaseException as ex:
+                loop.call_soon_threadsafe(updates.put_nowait, ex)
+            finally:
+                loop.call_soon_threadsafe(updates.put_nowait, None)
+
+        worker = loop.run_in_executor(None, run)
+        try:
+            while (update := await updates.get()) is not None:
+                if isinstance(update, BaseException):
+                    raise update
+                yield update
+        finally:
+            # The worker must finish before returning, since it still uses the video and the
+            # detectors. Stopping detection also stops the decode thread.
+            self.stop()
+            await asyncio.shield(worker)
+
+    def _detector_stage_names(self) -> list[str]:
+        """Get the name of the profiling stage of each detector. Detectors of the same type are
+        numbered in the order they were added."""
+        types = [type(detector).__name__ for detector in self._detector_list]
+        return [
+            STAGE_DETECTOR_PREFIX
+            + name
+            + (f"[{types[:i].count(name)}]" if types.count(name) > 1 else "")
+            for i, name in enumerate(types)
+        ]
+
+    def _max_event_buffer_length(self) -> int:
+        """Get how many frames in the past any of the detectors can currently emit a cut."""
+        return max((detector.event_buffer_length for detector in self._detector_list), default=0)
+
+    def _run_detection(
+        self,
+        video: VideoStream,
+        duration: TimecodeLike | None,
+        end_time: TimecodeLike | None,
+        frame_skip: int,
+        show_progress: bool,
+        callback: ty.Callable[[np.ndarray, FrameTimecode], None] | None,
+    ) -> ty.Iterator[FrameTimecode]:
+        """Run detection on `video`, yielding the position of each frame after it is processed.
+        Post-processing is done once there are no more frames, before the generator finishes.
+        Closing the generator early stops the decode thread."""
         if frame_skip > 0 and self.stats_manager is not None:
             raise ValueError("frame_skip must be 0 when using a StatsManager.")
         if duration is not None and end_time is not None:
@@ -516,22 +1200,26 @@ class SceneManager:
             frame_width, frame_height = video.frame_size
             if min_x >= frame_width or min_y >= frame_height:
                 raise ValueError("crop starts outside video boundary")
-            if max_x >= frame_width or max_y >= frame_height:
+            # The end of the crop region is stored one past the last pixel, so it can equal the
+            # frame size when the region extends to the edge of the frame.
+            if max_x > frame_width or max_y > frame_height:
                 logger.warning("Warning: crop ends outside of video boundary.")
             effective_frame_size = (
-                1 + min(max_x, frame_width) - min_x,
-                1 + min(max_y, frame_height) - min_y,
+                min(max_x, frame_width) - min_x,
+                min(max_y, frame_height) - min_y,
             )
         # Calculate downscale factor and log effective resolution.
         if self.auto_downscale:
             downscale_factor = compute_downscale_factor(max(effective_frame_size))
         else:
             downscale_factor = self.downscale
+        processing_size = downscaled_size(effective_frame_size, downscale_factor, self._subsampling)
         logger.debug(
-            "Processing resolution: %d x %d, downscale: %1.1f",
-            int(effective_frame_size[0] / downscale_factor),
-            int(effective_frame_size[1] / downscale_factor),
+            "Processing resolution: %d x %d, downscale: %1.1f (%s)",
+            processing_size[0],
+            processing_size[1],
             downscale_factor,
+            self._subsampling.value,
         )
 
         self._base_timecode = video.base_timecode
@@ -562,8 +1250,29 @@ class SceneManager:
                 dynamic_ncols=True,
             )
 
-        frame_queue = queue.Queue(MAX_FRAME_QUEUE_LENGTH)
-        self._stop.clear()
+        if self._frame_queue_memory is None:
+            frame_queue_length = MAX_FRAME_QUEUE_LENGTH
+        else:
+            frame_queue_length = compute_frame_queue_length(
+                processing_size, self._frame_queue_memory
+            )
+            logger.debug("Frame queue length: %d", frame_queue_length)
+        self._queue_stats = queue_stats = QueueStats(capacity=frame_queue_length)
+        # Frames in flight: the queue, plus the frame being processed and the one being prepared.
+        self._output_pool = FramePool(frame_queue_length + 2)
+
+        profile = self._profile
+        queue_wait: StageTiming | None = None
+        if profile is not None:
+            # Stages are added up front so the decode thread never modifies `profile.stages`.
+            profile.stage(STAGE_DECODE)
+            profile.stage(STAGE_CROP_RESIZE)
+            queue_wait = profile.stage(STAGE_QUEUE_WAIT)
+            self._detector_timings = [profile.stage(name) for name in self._detector_stage_names()]
+        perf_start_time = time.perf_counter()
+        num_frames = 0
+
+        frame_queue = queue.Queue(frame_queue_length)
         decode_thread = threading.Thread(
             target=SceneManager._decode_thread,
             args=(self, video, frame_skip, downscale_factor, end_time, frame_queue),
@@ -576,12 +1285,30 @@ class SceneManager:
         logger.info("Detecting scenes...")
         try:
             while not self._stop.is_set():
-                next_frame, position = frame_queue.get()
+                occupancy = frame_queue.qsize()
+                queue_stats.num_gets += 1
+                queue_stats.total_occupancy += occupancy
+                if occupancy > queue_stats.max_occupancy:
+                    queue_stats.max_occupancy = occupancy
+                waited = 0.0
+                try:
+                    next_frame, position, self._frame_decode_time = frame_queue.get_nowait()
+                except queue.Empty:
+                    start = time.perf_counter()
+                    next_frame, position, self._frame_decode_time = frame_queue.get()
+                    waited = time.perf_counter() - start
+                    queue_stats.consumer_starved += 1
+                    queue_stats.consumer_starved_time += waited
+                if queue_wait is not None:
+                    queue_wait.add(waited)
                 if next_frame is None and position is None:
                     break
+                num_frames += 1
                 if next_frame is not None:
                     frame_im = next_frame
                 assert frame_im is not None
+                if self._frame_callback is not None:
+                    self._frame_callback(frame_im, position)
                 new_cuts = self._process_frame(position, frame_im, callback)
                 if progress_bar is not None:
                     if new_cuts:
@@ -595,6 +1322,7 @@ class SceneManager:
                     )
                     progress_bar.update(delta)
                     prev_position = position
+                yield position
         finally:
             if progress_bar is not None:
                 progress_bar.set_description(
@@ -611,6 +1339,12 @@ class SceneManager:
                 while not frame_queue.empty():
                     frame_queue.get_nowait()
                 decode_thread.join(timeout=0.1)
+            self._output_pool = None
+            logger.debug(queue_stats.summary())
+            if profile is not None:
+                profile.num_frames += num_frames
+                profile.wall_time += time.perf_counter() - perf_start_time
+                profile.queue.add(queue_stats)
 
         if self._exception_info is not None:
             exc = self._exception_info[1]
@@ -618,9 +1352,71 @@ class SceneManager:
             raise exc.with_traceback(self._exception_info[2])
 
         self._last_pos = video.position
+        start = time.perf_counter()
         self._post_process(video.position)
+        if profile is not None:
+            profile.wall_time += time.perf_counter() - start
 
-        return video.frame_number - start_frame_num
+    def _prepare_frame(
+        self,
+        frame_im: np.ndarray,
+        position: FrameTimecode,
+        video: VideoStream,
+        downscale_factor: float,
+        crop_resize_timing: StageTiming | None,
+    ) -> np.ndarray | None:
+        """Crop and downscale a decoded frame for processing. Returns None if the frame has the
+        wrong size and can't be processed."""
+        # Verify the decoded frame size against the video container's reported
+        # resolution, and also verify that consecutive frames have the correct size.
+        decoded_size = (frame_im.shape[1], frame_im.shape[0])
+        if self._frame_size is None:
+            self._frame_size = decoded_size
+            if video.frame_size != decoded_size:
+                logger.warn(
+                    f"WARNING: Decoded frame size ({decoded_size}) does not match "
+                    f" video resolution {video.frame_size}, possible corrupt input."
+                )
+        elif self._frame_size != decoded_size:
+            self._frame_size_errors += 1
+            if self._frame_size_errors <= MAX_FRAME_SIZE_ERRORS:
+                logger.error(
+                    f"ERROR: Frame at {position!s} has incorrect size and "
+                    f"cannot be processed: decoded size = {decoded_size}, "
+                    f"expected = {self._frame_size}. Video may be corrupt."
+                )
+            if self._frame_size_errors == MAX_FRAME_SIZE_ERRORS:
+                logger.warn("WARNING: Too many errors emitted, skipping future messages.")
+            # Skip processing frames that have an incorrect size.
+            return None
+
+        start = time.perf_counter()
+        if self._crop:
+            (x0, y0, x1, y1) = self._crop
+            frame_im = frame_im[y0:y1, x0:x1]
+
+        # Frames which aren't downscaled, or are strided, are views of the decoded frame and
+        # don't need a buffer. OpenCV handles views without copying them.
+        pool = self._output_pool
+        if pool is not None and downscale_factor > 1.0 and self._subsampling != Subsampling.STRIDE:
+            width, height = downscaled_size(
+                (frame_im.shape[1], frame_im.shape[0]), downscale_factor, self._subsampling
+            )
+            shape = (height, width, *frame_im.shape[2:])
+            buffer = pool.acquire()
+            if buffer is None or buffer.shape != shape or buffer.dtype != frame_im.dtype:
+                buffer = np.empty(shape, dtype=frame_im.dtype)
+            downscale_frame(
+                frame_im, downscale_factor, self._subsampling, self._interpolation, out=buffer
+            )
+            frame_im = np.asarray(PooledFrame(pool, buffer, writeable=True))
+        else:
+            frame_im = downscale_frame(
+                frame_im, downscale_factor, self._subsampling, self._interpolation
+            )
+        if crop_resize_timing is not None:
+            crop_resize_timing.add(time.perf_counter() - start)
+        return frame_im
 
     def _decode_thread(
         self,
@@ -630,68 +1426,169 @@ class SceneManager:
         end_time: FrameTimecode,
         out_queue: queue.Queue,
     ):
+        decode_timing = crop_resize_timing = None
+        if self._profile is not None:
+            decode_timing = self._profile.stage(STAGE_DECODE)
+            crop_resize_timing = self._profile.stage(STAGE_CROP_RESIZE)
+
+        def put(frame_im: np.ndarray, position: FrameTimecode):
+            item = (frame_im, position, time.monotonic())
+            try:
+                out_queue.put_nowait(item)
+            except queue.Full:
+                start = time.perf_counter()
+                out_queue.put(item)
+                self._queue_stats.producer_blocked += 1
+                self._queue_stats.producer_blocked_time += time.perf_counter() - start
+
+        adaptive = self._adaptive_frame_skip and frame_skip > 0
+        # Videos which can't seek back to skipped frames must decode and keep them instead.
+        keep_skipped = adaptive and not video.is_seekable
+        skipped: list[tuple[np.ndarray, FrameTimecode]] = []
+        # Differences between the last frames compared when using adaptive frame skip.
+        differences: collections.deque[float] = collections.deque(maxlen=ADAPTIVE_FRAME_SKIP_WINDOW)
+        # Last frame put in the queue when using adaptive frame skip, and its position.
+        last_frame: np.ndarray | None = None
+        last_position: FrameTimecode | None = None
+        # Position to process every frame up to after seeking back, if any.
+        dense_until: FrameTimecode | None = None
+        # Frame which caused seeking back, already prepared, to use again once it is reached.
+        jump_frame: np.ndarray | None = None
         try:
             while not self._stop.is_set():
                 frame_im = None
-                # We don't do any kind of locking here since the worst-case of this being wrong
-                # is that we do some extra work, and this function should never mutate any data
-                # (all of which should be modified under the GIL).
-                frame_im = video.read()
-                if frame_im is False:
-                    break
-                assert isinstance(frame_im, np.ndarray)
-                # Verify the decoded frame size against the video container's reported
-                # resolution, and also verify that consecutive frames have the correct size.
-                decoded_size = (frame_im.shape[1], frame_im.shape[0])
-                if self._frame_size is None:
-                    self._frame_size = decoded_size
-                    if video.frame_size != decoded_size:
-                        logger.warn(
-                            f"WARNING: Decoded frame size ({decoded_size}) does not match "
-                            f" video resolution {video.frame_size}, possible corrupt input."
-                        )
-                elif self._frame_size != decoded_size:
-                    self._frame_size_errors += 1
-                    if self._frame_size_errors <= MAX_FRAME_SIZE_ERRORS:
-                        logger.error(
-                            f"ERROR: Frame at {video.position!s} has incorrect size and "
-                            f"cannot be processed: decoded size = {decoded_size}, "
-                            f"expected = {self._frame_size}. Video may be corrupt."
-                        )
-                    if self._frame_size_errors == MAX_FRAME_SIZE_ERRORS:
-                        logger.warn("WARNING: Too many errors emitted, skipping future messages.")
-                    # Skip processing frames that have an incorrect size.
-                    continue
-
-                if self._crop:
-                    (x0, y0, x1, y1) = self._crop
-                    frame_im = frame_im[y0:y1, x0:x1]
-
-                if downscale_factor > 1.0:
-                    frame_im = cv2.resize(
-                        frame_im,
-                        (
-                            max(1, round(frame_im.shape[1] / downscale_factor)),
-                            max(1, round(frame_im.shape[0] / downscale_factor)),
-                        ),
-                        interpolation=self._interpolation.value,
+                if (
+                    jump_frame is not None
+                    and dense_until is not None
+                    and last_position is not None
+                    and last_position.frame_num + 1 >= dense_until.frame_num
+                ):
+                    # Only move past the frame which caused seeking back, without decoding it.
+                    start = time.perf_counter()
+                    video.read(decode=False)
+                    if decode_timing is not None:
+                        decode_timing.add(time.perf_counter() - start)
+                    frame_im, position, jump_frame = jump_frame, dense_until, None
+                else:
+                    # We don't do any kind of locking here since the worst-case of this being
+                    # wrong is that we do some extra work, and this function should never mutate
+                    # any data (all of which should be modified under the GIL).
+                    start = time.perf_counter()
+                    frame_im = video.read()
+                    if decode_timing is not None:
+                        decode_timing.add(time.perf_counter() - start)
+                    if frame_im is False:
+                        break
+                    assert isinstance(frame_im, np.ndarray)
+                    # Each access of `position` creates a new timecode, so only query it once
+                    # per frame.
+                    position = video.position
+                    if dense_until is not None and position >= dense_until:
+                        # Seeking back didn't stop before the frame which caused it.
+                        jump_frame = None
+                    frame_im = self._prepare_frame(
+                        frame_im, position, video, downscale_factor, crop_resize_timing
                     )
+                    if frame_im is None:
+                        continue
 
                 # Set the start position now that we decoded at least the first frame.
                 if self._start_pos is None:
-                    self._start_pos = video.position
-
-                out_queue.put((frame_im, video.position))
-
-                if frame_skip > 0:
+                    self._start_pos = position
+
+                if adaptive:
+                    # Seeking back can land on a frame which was already processed.
+                    if last_position is not None and position <= last_position:
+                        continue
+                    jump = False
+                    if (
+                        dense_until is None
+                        and last_frame is not None
+                        and last_position is not None
+                        and position.frame_num - last_position.frame_num > 1
+                    ):
+                        difference = _mean_abs_difference(last_frame, frame_im)
+                        jump = difference >= ADAPTIVE_FRAME_SKIP_THRESHOLD and (
+                            not differences
+                            or difference
+                            >= ADAPTIVE_FRAME_SKIP_RATIO * statistics.median(differences)
+                        )
+                        differences.append(difference)
+                    if jump:
+                        # There may be a cut in the frames that were skipped, so process them.
+                        if not keep_skipped:
+                            video.seek(last_position + 1)
+                            dense_until = position
+                            jump_frame = frame_im
+                            continue
+                        for skipped_im, skipped_position in skipped:
+                            put(skipped_im, skipped_position)
+                    skipped.clear()
+                    last_frame, last_position = frame_im, position
+
+                put(frame_im, position)
+
+                if dense_until is not None and position >= dense_until:
+                    dense_until = None
+                if frame_skip > 0 and dense_until is None:
+                    start = time.perf_counter()
                     for _ in range(frame_skip):
-                        if not video.read(decode=False):
+                        if keep_skipped:
+                            skipped_im = video.read()
+                            if skipped_im is False:
+                                break
+                            assert isinstance(skipped_im, np.ndarray)
+                            # Only keep the prepared frame, which is usually much smaller.
+                            skipped_position = video.position
+                            skipped_im = self._prepare_frame(
+                                skipped_im,
+                                skipped_position,
+                                video,
+                                downscale_factor,
+                                crop_resize_timing,
+                            )
+                            if skipped_im is not None:
+                                skipped.append((skipped_im, skipped_position))
+                        elif not video.read(decode=False):
                             break
+                    if decode_timing is not None:
+                        decode_timing.add(time.perf_counter() - start)
+                    position = video.position
                 # End time includes the presentation time of the frame, but the `position`
                 # property of a VideoStream references the beginning of the frame in time.
-                if end_time is not None and not (video.position + 1) < end_time:
+                if end_time is not None and not (position + 1) < end_time:
                     break
 
+            # Frames skipped at the end were never compared with a later frame, so process them.
+            if adaptive and last_position is not None and not self._stop.is_set():
+                if keep_skipped:
+                    remaining = skipped
+                else:
+                    remaining = []
+                    last_read = video.position
+                    if last_read > last_position:
+                        video.seek(last_position + 1)
+                        # Stop at the last frame that was read so the stream ends where it was.
+                        while video.position < last_read and not self._stop.is_set():
+                            frame_im = video.read()
+                            if frame_im is False:
+                                break
+                            assert isinstance(frame_im, np.ndarray)
+                            position = video.position
+                            if position <= last_position or (
+                                end_time is not None and not position < end_time
+                            ):
+                                continue
+                            frame_im = self._prepare_frame(
+                                frame_im, position, video, downscale_factor, crop_resize_timing
+                            )
+                            if frame_im is not None:
+                                remaining.append((frame_im, position))
+                for frame_im, position in remaining:
+                    if end_time is not None and not position < end_time:
+                        break
+                    put(frame_im, position)
+
         # If *any* exceptions occur, we re-raise them in the main thread so that the caller of
         # detect_scenes can handle it.
         except KeyboardInterrupt:
@@ -707,7 +1604,7 @@ class SceneManager:
             if self._start_pos is None:
                 self._start_pos = video.position
             # Make sure main thread stops processing loop.
-            out_queue.put((None, None))
+            out_queue.put((None, None, time.monotonic()))
 
     #
     # Deprecated Methods
@@ -25,6 +25,7 @@ import csv
 import os
 import os.path
 import typing as ty
+from collections import deque
 from logging import getLogger
 from pathlib import Path
 
@@ -96,13 +97,28 @@ class StatsManager:
     Only metrics consisting of `float` or `int` should be used currently.
     """
 
-    def __init__(self, base_timecode: int | FrameTimecode | None = None):
+    def __init__(
+        self,
+        base_timecode: int | FrameTimecode | None = None,
+        max_frames: int | None = None,
+    ):
         """Initialize a new StatsManager.
 
         Arguments:
             base_timecode: Timecode associated with this object. Must not be None (default value
                 will be removed in a future release).
+            max_frames: If set, only the metrics of the most recent `max_frames` frames are kept,
+                and older frames are discarded as new ones are added. Use this to bound memory
+                usage when processing live or very long inputs.
+
+        Raises:
+            ValueError: `max_frames` is less than 1.
         """
+        if max_frames is not None and max_frames < 1:
+            raise ValueError("max_frames must be at least 1")
+        self._max_frames = max_frames
+        # Frames in the order they were added, used to discard the oldest when bounded.
+        self._frame_order: deque[int | FrameTimecode] = deque()
         # Frame metrics keyed by either an `int` frame number or a `FrameTimecode`. Both forms
         # hash/compare to the same dict slot (`FrameTimecode.__hash__` returns `frame_num`), so
         # public methods accept both interchangeably for the same frame.
@@ -113,6 +129,11 @@ class StatsManager:
             base_timecode  # Used for timing calculations.
         )
 
+    @property
+    def max_frames(self) -> int | None:
+        """Maximum number of frames to keep metrics for, or None if unbounded."""
+        return self._max_frames
+
     @property
     def metric_keys(self) -> ty.Iterable[str]:
         return self._metric_keys
@@ -308,6 +329,10 @@ class StatsManager:
         self._metrics_updated = True
         if timecode not in self._frame_metrics:
             self._frame_metrics[timecode] = dict()
+            if self._max_frames is not None:
+                self._frame_order.append(timecode)
+                if len(self._frame_order) > self._max_frames:
+                    del self._frame_metrics[self._frame_order.popleft()]
         self._frame_metrics[timecode][metric_key] = metric_value
 
     def _metric_exists(self, timecode: int | FrameTimecode, metric_key: str) -> bool:
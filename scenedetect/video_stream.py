@@ -98,6 +98,16 @@ class VideoStream(ABC):
         corruption). Always 0 for backends which do not track decode failures."""
         return self._decode_failures
 
+    def _read_into(self, out: np.ndarray) -> np.ndarray | bool:
+        """Read and decode the next frame, reusing `out` as the destination buffer if the
+        backend supports it. Backends which cannot decode into an existing buffer ignore `out`
+        and return a new frame, so callers must use the returned array rather than `out`.
+
+        Internal API used to recycle frame buffers (see :mod:`scenedetect._fan_out`).
+        """
+        del out
+        return self.read()
+
     #
     # Backend Identification
     #
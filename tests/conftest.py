@@ -161,6 +161,64 @@ def delayed_start_video() -> str:
     return check_exists("tests/resources/delayed_start.mp4")
 
 
+@pytest.fixture(scope="session")
+def synthetic_video(tmp_path_factory) -> ty.Callable[..., str]:
+    """Generates synthetic videos: a moving gradient with a hard cut every 2 seconds (e.g. at
+    frames 50 and 100 at 25 fps), encoded with OpenCV so ffmpeg isn't required.
+
+    Usage: ``path = synthetic_video((320, 180), duration=6.0, rate=25.0)``. Videos are only
+    generated once per session for each set of parameters.
+    """
+    from tests.release.synthetic import generate_gradient_video
+
+    video_dir = tmp_path_factory.mktemp("synthetic")
+    videos: dict[tuple, str] = {}
+
+    def _generate(size: tuple[int, int] = (320, 180), duration: float = 6.0, rate: float = 25.0):
+        key = (size, duration, rate)
+        if key not in videos:
+            path = str(video_dir / f"synthetic-{size[0]}x{size[1]}-{duration:g}s-{rate:g}fps.mp4")
+            generate_gradient_video(path, size[0], size[1], duration, rate)
+            videos[key] = path
+        return videos[key]
+
+    return _generate
+
+
+@pytest.fixture(scope="session")
+def synthetic_dataset(synthetic_video) -> ty.Callable[..., ty.Any]:
+    """Creates benchmark datasets (see `benchmark.dataset.Dataset`) of videos generated by the
+    `synthetic_video` fixture, with a hard cut every 2 seconds as the ground truth.
+
+    Usage: ``dataset = synthetic_dataset([((160, 90), 4.0), ((640, 360), 6.0)], rate=25.0)``,
+    with the size and duration of each video in the dataset.
+    """
+    from pathlib import Path
+
+    from benchmark.dataset import Dataset, Sample
+    from benchmark.evaluator import GroundTruth
+
+    class _SyntheticDataset(Dataset):
+        def __init__(self, samples: list[Sample]):
+            self._samples = samples
+
+    def _create(videos: list[tuple[tuple[int, int], float]], rate: float = 25.0):
+        return _SyntheticDataset(
+            [
+                Sample(
+                    video_file=Path(synthetic_video(size, duration=duration, rate=rate)),
+                    # Cuts are 1-based frame numbers.
+                    ground_truth=GroundTruth(
+                        hard_cuts=[round(2 * rate * i) + 1 for i in range(1, int(duration / 2))]
+                    ),
+                )
+                for size, duration in videos
+            ]
+        )
+
+    return _create
+
+
 @pytest.fixture
 def auto_close():
     """Registers VideoStreams (or anything closeable) for deterministic cleanup at test end.
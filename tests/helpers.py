@@ -18,7 +18,7 @@ from click.testing import CliRunner
 
 from scenedetect._cli import scenedetect as _scenedetect_cli
 from scenedetect._cli.context import CliContext
-from scenedetect._cli.controller import run_scenedetect
+from scenedetect._cli.controller import run_batch, run_scenedetect
 
 
 def close_video_stream(stream: ty.Any) -> None:
@@ -66,6 +66,14 @@ def invoke_cli(args: list[str], catch_exceptions: bool = False) -> tuple[int, st
         result = runner.invoke(
             _scenedetect_cli, args, obj=context, catch_exceptions=catch_exceptions
         )
+        if result.exit_code == 0 and context.batch_inputs:
+            num_failed = run_batch(
+                context,
+                lambda video_context: _scenedetect_cli.main(
+                    args, obj=video_context, standalone_mode=False
+                ),
+            )
+            return int(num_failed > 0), result.output
         if result.exit_code == 0:
             run_scenedetect(context)
         return result.exit_code, result.output
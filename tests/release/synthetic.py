@@ -11,11 +11,14 @@
 #
 """Synthetic Video Generation
 
-Functions to generate synthetic video files using ffmpeg for testing purposes.
+Functions to generate synthetic video files using ffmpeg (or OpenCV) for testing purposes.
 """
 
 import subprocess
 
+import cv2
+import numpy as np
+
 
 def generate_vfr_swing(output_path: str):
     """Generates a VFR video with three segments separated by visible luma steps.
@@ -97,3 +100,62 @@ def generate_synthetic_matrix_video(
 
     cmd = ["ffmpeg", "-y", *input_args, *codec_args, output_path]
     subprocess.run(cmd, check=True, capture_output=True)
+
+
+def generate_perf_video(
+    output_path: str,
+    width: int,
+    height: int,
+    duration: float = 10.0,
+    rate: float = 30.0,
+    scene_length: float = 2.0,
+):
+    """Generates an H.264 video for throughput benchmarks at the given resolution.
+
+    A moving test pattern (so every frame differs and decoding does real work) whose hue
+    jumps every `scene_length` seconds, giving detectors a hard cut to find at each jump.
+    """
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-f",
+        "lavfi",
+        "-i",
+        f"testsrc2=size={width}x{height}:duration={duration}:rate={rate}",
+        "-vf",
+        f"hue=h=120*floor(t/{scene_length})",
+        "-c:v",
+        "libx264",
+        "-pix_fmt",
+        "yuv420p",
+        output_path,
+    ]
+    subprocess.run(cmd, check=True, capture_output=True)
+
+
+def generate_gradient_video(
+    output_path: str,
+    width: int,
+    height: int,
+    duration: float = 10.0,
+    rate: float = 30.0,
+    scene_length: float = 2.0,
+):
+    """Generates an MPEG-4 video with OpenCV, so ffmpeg isn't required.
+
+    A moving gradient (so every frame differs) which changes colour every `scene_length`
+    seconds, giving detectors a hard cut to find at each change.
+    """
+    writer = cv2.VideoWriter(output_path, cv2.VideoWriter_fourcc(*"mp4v"), rate, (width, height))
+    if not writer.isOpened():
+        raise RuntimeError(f"Failed to create {output_path} with OpenCV.")
+    gradient = np.add.outer(np.arange(height) // 2, np.arange(width) // 2).astype(np.uint8)
+    colours = [(1.0, 0.1, 0.1), (0.1, 1.0, 0.1), (0.1, 0.1, 1.0)]
+    try:
+        for frame_num in range(round(duration * rate)):
+            scene = int(frame_num / rate / scene_length)
+            colour = colours[scene % len(colours)]
+            moving = np.roll(gradient if scene % 2 else ~gradient, 4 * frame_num, axis=1)
+            writer.write(np.dstack([(moving * c).astype(np.uint8) for c in colour]))
+    finally:
+        writer.release()
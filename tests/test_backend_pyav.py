@@ -17,8 +17,11 @@ VideoStreamAv ('pyav') backend. These tests validate behaviour specific to this
 For VideoStream tests that validate conformance, see test_video_stream.py.
 """
 
+from pathlib import Path
+
 import av
 
+from scenedetect.backends import pyav
 from scenedetect.backends.pyav import MAX_CONSECUTIVE_DECODE_FAILURES, VideoStreamAv
 
 
@@ -91,3 +94,24 @@ def test_read_gives_up_after_consecutive_failures(test_video_file: str, caplog,
     # `no_logs_gte_error` fixture doesn't fail the test.
     assert any("consecutive" in record.message for record in caplog.records)
     caplog.clear()
+
+
+def test_network_stream_reconnect(test_video_file: str, monkeypatch, auto_close):
+    """Network streams are reconnected when they end, and positions continue on from the last
+    frame before the connection was lost."""
+    monkeypatch.setattr(pyav, "RECONNECT_DELAY", 0.0)
+    # The file protocol is opened by URL like a network stream, and ends quickly.
+    url = Path(test_video_file).absolute().as_uri()
+    stream = auto_close(VideoStreamAv(url))
+    assert stream.is_network_stream and not stream.is_seekable
+    num_frames = 0
+    while stream.read(decode=False) is not False:
+        num_frames += 1
+
+    stream = auto_close(VideoStreamAv(url, reconnect=1))
+    last_seconds = -1.0
+    for _ in range(num_frames + 10):
+        assert stream.read(decode=False) is not False
+        assert stream.position.seconds > last_seconds
+        last_seconds = stream.position.seconds
+    assert stream.frame_number == num_frames + 10
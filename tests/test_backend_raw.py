@@ -0,0 +1,162 @@
+#
+#            PySceneDetect: Python-Based Video Scene Detector
+#   -------------------------------------------------------------------
+#     [  Site:    https://scenedetect.com                           ]
+#     [  Docs:    https://scenedetect.com/docs/                     ]
+#     [  Github:  https://github.com/Breakthrough/PySceneDetect/    ]
+#
+# Copyright (C) 2026 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""PySceneDetect scenedetect.backends.raw Tests
+
+Validates reading and writing raw frame files, using a small synthetic video with a hard cut
+every 2 seconds."""
+
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from scenedetect import ContentDetector, FrameTimecode, SceneManager, Subsampling, open_video
+from scenedetect.backends.raw import RawVideoWriter, VideoStreamRaw, write_raw_video
+from scenedetect.video_stream import VideoOpenFailure
+
+NUM_FRAMES = 150
+
+
+@pytest.fixture(scope="module")
+def source_video(synthetic_video) -> str:
+    return synthetic_video((160, 90), duration=6.0, rate=25.0)
+
+
+@pytest.fixture(scope="module")
+def raw_video(source_video: str, tmp_path_factory) -> str:
+    path = str(tmp_path_factory.mktemp("raw") / "video.sdraw")
+    assert write_raw_video(open_video(source_video), path) == NUM_FRAMES
+    return path
+
+
+def _detect_cuts(video) -> list[FrameTimecode]:
+    scene_manager = SceneManager()
+    scene_manager.auto_downscale = False
+    scene_manager.add_detector(ContentDetector())
+    scene_manager.detect_scenes(video)
+    return [start for start, _ in scene_manager.get_scene_list()[1:]]
+
+
+def test_read(source_video: str, raw_video: str):
+    source = open_video(source_video)
+    video = open_video(raw_video)
+    assert isinstance(video, VideoStreamRaw)
+    assert video.num_frames == NUM_FRAMES
+    assert video.frame_rate == source.frame_rate
+    assert video.frame_size == source.frame_size
+    assert video.duration == source.duration
+    assert video.frame_number == 0 and video.position == 0
+    while (expected := source.read()) is not False:
+        frame = video.read()
+        assert np.array_equal(frame, expected)
+        assert not frame.flags.writeable
+        assert video.position == source.position
+        assert video.frame_number == source.frame_number
+    assert video.read() is False
+    video.reset()
+    assert video.frame_number == 0 and video.read() is not False
+
+
+def test_seek(raw_video: str):
+    video = open_video(raw_video)
+    frames = video.frames
+    for target in (0, 1, 37, 100, NUM_FRAMES - 1, 3.0, "00:00:05.000"):
+        video.seek(target)
+        expected = FrameTimecode(target, video.frame_rate)
+        frame = video.read()
+        assert video.position == expected
+        assert np.array_equal(frame, frames[expected.frame_num])
+    video.seek(NUM_FRAMES + 10)
+    assert video.read() is False
+    with pytest.raises(ValueError):
+        video.seek(-1)
+
+
+def test_seek_uneven_timestamps(source_video: str, tmp_path: Path):
+    """Frames which aren't evenly spaced (e.g. variable frame rate video) are still found."""
+    path = tmp_path / "uneven.sdraw"
+    source = open_video(source_video)
+    timecodes = []
+    with RawVideoWriter(path, source.frame_rate) as writer:
+        while (frame := source.read()) is not False:
+            # Only keep every other frame after the first 10.
+            if source.frame_number <= 10 or source.frame_number % 2:
+                writer.write(frame, source.position)
+                timecodes.append(source.position)
+    video = VideoStreamRaw(path)
+    assert video.num_frames == len(timecodes)
+    # Seeking between frames moves to the next frame.
+    video.seek(11)
+    assert video.read() is not False and video.position == timecodes[11]
+    for i in (0, 15, len(timecodes) - 1):
+        video.seek(timecodes[i])
+        video.read()
+        assert video.position == timecodes[i]
+
+
+def test_detect(source_video: str, raw_video: str):
+    expected = _detect_cuts(open_video(source_video))
+    assert len(expected) == 2
+    assert _detect_cuts(open_video(raw_video)) == expected
+
+
+def test_write_range(source_video: str, tmp_path: Path):
+    """Frames written from part of a video keep their timestamps."""
+    path = tmp_path / "range.sdraw"
+    source = open_video(source_video)
+    assert write_raw_video(source, path, start_time=20, end_time=80, downscale=2) == 60
+    video = open_video(str(path))
+    assert video.frame_size == (80, 45)
+    # Frame numbers start from the first frame in the file, not the start of the source video.
+    assert video.frame_number == 20
+    assert SceneManager().detect_scenes(video) == 60
+    video.reset()
+    source.seek(20)
+    expected = cv2.resize(source.read(), video.frame_size, interpolation=cv2.INTER_LINEAR)
+    assert np.array_equal(video.read(), expected)
+    assert video.position == source.position
+    assert video.frame_number == 21
+    assert video.duration == FrameTimecode(80, video.frame_rate)
+    assert _detect_cuts(video) == [FrameTimecode(50, video.frame_rate)]
+
+
+def test_write_preprocessed(source_video: str, tmp_path: Path):
+    """Frames written with a crop region and downscale factor are the frames a SceneManager with
+    the same settings processes."""
+    crop = (10, 5, 129, 74)
+    path = tmp_path / "cropped.sdraw"
+    write_raw_video(
+        open_video(source_video), path, crop=crop, downscale=2, subsampling=Subsampling.STRIDE
+    )
+    processed = []
+    scene_manager = SceneManager()
+    scene_manager.crop = crop
+    scene_manager.auto_downscale = False
+    scene_manager.downscale = 2
+    scene_manager.subsampling = Subsampling.STRIDE
+    scene_manager.frame_callback = lambda frame, position: processed.append((frame, position))
+    scene_manager.add_detector(ContentDetector())
+    scene_manager.detect_scenes(open_video(source_video))
+    video = open_video(str(path))
+    assert video.frame_size == (60, 35)
+    assert video.num_frames == len(processed) == NUM_FRAMES
+    for frame, position in processed:
+        assert np.array_equal(video.read(), frame)
+        assert video.position == position
+
+
+def test_open_invalid(source_video: str, tmp_path: Path):
+    with pytest.raises(VideoOpenFailure):
+        VideoStreamRaw(source_video)
+    with pytest.raises(OSError):
+        VideoStreamRaw(tmp_path / "missing.sdraw")
@@ -17,6 +17,7 @@ synthetic predictions versus ground-truth lists. Covers TRECVID-SBD style scorin
 from __future__ import annotations
 
 import math
+import random
 from pathlib import Path
 
 from benchmark.evaluator import (
@@ -27,6 +28,7 @@ from benchmark.evaluator import (
     _score_fade_transitions,
     _score_hard_cuts,
     evaluate,
+    evaluate_batch,
     score_video,
 )
 
@@ -299,6 +301,114 @@ def test_benchmark_result_by_category_buckets_untagged_videos_as_unknown():
     assert len(by_category["unknown"].per_video) == 2
 
 
+# --------------------------------------------------------------------- #
+# Equivalence with brute-force matching, and batch scoring
+# --------------------------------------------------------------------- #
+
+
+def _brute_force_hard_cuts(predicted_cuts, ground_truth_cuts, tolerance):
+    """Reference matcher which checks every (prediction, ground truth) pair."""
+    candidates = sorted(
+        (abs(p - g), i, j)
+        for i, p in enumerate(predicted_cuts)
+        for j, g in enumerate(ground_truth_cuts)
+        if abs(p - g) <= tolerance
+    )
+    prediction_used, ground_truth_used, offsets = set(), set(), []
+    for d, i, j in candidates:
+        if i not in prediction_used and j not in ground_truth_used:
+            prediction_used.add(i)
+            ground_truth_used.add(j)
+            offsets.append(d)
+    return offsets
+
+
+def _brute_force_fades(predicted_cuts, intervals):
+    """Reference matcher which checks every interval for every prediction."""
+    consumed, intervals_matched, false_positives = set(), set(), 0
+    for k, p in enumerate(predicted_cuts):
+        for interval in intervals:
+            if interval.contains(p):
+                consumed.add(k)
+                if interval in intervals_matched:
+                    false_positives += 1
+                intervals_matched.add(interval)
+                break
+    return len(intervals_matched), false_positives, consumed
+
+
+def test_hard_matches_brute_force():
+    rng = random.Random(0)
+    for _ in range(500):
+        # Unsorted, with duplicates and clusters, so there are plenty of conflicting pairs.
+        predicted = [rng.randint(0, 60) for _ in range(rng.randint(0, 25))]
+        ground_truth = [rng.randint(0, 60) for _ in range(rng.randint(0, 25))]
+        tolerance = rng.randint(0, 6)
+        m, offsets = _score_hard_cuts(predicted, ground_truth, tolerance)
+        expected = _brute_force_hard_cuts(predicted, ground_truth, tolerance)
+        assert offsets == expected
+        assert (m.matched, m.false_positives, m.missed) == (
+            len(expected),
+            len(predicted) - len(expected),
+            len(ground_truth) - len(expected),
+        )
+
+
+def test_fade_matches_brute_force():
+    rng = random.Random(0)
+    for trial in range(500):
+        intervals = []
+        start = 0
+        for _ in range(rng.randint(0, 8)):
+            if trial % 2:
+                # Half of the trials have disjoint intervals, like most annotations.
+                start += rng.randint(1, 30)
+            else:
+                start = rng.randint(0, 200)
+            intervals.append(EventInterval(start, start + rng.randint(0, 30)))
+            if trial % 2:
+                start = intervals[-1].end
+        rng.shuffle(intervals)
+        if trial % 2 == 0 and intervals and rng.random() < 0.5:
+            intervals.append(rng.choice(intervals))
+        predicted = [rng.randint(0, 240) for _ in range(rng.randint(0, 30))]
+        m, consumed = _score_fade_transitions(predicted, intervals)
+        matched, false_positives, expected_consumed = _brute_force_fades(predicted, intervals)
+        assert consumed == expected_consumed
+        assert (m.matched, m.false_positives, m.missed) == (
+            matched,
+            false_positives,
+            len(intervals) - matched,
+        )
+
+
+def test_evaluate_batch_matches_evaluate():
+    rng = random.Random(0)
+    ground_truth = {
+        Path(f"{k}.mp4"): GroundTruth(
+            hard_cuts=sorted(rng.sample(range(1000), 20)),
+            fades=[EventInterval(100 * k + 50, 100 * k + 60) for k in range(5)],
+        )
+        for k in range(3)
+    }
+    cells = [
+        {
+            path: Prediction(
+                predicted_cuts=sorted(rng.sample(range(1000), rng.randint(0, 30))),
+                ground_truth=gt,
+                elapsed=rng.random(),
+            )
+            for path, gt in ground_truth.items()
+        }
+        for _ in range(10)
+    ]
+    for tolerance in (0, 2):
+        batch = evaluate_batch(cells, tolerance=tolerance)
+        assert [result.to_dict() for result in batch] == [
+            evaluate(cell, tolerance=tolerance).to_dict() for cell in cells
+        ]
+
+
 # --------------------------------------------------------------------- #
 # EventMetrics arithmetic
 # --------------------------------------------------------------------- #
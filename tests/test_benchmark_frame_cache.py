@@ -0,0 +1,94 @@
+#
+#            PySceneDetect: Python-Based Video Scene Detector
+#   -------------------------------------------------------------------
+#     [  Site:    https://scenedetect.com                           ]
+#     [  Docs:    https://scenedetect.com/docs/                     ]
+#     [  Github:  https://github.com/Breakthrough/PySceneDetect/    ]
+#
+# Copyright (C) 2026 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""Unit tests for the decoded-frame cache of the benchmark harness, run on small synthetic
+videos rather than a real dataset.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from benchmark.__main__ import _run_predictions
+from benchmark.dataset import Dataset
+from benchmark.frame_cache import FrameCache
+from benchmark.sweep import cartesian_grid, parse_params_spec, run_sweep
+from scenedetect import open_video
+from scenedetect._fan_out import PreprocessSpec
+
+
+@pytest.fixture(scope="module")
+def dataset(synthetic_dataset) -> Dataset:
+    return synthetic_dataset([((160, 90), 4.0), ((640, 360), 4.0)])
+
+
+def test_frame_cache(dataset: Dataset, tmp_path: Path):
+    cache = FrameCache(tmp_path / "cache")
+    for sample in dataset:
+        assert not cache.contains(sample.video_file, "opencv")
+        entry = cache.build(sample.video_file, "opencv")
+        assert cache.contains(sample.video_file, "opencv")
+        # Entries are only built once.
+        assert cache.build(sample.video_file, "opencv") == entry
+        # Entries depend on the backend and downscale factor.
+        assert not cache.contains(sample.video_file, "pyav")
+        assert not FrameCache(tmp_path / "cache", downscale=2).contains(sample.video_file, "opencv")
+
+        video = open_video(str(sample.video_file), backend="opencv")
+        spec = PreprocessSpec.for_frame_size(video.frame_size)
+        cached = cache.open(sample.video_file, "opencv")
+        # Entries are raw frame files, which can also be opened directly.
+        assert cached.path == str(entry)
+        assert open_video(str(entry)).BACKEND_NAME == "raw"
+        assert cached.frame_rate == video.frame_rate
+        assert cached.frame_size == spec.output_size(video.frame_size)
+        assert cached.duration.frame_num == 100
+        while (frame := video.read()) is not False:
+            cached_frame = cached.read()
+            assert np.array_equal(cached_frame, spec.apply(frame))
+            assert cached.position == video.position
+            assert not cached_frame.flags.writeable
+        assert cached.read() is False
+
+        # Seeking is exact.
+        cached.seek(50)
+        frame = cached.read()
+        cached.reset()
+        for _ in range(51):
+            expected = cached.read()
+        assert cached.frame_number == 51
+        assert np.array_equal(frame, expected)
+
+
+def test_run_predictions_frame_cache(dataset: Dataset, tmp_path: Path):
+    expected = _run_predictions(dataset, "detect-content", "opencv")
+    cache = FrameCache(tmp_path / "cache")
+    for _ in range(2):
+        actual = _run_predictions(dataset, "detect-content", "opencv", frame_cache=cache)
+        assert {path: p.predicted_cuts for path, p in actual.items()} == {
+            path: p.predicted_cuts for path, p in expected.items()
+        }
+
+
+def test_run_sweep_frame_cache(dataset: Dataset, tmp_path: Path):
+    grid = cartesian_grid(parse_params_spec("threshold=20,27,60"))
+    expected = run_sweep(dataset, "detect-content", "opencv", grid, workers=2)
+    cache = FrameCache(tmp_path / "cache")
+    actual = run_sweep(
+        dataset, "detect-content", "opencv", grid, workers=2, processes=2, frame_cache=cache
+    )
+    assert all(cache.contains(sample.video_file, "opencv") for sample in dataset)
+    assert [{path: p.predicted_cuts for path, p in cell.items()} for cell in actual] == [
+        {path: p.predicted_cuts for path, p in cell.items()} for cell in expected
+    ]
@@ -0,0 +1,43 @@
+#
+#            PySceneDetect: Python-Based Video Scene Detector
+#   -------------------------------------------------------------------
+#     [  Site:    https://scenedetect.com                           ]
+#     [  Docs:    https://scenedetect.com/docs/                     ]
+#     [  Github:  https://github.com/Breakthrough/PySceneDetect/    ]
+#
+# Copyright (C) 2026 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""Unit tests for the micro-benchmarks (``python -m benchmark.micro``). Only checks that each
+benchmark runs and is covered by the checked-in baseline, not how long they take.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmark.micro import BENCHMARKS, compare_results, run_benchmarks
+
+BASELINE_PATH = Path(__file__).parent.parent / "benchmark" / "micro_baseline.json"
+
+
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_benchmark_runs(name: str):
+    BENCHMARKS[name]()()
+
+
+def test_baseline_is_complete():
+    baseline = json.loads(BASELINE_PATH.read_text())["results"]
+    assert set(baseline) == set(BENCHMARKS)
+
+
+def test_run_and_compare():
+    results = run_benchmarks(["timecode.add"], repeat=1, min_time=0.001)
+    assert results["timecode.add"]["per_op"] > 0
+    baseline = {"timecode.add": {"per_op": 2 * results["timecode.add"]["per_op"]}}
+    rows = compare_results(baseline, results)
+    assert rows[0][0] == "timecode.add" and rows[0][-1] == "-50.0%"
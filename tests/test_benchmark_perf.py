@@ -0,0 +1,78 @@
+#
+#            PySceneDetect: Python-Based Video Scene Detector
+#   -------------------------------------------------------------------
+#     [  Site:    https://scenedetect.com                           ]
+#     [  Docs:    https://scenedetect.com/docs/                     ]
+#     [  Github:  https://github.com/Breakthrough/PySceneDetect/    ]
+#
+# Copyright (C) 2026 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""Unit tests for the throughput benchmark (``python -m benchmark.perf``). Measurements are run
+in-process on a small synthetic video, and regression checks on hand-written results.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from benchmark.perf import (
+    compare_results,
+    ensure_video,
+    measure_decode,
+    measure_detect,
+    parse_downscale,
+    parse_resolution,
+)
+
+
+def test_parse_specs():
+    assert parse_resolution("1280x720") == (1280, 720)
+    assert parse_downscale("auto") == "auto"
+    assert parse_downscale("2") == 2
+    for spec in ("1280", "x720", "axb"):
+        with pytest.raises(ValueError):
+            parse_resolution(spec)
+    for spec in ("0", "-1", "fast"):
+        with pytest.raises(ValueError):
+            parse_downscale(spec)
+
+
+def test_measure(tmp_path: Path):
+    video_path = ensure_video(tmp_path, (160, 90), duration=5.0, rate=30.0)
+    # Videos are reused once generated.
+    assert ensure_video(tmp_path, (160, 90), duration=5.0, rate=30.0) == video_path
+    decode = measure_decode(str(video_path), "opencv", repeat=1)
+    assert decode["frames"] == 150 and decode["decode_fps"] > 0
+    detect = measure_detect(str(video_path), "opencv", "detect-content", "auto", repeat=2)
+    assert detect["frames"] == 150 and detect["detect_fps"] > 0
+    # The synthetic video has a hard cut every 2 seconds.
+    assert detect["num_cuts"] > 0
+    assert detect["bottleneck"] in ("decode", "detect")
+
+
+def _result(detector: str, detect_fps: float) -> dict:
+    return {
+        "detector": detector,
+        "backend": "opencv",
+        "resolution": "640x360",
+        "downscale": "auto",
+        "detect_fps": detect_fps,
+    }
+
+
+def test_compare_results():
+    baseline = [_result("detect-content", 100.0), _result("detect-hash", 100.0)]
+    current = [
+        _result("detect-content", 95.0),
+        _result("detect-hash", 80.0),
+        _result("detect-hist", 50.0),
+    ]
+    rows, regressions = compare_results(baseline, current, max_regression=10.0)
+    # Cells which aren't in the baseline are skipped.
+    assert [row[0] for row in rows] == ["detect-content", "detect-hash"]
+    assert rows[1][-1] == "-20.0%"
+    assert regressions == [("detect-hash", "opencv", "640x360", "auto")]
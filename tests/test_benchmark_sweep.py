@@ -0,0 +1,98 @@
+#
+#            PySceneDetect: Python-Based Video Scene Detector
+#   -------------------------------------------------------------------
+#     [  Site:    https://scenedetect.com                           ]
+#     [  Docs:    https://scenedetect.com/docs/                     ]
+#     [  Github:  https://github.com/Breakthrough/PySceneDetect/    ]
+#
+# Copyright (C) 2026 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""Unit tests for the parameter sweep harness (``python -m benchmark.sweep``), run on small
+synthetic videos rather than a real dataset.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from benchmark.dataset import Dataset
+from benchmark.sweep import SweepCheckpoint, cartesian_grid, parse_params_spec, run_sweep
+
+
+@pytest.fixture(scope="module")
+def dataset(synthetic_dataset) -> Dataset:
+    # Videos of different lengths, so the results of each can be told apart.
+    return synthetic_dataset([((160, 90), 4.0), ((160, 90), 6.0)])
+
+
+GRID = cartesian_grid(parse_params_spec("threshold=20,27,60"))
+
+
+def _cuts(predictions_by_cell) -> list[dict[Path, list[int]]]:
+    return [
+        {video: prediction.predicted_cuts for video, prediction in predictions.items()}
+        for predictions in predictions_by_cell
+    ]
+
+
+def test_run_sweep_processes(dataset: Dataset):
+    """Running units of work in other processes gives the same results as running them
+    in-process."""
+    expected = _cuts(run_sweep(dataset, "detect-content", "opencv", GRID, workers=2))
+    assert len(expected) == len(GRID)
+    assert all(len(cuts) == len(dataset) for cuts in expected)
+    assert any(cuts for cell in expected for cuts in cell.values())
+    units = []
+    actual = run_sweep(
+        dataset,
+        "detect-content",
+        "opencv",
+        GRID,
+        workers=2,
+        processes=2,
+        on_unit_done=lambda video, results: units.append((video, sorted(results))),
+    )
+    assert _cuts(actual) == expected
+    # Each video is split into chunks of up to 2 cells.
+    assert sorted(units) == sorted(
+        (sample.video_file, chunk) for sample in dataset for chunk in ([0, 1], [2])
+    )
+
+
+def test_sweep_checkpoint_resume(dataset: Dataset, tmp_path: Path):
+    """A sweep resumed from a checkpoint only runs the cells which weren't completed."""
+    expected = _cuts(run_sweep(dataset, "detect-content", "opencv", GRID, workers=1))
+    out_path = str(tmp_path / "sweep.json")
+    settings = {"detector": "detect-content", "backend": "opencv", "grid": GRID}
+
+    # Checkpoint the first video only, as if the sweep was interrupted.
+    first = next(iter(dataset)).video_file
+    checkpoint = SweepCheckpoint.load(out_path, settings)
+    for cell_i, cell in enumerate(expected):
+        checkpoint.record(first, {cell_i: (cell[first], 1.0)})
+    checkpoint.save()
+
+    checkpoint = SweepCheckpoint.load(out_path, settings)
+    assert checkpoint.completed() == {
+        first: {cell_i: (cell[first], 1.0) for cell_i, cell in enumerate(expected)}
+    }
+    resumed = []
+    actual = run_sweep(
+        dataset,
+        "detect-content",
+        "opencv",
+        GRID,
+        workers=1,
+        completed=checkpoint.completed(),
+        on_unit_done=lambda video, results: resumed.append(video),
+    )
+    assert _cuts(actual) == expected
+    assert first not in resumed and len(resumed) == len(GRID)
+
+    # Checkpoints of a different sweep are rejected.
+    with pytest.raises(ValueError):
+        SweepCheckpoint.load(out_path, {**settings, "detector": "detect-hash"})
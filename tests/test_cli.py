@@ -10,6 +10,7 @@
 # included LICENSE file, or visit one of the above pages for details.
 #
 
+import json
 import os
 import subprocess
 
@@ -29,6 +30,9 @@ import subprocess
 # logic by creating a CLI context with the desired parameters.
 # TODO: Missing tests for --min-scene-len and --drop-short-scenes.
 import sys
+import threading
+import urllib.error
+import urllib.request
 from pathlib import Path
 
 import cv2
@@ -36,7 +40,10 @@ import numpy as np
 import pytest
 
 import scenedetect
-from scenedetect.output import is_ffmpeg_available, is_mkvmerge_available
+from scenedetect._cli import scenedetect as scenedetect_cli
+from scenedetect._cli.context import CliContext
+from scenedetect._cli.server import DetectionServer
+from scenedetect.output import is_ffmpeg_available, is_mkvmerge_available, is_pyav_available
 from scenedetect.platform import StrPath
 from tests.helpers import invoke_cli
 
@@ -120,6 +127,11 @@ def test_cli_crop():
     assert invoke_scenedetect("-i {VIDEO} --crop 0 0 256 256 time {TIME}", config_file=None) == 0
 
 
+def test_cli_crop_auto():
+    """Test --crop auto functionality."""
+    assert invoke_scenedetect("-i {VIDEO} --crop auto time {TIME}", config_file=None) == 0
+
+
 def test_cli_crop_rejects_invalid():
     """Test --crop rejects invalid options."""
     # Outside of video bounds
@@ -360,6 +372,82 @@ def test_cli_frame_rate_aliases_last_value_wins(options: list[str], succeeds: bo
     assert (exit_code == 0) is succeeds
 
 
+def test_cli_batch(tmp_path: Path):
+    """Each video in a batch is processed independently with its own output files, and videos
+    which fail to process do not stop the rest of the batch."""
+    video_dir = tmp_path / "videos"
+    video_dir.mkdir()
+    for name in ("a", "b", "c"):
+        (video_dir / f"{name}.mp4").write_bytes(Path(DEFAULT_VIDEO_PATH).read_bytes())
+    (video_dir / "notes.txt").write_text("not a video")
+    output_dir = tmp_path / "output"
+    options = ["-j", "2", "-o", str(output_dir), "-s", "$VIDEO_NAME.stats.csv"]
+    for batch in (str(video_dir), str(video_dir / "*.mp4")):
+        exit_code, _ = invoke_cli(
+            ["--batch", batch, *options, "time", "-s", "2s", "-d", "4s", "list-scenes"]
+        )
+        assert exit_code == 0
+        for name in ("a", "b", "c"):
+            assert (output_dir / f"{name}-Scenes.csv").exists()
+            assert (output_dir / f"{name}.stats.csv").exists()
+    file_list = tmp_path / "list.txt"
+    file_list.write_text(f"# Comment\n{video_dir / 'a.mp4'}\n\n{video_dir / 'missing.mp4'}\n")
+    exit_code, _ = invoke_cli(["--batch", f"@{file_list}", "-o", str(output_dir), "list-scenes"])
+    assert exit_code != 0
+    # Options that would make videos in the batch overwrite each other's output are rejected.
+    exit_code, _ = invoke_cli(["--batch", str(video_dir), "-s", "stats.csv", "list-scenes"])
+    assert exit_code != 0
+    exit_code, _ = invoke_cli(["--batch", str(video_dir), "-i", DEFAULT_VIDEO_PATH, "list-scenes"])
+    assert exit_code != 0
+
+
+def test_cli_serve(tmp_path: Path):
+    """Jobs submitted to the detection server are parsed and run like the command line, and
+    return the scene list as JSON."""
+
+    def post(request: dict) -> tuple[int, dict]:
+        try:
+            with urllib.request.urlopen(f"{url}/jobs", data=json.dumps(request).encode()) as r:
+                return r.status, json.loads(r.read())
+        except urllib.error.HTTPError as ex:
+            return ex.code, json.loads(ex.read())
+
+    server = DetectionServer(CliContext(), scenedetect_cli, ("127.0.0.1", 0), jobs=2)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        args = ["-o", str(tmp_path), "time", "-s", "2s", "-d", "4s", "detect-content"]
+        status, job = post({"input": DEFAULT_VIDEO_PATH, "args": [*args, "list-scenes"]})
+        assert status == 202
+        server.get_job(job["id"]).finished.wait()
+        with urllib.request.urlopen(f"{url}/jobs/{job['id']}") as response:
+            job = json.loads(response.read())
+        assert job["status"] == "done"
+        assert len(job["scenes"]) == len(job["cuts"]) + 1
+        assert (tmp_path / f"{DEFAULT_VIDEO_NAME}-Scenes.csv").exists()
+        # Waiting for a job returns the same result.
+        status, waited = post({"input": DEFAULT_VIDEO_PATH, "args": args, "wait": True})
+        assert status == 200
+        assert waited["scenes"] == job["scenes"]
+        # Invalid jobs fail without stopping the server.
+        status, failed = post({"input": "does_not_exist.mp4", "wait": True})
+        assert status == 200 and failed["status"] == "failed"
+        assert post({"args": args})[0] == 400
+        # Options shared by every job are rejected rather than ignored.
+        for option in (["-c", "other.cfg"], ["--logfile=log.txt"], ["-v", "debug"], ["-i", "a"]):
+            status, error = post({"input": DEFAULT_VIDEO_PATH, "args": [*option, *args]})
+            assert status == 400 and option[0].split("=")[0] in error["error"]
+        # Options of commands with the same name as a shared option are allowed.
+        status, job = post({"input": DEFAULT_VIDEO_PATH, "args": [*args, "split-video", "-c"]})
+        assert status == 202
+        server.get_job(job["id"]).finished.wait()
+    finally:
+        server.shutdown()
+        thread.join()
+        server.server_close()
+
+
 def test_cli_framerate_alias_is_visible():
     """Help shows all frame-rate aliases as one option."""
     exit_code, output = invoke_cli(["--help"])
@@ -456,6 +544,40 @@ def test_cli_list_scenes_skip_cuts(tmp_path: Path):
     assert output_path.read_text() == EXPECTED_CSV_OUTPUT
 
 
+def test_cli_list_scenes_stream(tmp_path: Path):
+    """Test `list-scenes` command with the --stream option, as CSV and JSON lines."""
+    options = ["-i", DEFAULT_VIDEO_PATH, "-o", str(tmp_path), "time", "-s", "2s", "-d", "4s"]
+    exit_code, _ = invoke_cli([*options, "detect-content", "list-scenes", "--stream"])
+    assert exit_code == 0
+    output_path = tmp_path.joinpath(f"{DEFAULT_VIDEO_NAME}-Scenes.csv")
+    EXPECTED_CSV_OUTPUT = """Scene Number,Start Frame,Start Timecode,Start Time (seconds),End Frame,End Timecode,End Time (seconds),Length (frames),Length (timecode),Length (seconds)
+1,49,00:00:02.002,2.002,90,00:00:03.754,3.754,42,00:00:01.752,1.752
+2,91,00:00:03.754,3.754,144,00:00:06.006,6.006,54,00:00:02.252,2.252
+"""
+    assert output_path.read_text() == EXPECTED_CSV_OUTPUT
+
+    exit_code, _ = invoke_cli(
+        [*options, "detect-content", "list-scenes", "--stream", "-f", "scenes.jsonl"]
+    )
+    assert exit_code == 0
+    scenes = [json.loads(line) for line in tmp_path.joinpath("scenes.jsonl").read_text().split()]
+    assert [(scene["start_frame"], scene["end_frame"]) for scene in scenes] == [(49, 90), (91, 144)]
+
+
+def test_cli_profile(tmp_path: Path):
+    """Test the --profile option writes the time spent in each stage to a JSON file."""
+    options = ["-i", DEFAULT_VIDEO_PATH, "-o", str(tmp_path), "--profile", "$VIDEO_NAME.json"]
+    exit_code, _ = invoke_cli([*options, "time", "-d", "2s", "detect-content"])
+    assert exit_code == 0
+    profile = json.loads(tmp_path.joinpath(f"{DEFAULT_VIDEO_NAME}.json").read_text())
+    assert profile["num_frames"] > 0
+    assert profile["bottleneck"] in ("decode", "detect")
+    for stage in ("decode", "queue_wait", "detector.ContentDetector", "post_process"):
+        assert stage in profile["stages"]
+    assert profile["stages"]["detector.ContentDetector"]["count"] == profile["num_frames"]
+    assert profile["queue"]["capacity"] > 0
+
+
 def test_cli_list_scenes_no_output(tmp_path: Path):
     """Test `list-scenes` command with the -n flag."""
     output_path = tmp_path.joinpath(f"{DEFAULT_VIDEO_NAME}-Scenes.csv")
@@ -599,6 +721,77 @@ def test_cli_split_video_mkvmerge(tmp_path: Path):
     )
 
 
+@pytest.mark.skipif(condition=not is_pyav_available(), reason="PyAV is not available")
+def test_cli_split_video_pyav(tmp_path: Path):
+    """Test `split-video` command using PyAV."""
+    assert (
+        invoke_scenedetect(
+            "-i {VIDEO} -s {STATS} time {TIME} {DETECTOR} split-video --pyav -p ultrafast",
+            output_dir=tmp_path,
+        )
+        == 0
+    )
+    entries = sorted(tmp_path.glob(f"{DEFAULT_VIDEO_NAME}-Scene-*"))
+    assert len(entries) == DEFAULT_NUM_SCENES, entries
+    [entry.unlink() for entry in entries]
+
+    assert (
+        invoke_scenedetect(
+            "-i {VIDEO} -s {STATS} time {TIME} {DETECTOR} split-video --pyav -c",
+            output_dir=tmp_path,
+        )
+        == 0
+    )
+    entries = sorted(tmp_path.glob(f"{DEFAULT_VIDEO_NAME}-Scene-*"))
+    assert len(entries) == DEFAULT_NUM_SCENES, entries
+
+    # --pyav cannot be combined with -a/--args or -m/--mkvmerge.
+    assert invoke_scenedetect(
+        '-i {VIDEO} {DETECTOR} split-video --pyav -a "-c:v libx264"',
+        output_dir=tmp_path,
+    )
+    assert invoke_scenedetect("-i {VIDEO} {DETECTOR} split-video --pyav -m", output_dir=tmp_path)
+
+    # --pyav overrides mkvmerge being set in a config file, but both can't be set in one.
+    [entry.unlink() for entry in entries]
+    config_path = tmp_path.joinpath("config.cfg")
+    config_path.write_text("[split-video]\nmkvmerge = yes\n")
+    assert (
+        invoke_scenedetect(
+            f"-i {{VIDEO}} -c {config_path} time {{TIME}} {{DETECTOR}} split-video --pyav",
+            output_dir=tmp_path,
+        )
+        == 0
+    )
+    entries = sorted(tmp_path.glob(f"{DEFAULT_VIDEO_NAME}-Scene-*.mp4"))
+    assert len(entries) == DEFAULT_NUM_SCENES, entries
+    config_path.write_text("[split-video]\nmkvmerge = yes\npyav = yes\n")
+    assert invoke_scenedetect(
+        f"-i {{VIDEO}} -c {config_path} {{DETECTOR}} split-video", output_dir=tmp_path
+    )
+
+
+@pytest.mark.skipif(condition=not is_ffmpeg_available(), reason="ffmpeg is not available")
+def test_cli_split_video_pyav_config_overridden(tmp_path: Path):
+    """Test that encoder options set via the CLI take precedence over `pyav = yes` in a config
+    file, rather than conflicting with it."""
+    config_path = tmp_path.joinpath("config.cfg")
+    config_path.write_text("""
+[split-video]
+pyav = yes
+""")
+    assert (
+        invoke_scenedetect(
+            f"-i {{VIDEO}} -c {config_path} time {{TIME}} {{DETECTOR}} split-video -a "
+            '"-map 0:v:0 -c:v libx264 -preset ultrafast"',
+            output_dir=tmp_path,
+        )
+        == 0
+    )
+    entries = sorted(tmp_path.glob(f"{DEFAULT_VIDEO_NAME}-Scene-*"))
+    assert len(entries) == DEFAULT_NUM_SCENES, entries
+
+
 def test_cli_save_images(tmp_path: Path):
     """Test `save-images` command."""
     assert (
@@ -785,6 +978,35 @@ def test_cli_save_qp_no_shift(tmp_path: Path):
     assert output_path.read_text() == EXPECTED_QP_CONTENTS[1:]
 
 
+def test_cli_save_raw(tmp_path: Path):
+    """Test `save-raw` command, and that the raw frame file can be used as input."""
+    assert (
+        invoke_scenedetect(
+            "-i {VIDEO} -d 4 --crop 16 8 335 199 time -s 51 -e 95 {DETECTOR} save-raw",
+            output_dir=tmp_path,
+        )
+        == 0
+    )
+    output_path = tmp_path.joinpath(f"{DEFAULT_VIDEO_NAME}.sdraw")
+    video = scenedetect.open_video(str(output_path))
+    assert video.BACKEND_NAME == "raw"
+    # Frames are saved with their original timestamps.
+    assert video.num_frames == 45
+    assert video.read() is not False
+    assert video.frame_number == 51
+    # Frames are saved as they were processed, after cropping and downscaling.
+    assert video.frame_size == (80, 48)
+    assert (
+        invoke_scenedetect(
+            "-i {VIDEO} -d 1 {DETECTOR} save-qp",
+            VIDEO=str(output_path),
+            output_dir=tmp_path,
+        )
+        == 0
+    )
+    assert tmp_path.joinpath(f"{DEFAULT_VIDEO_NAME}.qp").read_text() == "0 I -1\n90 I -1\n"
+
+
 @pytest.mark.parametrize("backend_type", ALL_BACKENDS)
 def test_cli_backend(backend_type: str):
     """Test setting the `-b`/`--backend` argument."""
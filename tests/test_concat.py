@@ -109,6 +109,78 @@ def test_seam_monotonicity_vfr(test_vfr_drop3_video):
         last_seconds = seconds
 
 
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_prefetch_matches_synchronous(test_fades_clip, backend):
+    """Prefetching the next source in the background must not change any frames or timing
+    compared to opening it once the current source ends."""
+
+    def read_all(prefetch_frames):
+        video = VideoStreamConcat(
+            [test_fades_clip] * 3, backend=backend, prefetch_frames=prefetch_frames
+        )
+        frames = []
+        while True:
+            frame = video.read()
+            if frame is False:
+                break
+            frames.append((video.position.seconds, video.frame_number, int(frame.sum())))
+        return frames
+
+    expected = read_all(prefetch_frames=0)
+    assert len(expected) == 3 * FADES_TOTAL_FRAMES
+    assert read_all(prefetch_frames=4) == pytest.approx(expected, abs=1.0e-5)
+
+
+def test_prefetch_seek(test_fades_clip):
+    """Seeking must discard prefetched frames, including when seeking into the source that
+    is being prefetched."""
+    video = VideoStreamConcat([test_fades_clip] * 3, prefetch_frames=8)
+    video.seek(FADES_DURATION + 1.0)
+    assert video.read(decode=False) is not False
+    assert abs(video.position.seconds - (FADES_DURATION + 1.0)) < 0.25
+    video.seek(1.0)
+    assert video.read(decode=False) is not False
+    assert abs(video.position.seconds - 1.0) < 0.25
+    video.reset()
+    assert video.read(decode=False) is not False
+    assert video.position.seconds == 0.0
+    with pytest.raises(ValueError):
+        VideoStreamConcat([test_fades_clip], prefetch_frames=-1)
+
+
+def test_probe_workers(test_fades_clip, test_video_file):
+    """Probing inputs concurrently must produce the same metadata, and raise the same error
+    for the first invalid input, as probing them one at a time."""
+    paths = [test_fades_clip] * 4
+    sequential = VideoStreamConcat(paths, probe_workers=1)
+    concurrent = VideoStreamConcat(paths, probe_workers=4)
+    assert concurrent._sources == sequential._sources
+    assert concurrent.duration == sequential.duration
+    with pytest.raises(VideoOpenFailure):
+        VideoStreamConcat([test_fades_clip, test_fades_clip, test_video_file], probe_workers=4)
+    with pytest.raises(OSError):
+        VideoStreamConcat([test_fades_clip, "does_not_exist.mp4"], probe_workers=4)
+
+
+def test_metadata_cache(test_fades_clip, tmp_path):
+    """Metadata is written to the cache on first open, and read back on the next one."""
+    cache_path = tmp_path / "index.json"
+    paths = [test_fades_clip] * 3
+    video = VideoStreamConcat(paths, metadata_cache=cache_path)
+    assert cache_path.exists()
+    cached = VideoStreamConcat(paths, metadata_cache=cache_path)
+    assert cached._sources == video._sources
+    assert cached.duration == video.duration
+    # Entries are keyed by the options used to open each input.
+    video = VideoStreamConcat(paths, frame_rate=10, metadata_cache=cache_path)
+    assert video.frame_rate == 10
+    assert video._sources[1].frame_rate == 10
+    # An invalid cache is ignored and replaced.
+    cache_path.write_text("not json")
+    video = VideoStreamConcat(paths, metadata_cache=cache_path)
+    assert video._sources == cached._sources
+
+
 def test_map_span(test_fades_clip):
     """A span crossing the seam between two inputs must map to two local spans."""
     video = VideoStreamConcat([test_fades_clip] * 2)
@@ -17,12 +17,17 @@ test case material.
 """
 
 import os
+import random
 from dataclasses import dataclass
+from fractions import Fraction
 
+import numpy as np
 import pytest
 
 from scenedetect import FrameTimecode, SceneDetector, SceneManager, StatsManager, detect
 from scenedetect.backends.opencv import VideoStreamCv2
+from scenedetect.common import Timecode
+from scenedetect.detector import FlashFilter
 from scenedetect.detectors import (
     AdaptiveDetector,
     ContentDetector,
@@ -261,3 +266,46 @@ def test_min_scene_len_accepts_time_values(detector_type, min_scene_len):
     scene_list = test_case.detect()
     start_frames = [timecode.frame_num for timecode, _ in scene_list]
     assert start_frames == test_case.scene_boundaries
+
+
+@pytest.mark.parametrize("mode", list(FlashFilter.Mode))
+@pytest.mark.parametrize("length", [0, 1, 15, 0.2, 0.5, "0.3s"])
+def test_flash_filter_array_matches_streaming(mode, length):
+    """`FlashFilter.filter_array` must emit exactly the same cuts as `FlashFilter.filter`, for both
+    PTS-backed and seconds-backed timestamps."""
+    frame_rate = Fraction(30000, 1001)
+    time_base = Fraction(1, 90000)
+    rng = random.Random(0)
+    for _ in range(20):
+        num_frames = rng.randint(0, 300)
+        pts = [3003 * i + rng.choice((1, 1, 2, 0)) for i in range(num_frames)]
+        probability = rng.choice((0.05, 0.3, 0.8))
+        above = [rng.random() < probability for _ in range(num_frames)]
+
+        flash_filter = FlashFilter(mode=mode, length=length)
+        expected = [
+            cut.pts
+            for value, is_above in zip(pts, above, strict=True)
+            for cut in flash_filter.filter(
+                FrameTimecode(Timecode(pts=value, time_base=time_base), fps=frame_rate), is_above
+            )
+        ]
+        cuts = FlashFilter(mode=mode, length=length).filter_array(
+            np.array(pts, dtype=np.int64), np.array(above), time_base, frame_rate
+        )
+        assert [pts[i] for i in cuts] == expected
+
+        seconds = [float(value * time_base) for value in pts]
+        flash_filter = FlashFilter(mode=mode, length=length)
+        expected = [
+            cut.seconds
+            for value, is_above in zip(seconds, above, strict=True)
+            for cut in flash_filter.filter(FrameTimecode(value, fps=frame_rate), is_above)
+        ]
+        cuts = FlashFilter(mode=mode, length=length).filter_array(
+            np.array(seconds), np.array(above), frame_rate=frame_rate
+        )
+        assert [seconds[i] for i in cuts] == expected
+
+    with pytest.raises(ValueError):
+        FlashFilter(mode=mode, length=15).filter_array(np.zeros(2), np.zeros(2, dtype=bool))
@@ -19,7 +19,7 @@ import numpy as np
 import pytest
 
 from scenedetect import ContentDetector, SceneManager, detect, open_video
-from scenedetect._fan_out import FanOutVideoStream
+from scenedetect._fan_out import FanOutVideoStream, PreprocessSpec
 from scenedetect.video_stream import SeekError
 
 
@@ -234,3 +234,102 @@ def test_fan_out_prefetch_zero_rendezvous(test_video_file):
         fan.close()
 
     assert results[0] == results[1] > 0
+
+
+def test_fan_out_frames_are_read_only(test_video_file):
+    """Frames are shared between consumers without copying, so they must not be writable."""
+    for pool_size in (None, 0):
+        source = open_video(test_video_file)
+        fan = FanOutVideoStream(source, n=2, pool_size=pool_size)
+        fan.start()
+        try:
+            frame = fan.stream(0).read()
+            assert isinstance(frame, np.ndarray)
+            assert not frame.flags.writeable
+            with pytest.raises(ValueError):
+                frame[0, 0] = 0
+        finally:
+            fan.close()
+
+
+def test_fan_out_recycles_buffers(test_video_file):
+    """Released frame buffers are decoded into again, but never while a consumer still holds
+    a reference to the frame or to a view of it."""
+    baseline = [int(frame.sum()) for frame in _read_all(open_video(test_video_file))[:100]]
+
+    source = open_video(test_video_file)
+    fan = FanOutVideoStream(source, n=2, prefetch=2)
+    fan.start()
+    addresses: set[int] = set()
+    sums: list[list[int]] = [[], []]
+    held = None
+
+    def worker(i: int) -> None:
+        nonlocal held
+        stream = fan.stream(i)
+        for _ in range(len(baseline)):
+            frame = stream.read()
+            sums[i].append(int(frame.sum()))
+            addresses.add(frame.__array_interface__["data"][0])
+            if i == 0 and stream.frame_number == 5:
+                held = (frame[10:20], frame[10:20].copy())
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(2)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        fan.close()
+
+    assert sums[0] == baseline
+    assert sums[1] == baseline
+    assert np.array_equal(held[0], held[1])
+    assert len(addresses) < len(baseline) // 2
+
+
+def test_fan_out_preprocess_shared_between_consumers(test_video_file):
+    """Consumers with equal preprocessing specs receive the same processed frame object."""
+    spec = PreprocessSpec(crop=(10, 10, 209, 149), downscale=2.0)
+    source = open_video(test_video_file)
+    fan = FanOutVideoStream(source, n=3, preprocess=[spec, PreprocessSpec(**vars(spec)), None])
+    fan.start()
+    try:
+        assert fan.stream(0).frame_size == (100, 70)
+        assert fan.stream(2).frame_size == source.frame_size
+        frames = [fan.stream(i).read() for i in range(3)]
+    finally:
+        fan.close()
+    assert frames[0] is frames[1]
+    assert frames[0].shape == (70, 100, 3)
+    assert not frames[0].flags.writeable
+    assert frames[2].shape[:2] == (source.frame_size[1], source.frame_size[0])
+    with pytest.raises(ValueError):
+        FanOutVideoStream(source, n=2, preprocess=[spec])
+
+
+def test_fan_out_preprocess_matches_scene_manager(test_video_file):
+    """Preprocessing on the reader thread gives the same cuts as letting each SceneManager
+    crop and downscale frames itself."""
+    crop = (0, 0, 599, 299)
+    baseline = SceneManager()
+    baseline.add_detector(ContentDetector())
+    baseline.crop = crop
+    baseline.detect_scenes(video=open_video(test_video_file))
+    baseline_cuts = [scene[1].frame_num for scene in baseline.get_scene_list()]
+
+    source = open_video(test_video_file)
+    spec = PreprocessSpec.for_frame_size(source.frame_size, crop=crop)
+    fan = FanOutVideoStream(source, n=1, preprocess=spec)
+    fan.start()
+    try:
+        sm = SceneManager()
+        sm.auto_downscale = False
+        sm.add_detector(ContentDetector())
+        sm.detect_scenes(video=fan.stream(0))
+        cuts = [scene[1].frame_num for scene in sm.get_scene_list()]
+    finally:
+        fan.close()
+
+    assert cuts == baseline_cuts
@@ -0,0 +1,102 @@
+#
+#            PySceneDetect: Python-Based Video Scene Detector
+#   -------------------------------------------------------------------
+#     [  Site:    https://scenedetect.com                           ]
+#     [  Docs:    https://scenedetect.com/docs/                     ]
+#     [  Github:  https://github.com/Breakthrough/PySceneDetect/    ]
+#
+# Copyright (C) 2026 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""PySceneDetect Import Tests
+
+Validates that importing `scenedetect` defers optional and rarely used modules until they are
+needed, and benchmarks how long the import takes so that it doesn't regress."""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import scenedetect
+
+DEFERRED_MODULES = [
+    "av",
+    "moviepy",
+    "onnxruntime",
+    "scenedetect.backends.pyav",
+    "scenedetect.backends.moviepy",
+    "scenedetect.output",
+    "tqdm",
+]
+"""Modules which must not be imported by `import scenedetect`."""
+
+IMPORT_TIME_RUNS = 3
+
+
+def _run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+@pytest.mark.parametrize("module", DEFERRED_MODULES)
+def test_import_is_lazy(module: str):
+    """Importing the package does not import modules that may not be used."""
+    code = f"import sys, scenedetect; assert {module!r} not in sys.modules"
+    _run_python(code)
+
+
+def test_cli_import_is_lazy():
+    """Importing the CLI does not import any of the video backends with optional dependencies."""
+    code = "import sys, scenedetect._cli; assert not {'av', 'moviepy'} & set(sys.modules)"
+    _run_python(code)
+
+
+def test_lazy_exports():
+    """Every lazily imported name resolves to the same object as in the module defining it."""
+    for name, module in scenedetect._LAZY_MODULES.items():
+        assert getattr(scenedetect, name) is getattr(importlib.import_module(module), name)
+        assert name in dir(scenedetect)
+    with pytest.raises(AttributeError):
+        _ = scenedetect.DoesNotExist
+
+
+@pytest.mark.release
+def test_import_time():
+    """Benchmark the time `import scenedetect` takes on top of importing OpenCV (and NumPy).
+
+    Absolute times vary too much between machines to test for, so instead this ensures the
+    package itself takes less time to import than OpenCV does. Each run is done in a new
+    interpreter, and the fastest of several runs is used to reduce noise. This still depends on
+    the machine it runs on, so it is opt-in (run with `pytest -m release`)."""
+    overheads = []
+    for _ in range(IMPORT_TIME_RUNS):
+        stderr = _run_python("import scenedetect", "-X", "importtime").stderr
+        cumulative = {}
+        for line in stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            (_, total, name) = line.split("|")
+            if total.strip().isdigit():
+                cumulative.setdefault(name.strip(), int(total))
+        opencv_us = cumulative.get("cv2", 0)
+        overheads.append((cumulative["scenedetect"] - opencv_us, opencv_us))
+    (overhead_us, opencv_us) = min(overheads)
+    assert overhead_us < opencv_us, (
+        f"import scenedetect took {overhead_us / 1000:.1f} ms + OpenCV {opencv_us / 1000:.1f} ms"
+    )
+
+
+def test_star_import():
+    """`from scenedetect import *` includes the lazily imported names, and only public names."""
+    namespace = {}
+    exec("from scenedetect import *", namespace)
+    for name in scenedetect._LAZY_MODULES:
+        assert name in namespace
+    assert "open_video" in namespace
+    for name in ("ty", "importlib", "warnings", "getLogger", "logger", "common"):
+        assert name not in namespace
+    assert len(set(scenedetect.__all__)) == len(scenedetect.__all__)
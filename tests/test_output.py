@@ -28,10 +28,14 @@ from scenedetect import (
     save_images,
 )
 from scenedetect.output import (
+    CsvSceneListWriter,
+    JsonLinesSceneListWriter,
     SceneMetadata,
     VideoMetadata,
     is_ffmpeg_available,
+    is_pyav_available,
     split_video_ffmpeg,
+    split_video_pyav,
     write_scene_list,
     write_scene_list_edl,
     write_scene_list_fcp7,
@@ -93,6 +97,55 @@ def test_split_video_ffmpeg_formatter(tmp_path, test_movie_clip):
     assert len(entries) == len(scenes)
 
 
+@pytest.mark.skipif(condition=not is_pyav_available(), reason="PyAV is not available")
+def test_split_video_pyav(tmp_path, test_movie_clip):
+    video = open_video(test_movie_clip)
+    # Extract three hard-coded scenes for testing, each 30 frames.
+    scenes = [
+        (video.base_timecode + 30, video.base_timecode + 60),
+        (video.base_timecode + 60, video.base_timecode + 90),
+        (video.base_timecode + 90, video.base_timecode + 120),
+    ]
+    assert (
+        split_video_pyav(
+            test_movie_clip, scenes, output_dir=tmp_path, codec_options={"preset": "ultrafast"}
+        )
+        == 0
+    )
+    video_name = Path(test_movie_clip).stem
+    entries = sorted(tmp_path.glob(f"{video_name}-Scene-*"))
+    assert len(entries) == len(scenes)
+    # Each scene is re-encoded, so the outputs should be frame accurate.
+    for entry in entries:
+        assert open_video(str(entry), backend="pyav").duration.frame_num == 30
+
+
+@pytest.mark.skipif(condition=not is_pyav_available(), reason="PyAV is not available")
+def test_split_video_pyav_copy(tmp_path, test_movie_clip):
+    video = open_video(test_movie_clip)
+    scenes = [
+        (video.base_timecode + 30, video.base_timecode + 60),
+        (video.base_timecode + 60, video.base_timecode + 90),
+        (video.base_timecode + 90, video.base_timecode + 120),
+    ]
+
+    def name_formatter(video: VideoMetadata, scene: SceneMetadata):
+        return "abc" + video.name + "-123-" + str(scene.index) + ".mp4"
+
+    assert (
+        split_video_pyav(
+            test_movie_clip, scenes, output_dir=tmp_path, copy=True, formatter=name_formatter
+        )
+        == 0
+    )
+    video_name = Path(test_movie_clip).stem
+    entries = sorted(tmp_path.glob(f"abc{video_name}-123-*"))
+    assert len(entries) == len(scenes)
+    # Copied scenes start on a keyframe at or before the scene start, so can only be longer.
+    for entry in entries:
+        assert open_video(str(entry), backend="pyav").duration.frame_num >= 30
+
+
 # TODO: Add tests for `split_video_mkvmerge`.
 
 
@@ -278,6 +331,41 @@ def test_write_scene_list_accepts_path(tmp_path: Path):
     assert "Scene Number" in output_path.read_text()
 
 
+def test_scene_list_writers(tmp_path: Path):
+    """Scenes are written and flushed one at a time, with the same values as write_scene_list."""
+    scenes = _fake_scenes(_FPS_CFR, [(0, 30), (30, 75), (75, 90)])
+    buf = StringIO()
+    write_scene_list(buf, scenes, include_cut_list=False)
+    csv_path = tmp_path / "scenes.csv"
+    jsonl_path = tmp_path / "scenes.jsonl"
+    with (
+        CsvSceneListWriter(csv_path) as csv_writer,
+        JsonLinesSceneListWriter(jsonl_path) as jsonl_writer,
+    ):
+        for i, scene in enumerate(scenes):
+            csv_writer.write(scene)
+            jsonl_writer.write(scene)
+            # Each scene must be readable as soon as it is written.
+            assert len(csv_path.read_text().splitlines()) == i + 2
+            assert len(jsonl_path.read_text().splitlines()) == i + 1
+        assert csv_writer.num_scenes == len(scenes)
+    assert csv_path.read_text() == buf.getvalue()
+    lines = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+    assert len(lines) == len(scenes)
+    assert lines[1] == {
+        "scene_number": 2,
+        "start_frame": 31,
+        "start_timecode": "00:00:01.000",
+        "start_seconds": 1.0,
+        "end_frame": 75,
+        "end_timecode": "00:00:02.500",
+        "end_seconds": 2.5,
+        "length_frames": 45,
+        "length_timecode": "00:00:01.500",
+        "length_seconds": 1.5,
+    }
+
+
 def test_write_scene_list_edl(tmp_path: Path):
     """EDL output has title header, FCM line, and one event per scene in CMX 3600 format."""
     scenes = _fake_scenes(_FPS_CFR, [(0, 30), (30, 60)])
@@ -15,12 +15,34 @@ This file includes unit tests for the scenedetect.scene_manager.SceneManager cla
 which applies SceneDetector algorithms on VideoStream backends.
 """
 
+import asyncio
+
+import cv2
+import numpy as np
 import pytest
 
+from scenedetect._frame_pool import PooledFrame
 from scenedetect.backends.opencv import VideoStreamCv2
-from scenedetect.common import FrameTimecode
-from scenedetect.detectors import AdaptiveDetector, ContentDetector
-from scenedetect.scene_manager import SceneManager, expand_scenes_to_bounds
+from scenedetect.common import FrameTimecode, Subsampling
+from scenedetect.detectors import (
+    AdaptiveDetector,
+    ContentDetector,
+    HistogramDetector,
+    ThresholdDetector,
+)
+from scenedetect.profiler import DetectionProfile
+from scenedetect.scene_manager import (
+    MAX_ADAPTIVE_FRAME_QUEUE_LENGTH,
+    MIN_ADAPTIVE_FRAME_QUEUE_LENGTH,
+    SceneManager,
+    compute_downscale_factor,
+    compute_frame_queue_length,
+    detect_crop_region,
+    downscale_frame,
+    downscaled_size,
+    expand_scenes_to_bounds,
+)
+from scenedetect.stats_manager import StatsManager
 
 TEST_VIDEO_START_FRAMES_ACTUAL = [150, 180, 394]
 
@@ -179,6 +201,274 @@ def test_detect_scenes_callback_adaptive(test_video_file):
     assert fake_callback.scene_list == TEST_VIDEO_START_FRAMES_ACTUAL[1:]
 
 
+@pytest.mark.parametrize("detector_type", [ContentDetector, AdaptiveDetector, ThresholdDetector])
+def test_stream_scenes(test_video_file, detector_type):
+    """Scenes yielded by stream_scenes must match get_scene_list, and each one must be yielded
+    before the end of the video unless it is the last one."""
+    video = VideoStreamCv2(test_video_file)
+    sm = SceneManager()
+    sm.add_detector(detector_type())
+    end_time = FrameTimecode("00:00:15", video.frame_rate)
+    streamed = []
+    for scene in sm.stream_scenes(video=video, end_time=end_time, start_in_scene=True):
+        streamed.append((scene, video.position))
+    assert [scene for scene, _ in streamed] == sm.get_scene_list(start_in_scene=True)
+    assert len(streamed) > 1
+    for (_, end), position in streamed[:-1]:
+        assert position < end_time - 1
+        assert end <= position
+
+
+def test_stream_scenes_stop_early(test_video_file):
+    """Closing the generator returned by stream_scenes must stop detection."""
+    video = VideoStreamCv2(test_video_file)
+    sm = SceneManager()
+    sm.add_detector(ContentDetector())
+    scenes = sm.stream_scenes(video=video)
+    next(scenes)
+    scenes.close()
+    assert video.position < video.duration
+
+
+def test_max_cuts(test_video_file):
+    """With max_cuts set, only the most recent cuts are kept, and the scene list starts at the
+    last discarded cut. Streamed scenes and their latency are unaffected."""
+    video = VideoStreamCv2(test_video_file)
+    end_time = FrameTimecode("00:00:20", video.frame_rate)
+    sm = SceneManager()
+    sm.add_detector(ContentDetector())
+    expected = list(sm.stream_scenes(video=video, end_time=end_time))
+    assert len(expected) > 3
+
+    video.reset()
+    sm = SceneManager(max_cuts=2)
+    sm.add_detector(ContentDetector())
+    assert list(sm.stream_scenes(video=video, end_time=end_time)) == expected
+    assert sm.get_scene_list() == expected[-3:]
+    assert sm.cut_latency.count == len(expected)
+    assert 0.0 <= sm.cut_latency.mean <= sm.cut_latency.max
+    with pytest.raises(ValueError):
+        SceneManager(max_cuts=0)
+
+
+def test_detect_scenes_async(test_video_file):
+    """detect_scenes_async must report the same cuts as detect_scenes."""
+    video = VideoStreamCv2(test_video_file)
+    end_time = FrameTimecode("00:00:15", video.frame_rate)
+    sm = SceneManager()
+    sm.add_detector(ContentDetector())
+    sm.detect_scenes(video=video, end_time=end_time)
+    expected = sm.get_scene_list()
+
+    async def detect():
+        return [update async for update in sm.detect_scenes_async(video, end_time=end_time)]
+
+    video.reset()
+    sm = SceneManager()
+    sm.add_detector(ContentDetector())
+    updates = asyncio.run(detect())
+    assert sm.get_scene_list() == expected
+    assert [cut for update in updates for cut in update.cuts] == [
+        start for start, _ in expected[1:]
+    ]
+    assert updates[-1].complete and not any(update.complete for update in updates[:-1])
+    assert updates[-1].frames_processed == video.frame_number
+
+    sm = SceneManager(StatsManager())
+    with pytest.raises(ValueError):
+        asyncio.run(anext(sm.detect_scenes_async(video, frame_skip=1)))
+
+
+def test_detect_scenes_async_cancel(test_video_file):
+    """Cancelling the task iterating over detect_scenes_async must stop detection."""
+    video = VideoStreamCv2(test_video_file)
+    sm = SceneManager()
+    sm.add_detector(ContentDetector())
+
+    async def detect():
+        async for update in sm.detect_scenes_async(video, progress_interval=0.0):
+            if update.frames_processed >= 10:
+                asyncio.current_task().cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(detect())
+    assert 10 <= video.frame_number < video.duration.frame_num
+
+
+def test_detect_scenes_async_cancel_before_start(synthetic_video):
+    """Cancelling the task before the first update arrives must also stop detection."""
+    video = VideoStreamCv2(synthetic_video((320, 180), duration=60.0))
+    sm = SceneManager()
+    sm.add_detector(ContentDetector())
+
+    async def detect():
+        task = asyncio.create_task(anext(sm.detect_scenes_async(video)))
+        await asyncio.sleep(0)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(detect())
+    assert video.frame_number < video.duration.frame_num // 2
+
+
+def test_detect_scenes_profile(test_video_file):
+    """Time spent in each stage is recorded when the SceneManager has a DetectionProfile."""
+    video = VideoStreamCv2(test_video_file)
+    sm = SceneManager(profile=DetectionProfile())
+    sm.add_detector(ContentDetector())
+    sm.add_detector(ContentDetector())
+    num_frames = sm.detect_scenes(video=video, end_time=30)
+    profile = sm.profile
+    assert profile is not None
+    assert profile.num_frames == num_frames
+    assert list(profile.stages) == [
+        "decode",
+        "crop_resize",
+        "queue_wait",
+        "detector.ContentDetector[0]",
+        "detector.ContentDetector[1]",
+        "post_process",
+    ]
+    for name in ("decode", "crop_resize", "queue_wait", "detector.ContentDetector[0]"):
+        assert profile.stages[name].count >= num_frames
+    assert profile.stages["post_process"].count == 1
+    assert 0.0 < profile.detect_time < profile.wall_time
+    assert profile.bottleneck in ("decode", "detect")
+    assert profile.to_dict()["num_frames"] == num_frames
+    assert "detector.ContentDetector[1]" in profile.summary()
+    assert profile.queue.num_gets == sm.queue_stats.num_gets
+
+
+def test_compute_frame_queue_length():
+    """Queue length is chosen to fit the memory budget, within the allowed range."""
+    assert compute_frame_queue_length((100, 100), 100 * 100 * 3 * 10) == 10
+    assert compute_frame_queue_length((7680, 4320), 16 * 2**20) == MIN_ADAPTIVE_FRAME_QUEUE_LENGTH
+    assert compute_frame_queue_length((32, 32), 2**30) == MAX_ADAPTIVE_FRAME_QUEUE_LENGTH
+
+
+def test_frame_queue_memory(test_video_file):
+    """Queue occupancy and stalls are recorded for each run, with the queue sized from the
+    memory budget if one is set."""
+    video = VideoStreamCv2(test_video_file)
+    sm = SceneManager()
+    sm.add_detector(ContentDetector())
+    sm.auto_downscale = False
+    width, height = video.frame_size
+    sm.frame_queue_memory = width * height * 3 * 8
+    num_frames = sm.detect_scenes(video=video, end_time=30)
+    stats = sm.queue_stats
+    assert stats.capacity == 8
+    # The end of the video is also signalled through the queue.
+    assert stats.num_gets == num_frames + 1
+    assert 0 <= stats.mean_occupancy <= stats.max_occupancy <= stats.capacity
+    assert stats.producer_blocked_time >= 0.0 and stats.consumer_starved_time >= 0.0
+    with pytest.raises(ValueError):
+        sm.frame_queue_memory = 0
+
+
+class _UnseekableVideoStreamCv2(VideoStreamCv2):
+    @property
+    def is_seekable(self) -> bool:
+        return False
+
+
+@pytest.mark.parametrize("seekable", [True, False])
+@pytest.mark.parametrize("detector_type", [AdaptiveDetector, ContentDetector])
+def test_adaptive_frame_skip(synthetic_video, seekable, detector_type):
+    """Adaptive frame skip finds the same cuts as processing every frame, including cuts in the
+    frames skipped at the end."""
+    # A moving gradient which changes colour every 2 seconds.
+    path = synthetic_video((320, 180), duration=10.0)
+
+    def detect(frame_skip: int, adaptive: bool, end_time: int | None = None):
+        video = VideoStreamCv2(path) if seekable else _UnseekableVideoStreamCv2(path)
+        sm = SceneManager()
+        sm.adaptive_frame_skip = adaptive
+        sm.add_detector(detector_type())
+        num_frames = sm.detect_scenes(video=video, frame_skip=frame_skip, end_time=end_time)
+        scene_list = sm.get_scene_list()
+        return [start for start, _ in scene_list[1:]], scene_list[-1][1], num_frames
+
+    # With 6 frames skipped, the cut at frame 100 is in the last frames skipped before 103.
+    for end_time in (None, 103):
+        expected = detect(0, False, end_time)[0]
+        assert len(expected) == (4 if end_time is None else 2)
+        for frame_skip in (3, 6):
+            cuts, end, num_frames = detect(frame_skip, True, end_time)
+            assert cuts == expected
+            # Processing the skipped frames must not read past where plain frame skip stops.
+            assert (end, num_frames) == detect(frame_skip, False, end_time)[1:]
+    # Without adaptive frame skip, cuts are only found at the frames which are processed.
+    assert detect(6, False)[0] != detect(0, False)[0]
+
+
+class _DecodeCountingVideoStreamCv2(VideoStreamCv2):
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.decoded: list[int] = []
+
+    def read(self, decode: bool = True):
+        frame = super().read(decode)
+        if decode and frame is not False:
+            self.decoded.append(self.position.frame_num)
+        return frame
+
+
+def test_adaptive_frame_skip_decodes_once(synthetic_video):
+    """Seeking back to process skipped frames doesn't decode any frame a second time."""
+    video = _DecodeCountingVideoStreamCv2(synthetic_video((320, 180), duration=10.0))
+    sm = SceneManager()
+    sm.adaptive_frame_skip = True
+    sm.add_detector(ContentDetector())
+    sm.detect_scenes(video=video, frame_skip=6)
+    assert len(sm.get_scene_list()) == 5
+    assert len(video.decoded) == len(set(video.decoded))
+
+
+@pytest.mark.parametrize("subsampling", list(Subsampling))
+@pytest.mark.parametrize("frame_size", [(1920, 1080), (1001, 563), (5, 3)])
+@pytest.mark.parametrize("factor", [1.0, 2.0, 7.5])
+def test_downscale_frame(subsampling, frame_size, factor):
+    frame = np.random.default_rng(0).integers(0, 256, (*frame_size[::-1], 3), dtype=np.uint8)
+    downscaled = downscale_frame(frame, factor, subsampling)
+    assert downscaled.shape == (*downscaled_size(frame_size, factor, subsampling)[::-1], 3)
+    if factor == 1.0:
+        assert downscaled is frame
+    elif subsampling == Subsampling.STRIDE:
+        assert np.shares_memory(downscaled, frame)
+
+
+def test_downscale_frame_pool():
+    """Pooling averages each block of pixels, discarding partial blocks at the edges."""
+    frame = np.random.default_rng(0).integers(0, 256, (103, 205, 3), dtype=np.uint8)
+    pooled = downscale_frame(frame, 4.0, Subsampling.POOL)
+    expected = frame[:100, :204].reshape(25, 4, 51, 4, 3).mean(axis=(1, 3))
+    assert pooled.shape == expected.shape
+    assert np.abs(pooled - expected).max() <= 0.5 + 1e-6
+
+
+def test_downscale_frame_roi():
+    """Tiles are taken from the center of each cell of a 3x3 grid at full resolution."""
+    frame = np.arange(90 * 90, dtype=np.uint16).reshape(90, 90)
+    tiles = downscale_frame(frame, 3.0, Subsampling.ROI)
+    assert tiles.shape == (30, 30)
+    assert np.array_equal(tiles[:10, :10], frame[10:20, 10:20])
+    assert np.array_equal(tiles[10:20, 20:30], frame[40:50, 70:80])
+
+
+@pytest.mark.parametrize("subsampling", list(Subsampling))
+@pytest.mark.parametrize("detector_type", [AdaptiveDetector, ContentDetector, HistogramDetector])
+def test_detect_scenes_subsampling(synthetic_video, subsampling, detector_type):
+    """Each subsampling method finds the hard cuts in a synthetic video."""
+    path = synthetic_video((640, 360))
+    sm = SceneManager()
+    sm.subsampling = subsampling
+    sm.add_detector(detector_type())
+    sm.detect_scenes(video=VideoStreamCv2(path))
+    assert [start.frame_num for start, _ in sm.get_scene_list()[1:]] == [50, 100]
+
+
 def test_detect_scenes_crop(test_video_file):
     video = VideoStreamCv2(test_video_file)
     sm = SceneManager()
@@ -196,6 +486,73 @@ def test_detect_scenes_crop(test_video_file):
     assert [start for start, _ in scene_list] == TEST_VIDEO_START_FRAMES_ACTUAL
 
 
+def test_output_buffers_reused(synthetic_video):
+    """Buffers of downscaled frames are reused, but never while a frame is still referenced."""
+    path = synthetic_video((640, 360))
+    factor = compute_downscale_factor(640)
+    video = VideoStreamCv2(path)
+    expected = []
+    while (frame := video.read()) is not False:
+        expected.append(int(downscale_frame(frame, factor).sum()))
+
+    sums = []
+    addresses = set()
+    held = None
+
+    class RecordingDetector(ContentDetector):
+        def process_frame(self, timecode, frame_img):
+            nonlocal held
+            assert isinstance(frame_img.base, PooledFrame)
+            sums.append(int(frame_img.sum()))
+            addresses.add(frame_img.__array_interface__["data"][0])
+            if timecode.frame_num == 5:
+                held = (frame_img[10:20], frame_img[10:20].copy())
+            return super().process_frame(timecode, frame_img)
+
+    sm = SceneManager()
+    sm.add_detector(RecordingDetector())
+    sm.detect_scenes(video=VideoStreamCv2(path))
+    assert sums == expected
+    assert np.array_equal(held[0], held[1])
+    assert len(addresses) < len(expected) // 2
+
+
+def test_detect_crop_region(synthetic_video, tmp_path):
+    """The region inside black bars added around a video is found, and the video is returned to
+    its original position."""
+    source_path = synthetic_video((256, 112))
+    path = str(tmp_path / "letterbox.mp4")
+    source = VideoStreamCv2(source_path)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), 25.0, (320, 176))
+    while (frame := source.read()) is not False:
+        writer.write(cv2.copyMakeBorder(frame, 32, 32, 32, 32, cv2.BORDER_CONSTANT, value=0))
+    writer.release()
+
+    video = VideoStreamCv2(path)
+    for _ in range(10):
+        video.read()
+    assert detect_crop_region(video) == (32, 32, 287, 143)
+    assert video.frame_number == 10
+    # No black bars.
+    assert detect_crop_region(VideoStreamCv2(source_path)) is None
+
+    sm = SceneManager()
+    sm.crop = detect_crop_region(VideoStreamCv2(path))
+    sm.add_detector(ContentDetector())
+    sm.detect_scenes(video=VideoStreamCv2(path))
+    assert [start.frame_num for start, _ in sm.get_scene_list()[1:]] == [50, 100]
+
+
+@pytest.mark.parametrize(("crop", "warns"), [((0, 20, 319, 159), False), ((0, 20, 320, 159), True)])
+def test_crop_boundary_warning(synthetic_video, caplog, crop, warns):
+    """A crop region which extends to the edge of the frame is inside the video boundary."""
+    sm = SceneManager()
+    sm.crop = crop
+    sm.add_detector(ContentDetector())
+    sm.detect_scenes(video=VideoStreamCv2(synthetic_video((320, 180))), end_time=10)
+    assert ("crop ends outside of video boundary" in caplog.text) == warns
+
+
 def test_crop_invalid():
     sm = SceneManager()
     sm.crop = None  # type: ignore[assignment]
@@ -73,6 +73,20 @@ def test_metrics():
     ]
 
 
+def test_max_frames():
+    """Only the metrics of the most recent `max_frames` frames are kept."""
+    stats = StatsManager(max_frames=3)
+    stats.register_metrics(["metric"])
+    for frame in range(10):
+        stats.set_metrics(frame, {"metric": frame})
+        # Updating an existing frame must not discard any others.
+        stats.set_metrics(frame, {"metric": frame})
+    assert [frame for frame in range(10) if stats.metrics_exist(frame, ["metric"])] == [7, 8, 9]
+    assert stats.get_metrics(9, ["metric"]) == [9]
+    with pytest.raises(ValueError):
+        StatsManager(max_frames=0)
+
+
 def test_detector_metrics(test_video_file):
     """Test passing StatsManager to a SceneManager and using it for storing the frame metrics
     from a ContentDetector.
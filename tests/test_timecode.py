@@ -26,7 +26,13 @@ from fractions import Fraction
 import pytest
 
 # Standard Library Imports
-from scenedetect.common import MAX_FPS_DELTA, FrameTimecode, Timecode, framerate_to_fraction
+from scenedetect.common import (
+    MAX_FPS_DELTA,
+    FrameTimecode,
+    Timecode,
+    _MinLength,
+    framerate_to_fraction,
+)
 
 
 def test_framerate():
@@ -575,3 +581,31 @@ def test_get_framerate():
     assert len(warning_info) == 1
     assert frame_rate == 30.0
     assert isinstance(frame_rate, float)
+
+
+@pytest.mark.parametrize("length", [0, 1, 15, 0.5, 0.6, "0.6s", "00:00:01.500", "12"])
+@pytest.mark.parametrize(
+    "fps,time_base",
+    [
+        (Fraction(24), Fraction(1, 24)),
+        (Fraction(30000, 1001), Fraction(1, 30000)),
+        (Fraction(60000, 1001), Fraction(1, 90000)),
+        (Fraction(25), Fraction(1, 1000)),
+    ],
+)
+def test_min_length_matches_arithmetic(length, fps, time_base):
+    """`_MinLength` must give the same result as `(end - start) >= length` for every PTS pair,
+    including right at the boundary, and for timecodes it has no fast path for."""
+    check = _MinLength(length)
+    step = round(1 / (fps * time_base))
+    for start_pts in (0, 7 * step, 1001):
+        start = FrameTimecode(Timecode(pts=start_pts, time_base=time_base), fps=fps)
+        for delta in range(-step, 3 * round(2 / time_base), max(1, step // 3)):
+            end = FrameTimecode(
+                Timecode(pts=max(0, start_pts + delta), time_base=time_base), fps=fps
+            )
+            assert check.met(end, start) == ((end - start) >= length)
+    for start_frame, end_frame in ((0, 14), (0, 15), (3, 40)):
+        start = FrameTimecode(start_frame, fps=fps)
+        end = FrameTimecode(end_frame, fps=fps)
+        assert check.met(end, start) == ((end - start) >= length)